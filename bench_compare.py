@@ -0,0 +1,225 @@
+"""
+Benchmark Regression Gate
+Time a reference commit and the working copy side by side and fail on significant regressions
+
+    python deckgen.py bench compare --baseline bench_baseline.json
+    python deckgen.py bench compare --against main --rounds 10
+    python deckgen.py bench compare --update --suite all --scale 10,100,1000
+
+A baseline is one bench_suite run record (the same shape as a history
+entry): its commit is the reference, its result names are the benchmarks
+to run, and an optional "thresholds" object overrides the defaults below.
+compare exports the reference commit with `git archive` and times both
+trees in the same invocation: every round starts a fresh worker per tree
+and samples each benchmark on both back to back, flipping which goes
+first, so drift between sessions or over the run lands on both sides
+alike. The stored timings are never compared against: the baseline only
+needs updating when the reference commit should move.
+
+Time regresses when the median slows by more than its threshold, by more
+than the absolute floor ("time_ms", which keeps sub-millisecond helpers
+from tripping on scheduler jitter), *and* a one-sided Mann-Whitney U test
+says the slowdown is not noise; benchmarks with fewer than MIN_SAMPLES
+rounds on either side (too few for the test ever to reach ALPHA) are
+judged on the thresholds alone. With dozens of benchmarks a per-test
+ALPHA would flag a few of them on every unchanged run, so the p-values are
+Holm-adjusted across the run; that needs about 8 rounds per side before
+any single benchmark can reach significance, hence COMPARE_ROUNDS. Peak
+RSS and output size are compared against their thresholds directly.
+"""
+import json
+import math
+import os
+import subprocess
+import tarfile
+import tempfile
+from collections import namedtuple
+from contextlib import contextmanager
+
+import bench_suite
+
+# time/memory/size: relative growth; time_ms: smallest median slowdown that counts, in ms
+THRESHOLDS = {"time": 0.10, "time_ms": 0.05, "memory": 0.10, "size": 0.02}
+ALPHA = 0.05
+COMPARE_ROUNDS = 8
+MIN_SAMPLES = 4  # 3 vs 3 can do no better than p = 1/20, which is never < ALPHA
+EXACT_LIMIT = 400  # largest len(a) * len(b) for the exact U distribution
+
+Comparison = namedtuple("Comparison", "name metric baseline current change p_value regressed")
+
+
+def _exact_counts(m, n):
+    """Number of orderings of m + n distinct values giving each U statistic (0..m*n)"""
+    # counts[j][u] for samples of size (i, j), built up one row of i at a time
+    counts = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        row = [[1]]
+        for j in range(1, n + 1):
+            # The largest value is from the first sample (adds j to U) or from the second
+            a, b = counts[j], row[j - 1]
+            merged = [0] * (i * j + 1)
+            for u, c in enumerate(a):
+                merged[u + j] += c
+            for u, c in enumerate(b):
+                merged[u] += c
+            row.append(merged)
+        counts = row
+    return counts[n]
+
+
+def mann_whitney_greater(current, baseline):
+    """One-sided Mann-Whitney U p-value for `current` tending to be larger than `baseline`"""
+    m, n = len(current), len(baseline)
+    u = sum(1.0 if c > b else 0.5 if c == b else 0.0 for c in current for b in baseline)
+    ties = len(set(current) | set(baseline)) < m + n
+    if not ties and m * n <= EXACT_LIMIT:
+        counts = _exact_counts(m, n)
+        return sum(counts[math.ceil(u):]) / math.comb(m + n, m)
+
+    # Normal approximation with tie and continuity corrections
+    pooled = sorted(current + baseline)
+    tie_sizes = [pooled.count(v) for v in set(pooled)]
+    total = m + n
+    variance = m * n / 12 * ((total + 1) - sum(t ** 3 - t for t in tie_sizes) / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def load_baseline(path):
+    """Read a baseline run record"""
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if "results" not in baseline:
+        raise ValueError(f"{path} is not a benchmark baseline (no 'results')")
+    return baseline
+
+
+def write_baseline(path, record, thresholds=None):
+    """Write a run record (plus any thresholds to keep) as the new baseline"""
+    if thresholds:
+        record = {**record, "thresholds": thresholds}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=1)
+    return path
+
+
+@contextmanager
+def reference_tree(commit):
+    """Temporary directory holding `commit`'s tracked files, exported with git archive"""
+    with tempfile.TemporaryDirectory(prefix="bench-ref-") as tree:
+        archive = os.path.join(tree, "ref.tar")
+        with open(archive, "wb") as f:
+            out = subprocess.run(["git", "archive", "--format=tar", commit], cwd=bench_suite.HERE,
+                                 stdout=f, stderr=subprocess.PIPE, text=True)
+        if out.returncode:
+            raise ValueError(f"cannot export reference commit {commit!r}: {out.stderr.strip()}")
+        with tarfile.open(archive) as tar:
+            tar.extractall(tree, filter="data")
+        os.remove(archive)
+        yield tree
+
+
+def run_ab(reference, suites, themes, sizes, scale_theme, rounds=COMPARE_ROUNDS, progress=None):
+    """Alternating samples of the reference tree and the working copy; returns (reference, current) results
+
+    Each round starts a fresh worker per tree, since one interpreter can run a benchmark consistently
+    faster or slower than the next, and takes one sample of every benchmark from each, alternating
+    which side goes first, so both sides of a comparison are measured within seconds of each other.
+    """
+    plan = (suites, themes, sizes, scale_theme)
+    samples = {}
+    for r in range(rounds):
+        if progress:
+            progress(f"round {r + 1}/{rounds}")
+        with bench_suite.Worker(reference, *plan) as old, bench_suite.Worker(bench_suite.HERE, *plan) as new:
+            names = [name for name in new.benchmarks if name in old.benchmarks]
+            for i, name in enumerate(names):
+                old_side, new_side = samples.setdefault(name, ([], []))
+                order = [(old, old_side), (new, new_side)]
+                for worker, side in (order if (r + i) % 2 == 0 else order[::-1]):
+                    side.append(worker.sample(name))
+    results = ([], [])
+    for name, pair in samples.items():
+        benchmark = bench_suite.Benchmark(name, None, False, new.benchmarks[name])
+        for side, measurements in zip(results, pair):
+            side.append(bench_suite.summarize(benchmark, measurements))
+    return results
+
+
+def baseline_plan(baseline):
+    """(suites, themes, scale sizes, scale theme) that reproduce the baseline's benchmarks"""
+    suites, themes, sizes, scale_theme = [], [], [], "classic"
+    for result in baseline["results"]:
+        suite, theme, case = result["name"].split("/", 2)
+        if suite not in suites:
+            suites.append(suite)
+        if suite == "scale":
+            scale_theme = theme
+            sizes.append(int(case))
+        elif suite == "macro" and case not in themes:
+            themes.append(case)
+        elif suite == "micro" and theme not in themes:
+            themes.append(theme)
+    return suites, themes, sizes, scale_theme
+
+
+def holm(p_values):
+    """Holm-Bonferroni adjusted p-values, in the given order (None stays None)"""
+    ranked = sorted((p, i) for i, p in enumerate(p_values) if p is not None)
+    adjusted = list(p_values)
+    running = 0.0
+    for rank, (p, i) in enumerate(ranked):
+        running = max(running, min(1.0, (len(ranked) - rank) * p))
+        adjusted[i] = running
+    return adjusted
+
+
+def compare_results(baseline_results, current_results, thresholds=None):
+    """Comparisons for every metric the baseline and current results share
+
+    Time p-values are Holm-adjusted over all the time comparisons, so ALPHA bounds the chance of
+    any false regression in the whole run rather than per benchmark.
+    """
+    limits = {**THRESHOLDS, **(thresholds or {})}
+    current = {r["name"]: r for r in current_results}
+    pairs = [(old, current[old["name"]]) for old in baseline_results if old["name"] in current]
+    p_values = holm([
+        mann_whitney_greater(new["samples_ms"], old["samples_ms"])
+        if min(len(old["samples_ms"]), len(new["samples_ms"])) >= MIN_SAMPLES else None
+        for old, new in pairs
+    ])
+    comparisons = []
+    for (old, new), p_value in zip(pairs, p_values):
+        change = new["median_ms"] / old["median_ms"] - 1
+        slower = change > limits["time"] and new["median_ms"] - old["median_ms"] > limits["time_ms"]
+        regressed = slower and (p_value is None or p_value < ALPHA)
+        comparisons.append(Comparison(old["name"], "time", old["median_ms"], new["median_ms"],
+                                      change, p_value, regressed))
+        for metric, key in (("memory", "peak_rss_kb"), ("size", "size_bytes")):
+            if old.get(key) and new.get(key):
+                change = new[key] / old[key] - 1
+                comparisons.append(Comparison(old["name"], metric, old[key], new[key],
+                                              change, None, change > limits[metric]))
+    return comparisons
+
+
+def missing_benchmarks(baseline_results, current_results):
+    """Baseline benchmark names the current run did not produce"""
+    names = {r["name"] for r in current_results}
+    return [r["name"] for r in baseline_results if r["name"] not in names]
+
+
+def format_comparisons(comparisons, regressions_only=False):
+    """Text table; regressions are marked with '!!'"""
+    units = {"time": "ms", "memory": "KB", "size": "B"}
+    lines = [f"{'benchmark':<48}{'metric':<8}{'baseline':>12}{'current':>12}{'change':>9}{'p':>8}"]
+    for c in comparisons:
+        if regressions_only and not c.regressed:
+            continue
+        p = f"{c.p_value:.3f}" if c.p_value is not None else "-"
+        lines.append(f"{c.name:<48}{c.metric:<8}{c.baseline:>10.1f}{units[c.metric]:>2}"
+                     f"{c.current:>10.1f}{units[c.metric]:>2}{c.change:>+9.1%}{p:>8}"
+                     + ("  !!" if c.regressed else ""))
+    return "\n".join(lines)
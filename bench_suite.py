@@ -0,0 +1,411 @@
+"""
+Benchmark Suite
+Macro, micro and scale benchmarks for the generators, recorded to a JSON history file
+
+    python deckgen.py bench --suite all
+    python deckgen.py bench --suite micro --repeat 20
+    python deckgen.py bench --suite scale --scale 10,100,1000 --history bench_history.json
+    python deckgen.py bench --suite shapes --repeat 3
+
+macro   full built-in deck per theme: cold (fresh interpreter, imports
+        included) and warm (in-process, after a warm-up render)
+micro   one call of each slide helper on a fresh blank slide
+scale   a generated deck of N content slides, built and saved in a fresh
+        interpreter so peak RSS belongs to that deck alone
+shapes  500 to 5,000 cards and labels on one slide, also with every card
+        re-layered; per-shape cost should stay flat
+
+Every result is a dict with a "name" ("macro/warm/creative",
+"micro/consulting/add_card", "scale/classic/1000", "shapes/consulting/5000"), per-repetition
+timings in "samples_ms", and "peak_rss_kb" / "size_bytes" where they
+apply. Each run appends one record to the history file.
+
+Each benchmark is a sample function plus its warm-up policy, so samples
+can also be taken one at a time: a Worker is a long-lived interpreter
+whose imports come from another checkout of the generators (TREE), which
+is how bench_compare alternates samples of a reference commit and the
+working copy. Helpers that checkout does not have yet are skipped.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from functools import partial
+from statistics import median
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TREE = HERE  # checkout whose generators are measured; child interpreters import from it
+SUITES = ("macro", "micro", "scale", "shapes")
+DEFAULT_SCALE = (10, 100, 1000, 10000)
+SHAPE_COUNTS = (500, 1000, 2000, 5000)
+
+LINES = [
+    "Device fragmentation & low-RAM behavior on entry-level Android",
+    "Cold start dominated by SDK initialisation on the main thread",
+    "Image pipeline decodes full-size assets for list thumbnails",
+    "Release builds ship without R8 full mode or baseline profiles",
+]
+ITEMS = [("Startup", LINES[:2]), ("Rendering", LINES[1:3]), ("Network", LINES[2:]), ("Build", LINES[:3])]
+PHASES = [("Setup", LINES[:3]), ("Profiling", LINES), ("RCA", LINES[1:]), ("Validation", LINES[:2]), ("Report", LINES)]
+
+# (theme, helper, call); slide helpers get a fresh blank slide, create_* helpers the Presentation
+MICRO = [
+    ("classic", "add_title_shape", lambda m, s: m.add_title_shape(s, "Executive Summary")),
+    ("classic", "add_body_text", lambda m, s: m.add_body_text(s, LINES)),
+    ("classic", "add_header_bar", lambda m, s: m.add_header_bar(s)),
+    ("classic", "add_footer_bar", lambda m, s: m.add_footer_bar(s)),
+    ("classic", "create_content_slide", lambda m, prs: m.create_content_slide(prs, "Scope", LINES)),
+    ("classic", "create_two_column_slide",
+     lambda m, prs: m.create_two_column_slide(prs, "Scope", "In", LINES[:2], "Out", LINES[2:])),
+    ("creative", "add_gradient_header", lambda m, s: m.add_gradient_header(s)),
+    ("creative", "add_decorative_footer", lambda m, s: m.add_decorative_footer(s)),
+    ("creative", "add_title_with_icon", lambda m, s: m.add_title_with_icon(s, "Executive Summary")),
+    ("creative", "add_content_box", lambda m, s: m.add_content_box(s, LINES, 0.5, 1.5, 9, 3)),
+    ("creative", "add_numbered_bullet", lambda m, s: m.add_numbered_bullet(s, 1, LINES[0], 0.5, 1.5)),
+    ("creative", "add_visual_divider", lambda m, s: m.add_visual_divider(s, 3.0)),
+    ("creative", "draw_info_box",
+     lambda m, s: m.draw_info_box(s, m.CREAM, m.PRIMARY_RED, "1", "Startup", LINES[:2])),
+    ("creative", "INFO_BOX.add",
+     lambda m, s: m.INFO_BOX.add(s, 0.5, 1.5, m.CREAM, m.PRIMARY_RED, number="1", title="Startup",
+                                 content=LINES[:2])),
+    ("creative", "draw_outcome_tile", lambda m, s: m.draw_outcome_tile(s, "📊", "Diagnostic Report", LINES[0])),
+    ("creative", "OUTCOME_TILE.add",
+     lambda m, s: m.OUTCOME_TILE.add(s, 0.5, 1.5, icon="📊", title="Diagnostic Report", desc=LINES[0])),
+    ("creative", "create_infographic_slide",
+     lambda m, prs: m.create_infographic_slide(prs, "Findings", ITEMS, "Four areas")),
+    ("creative", "create_timeline_slide", lambda m, prs: m.create_timeline_slide(prs, "Approach", PHASES)),
+    ("creative", "create_content_slide", lambda m, prs: m.create_content_slide(prs, "Scope", LINES)),
+    ("professional", "add_clean_header", lambda m, s: m.add_clean_header(s)),
+    ("professional", "add_clean_footer", lambda m, s: m.add_clean_footer(s)),
+    ("professional", "add_slide_title", lambda m, s: m.add_slide_title(s, "Executive Summary")),
+    ("professional", "add_body_bullets", lambda m, s: m.add_body_bullets(s, LINES)),
+    ("professional", "add_content_box", lambda m, s: m.add_content_box(s, LINES, 0.5, 1.5, 9, 3)),
+    ("professional", "add_numbered_item",
+     lambda m, s: m.add_numbered_item(s, 1, "Startup", LINES[0], 0.5, 1.5)),
+    ("professional", "draw_assumption", lambda m, s: m.draw_assumption(s, "1", "Client Access", LINES[0])),
+    ("professional", "ASSUMPTION.add",
+     lambda m, s: m.ASSUMPTION.add(s, 0.5, 1.5, number="1", title="Client Access", desc=LINES[0])),
+    ("professional", "create_professional_slide",
+     lambda m, prs: m.create_professional_slide(prs, "Scope", LINES, "What we cover")),
+    ("consulting", "add_consulting_header", lambda m, s: m.add_consulting_header(s)),
+    ("consulting", "add_consulting_footer", lambda m, s: m.add_consulting_footer(s, "3")),
+    ("consulting", "add_slide_title_consulting", lambda m, s: m.add_slide_title_consulting(s, "Executive Summary")),
+    ("consulting", "add_body_text_consulting", lambda m, s: m.add_body_text_consulting(s, LINES)),
+    ("consulting", "add_card", lambda m, s: m.add_card(s, 0.5, 1.5, 4, 2)),
+    ("consulting", "add_icon_circle", lambda m, s: m.add_icon_circle(s, 0.5, 1.5)),
+    ("consulting", "add_small_label", lambda m, s: m.add_small_label(s, "KEY FINDING", 0.5, 1.5)),
+    ("consulting", "draw_scope_card",
+     lambda m, s: m.draw_scope_card(s, m.BRIGHT_BLUE, "Analyze", LINES[0])),
+    ("consulting", "SCOPE_CARD.add",
+     lambda m, s: m.SCOPE_CARD.add(s, 0.5, 1.5, m.BRIGHT_BLUE, action="Analyze", desc=LINES[0])),
+    ("consulting", "create_consulting_slide",
+     lambda m, prs: m.create_consulting_slide(prs, "Scope", LINES, "What we cover", "3")),
+]
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB (None where it cannot be measured)"""
+    # Linux's ru_maxrss survives exec, so a child forked from a large parent reports
+    # the parent's peak; VmHWM belongs to this process image alone
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def scale_spec(slides):
+    """Spec with a cover and `slides - 1` content slides"""
+    body = [{"layout": "content", "title": f"Finding {i}", "bullets": LINES} for i in range(1, slides)]
+    return {"slides": [{"layout": "cover", "title": "Portfolio Review", "subtitle": "Scale benchmark",
+                        "company": "XYZ Company", "date": "January 2026"}] + body}
+
+
+Benchmark = namedtuple("Benchmark", "name sample warm_up extra")  # sample() -> {"seconds": ..., ...}
+
+
+def _result(name, samples, **extra):
+    return {"name": name, "samples_ms": [round(s * 1000, 3) for s in samples],
+            "min_ms": round(min(samples) * 1000, 3), "median_ms": round(median(samples) * 1000, 3), **extra}
+
+
+def summarize(benchmark, measurements):
+    """Result for a benchmark from its samples' measurements"""
+    seconds = [m["seconds"] for m in measurements]
+    extra = {}
+    if any(m.get("peak_rss_kb") for m in measurements):
+        extra["peak_rss_kb"] = max(m.get("peak_rss_kb") or 0 for m in measurements)
+    if measurements[0].get("size_bytes"):
+        extra["size_bytes"] = measurements[0]["size_bytes"]
+    extra.update(benchmark.extra)
+    if "shapes" in extra:
+        extra["us_per_shape"] = round(median(seconds) / extra["shapes"] * 1e6, 1)
+    return _result(benchmark.name, seconds, **extra)
+
+
+def _has(module, helper):
+    """Whether `module` has the (possibly dotted) helper, such as SCOPE_CARD.add"""
+    target = module
+    for part in helper.split("."):
+        target = getattr(target, part, None)
+    return target is not None
+
+
+def _harness_code(tree, call):
+    """python -c source calling `bench.<call>` on this harness, with `tree` supplying the generators"""
+    # Loaded by path, so the harness is this file whichever tree supplies deck_spec and the themes
+    return (
+        "import importlib.util\n"
+        f"spec = importlib.util.spec_from_file_location('bench_harness', {os.path.abspath(__file__)!r})\n"
+        "bench = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(bench)\n"
+        f"bench.TREE = {tree!r}\n"
+        f"bench.{call}\n"
+    )
+
+
+def _child(kind, theme, slides=0):
+    """Entry point of the fresh interpreters used by cold macro and scale runs; prints one JSON line"""
+    started = time.perf_counter()
+    from deck_spec import deck_bytes
+
+    data = deck_bytes(scale_spec(slides) if kind == "scale" else None, theme, deterministic=True)
+    print(json.dumps({"seconds": time.perf_counter() - started, "size_bytes": len(data),
+                      "peak_rss_kb": peak_rss_kb()}))
+
+
+def run_child(kind, theme, slides=0):
+    """Run _child in a fresh interpreter importing from TREE and return its measurements"""
+    code = _harness_code(TREE, f"_child({kind!r}, {theme!r}, {slides})")
+    out = subprocess.run([sys.executable, "-c", code], cwd=TREE, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def macro_benchmarks(themes):
+    """Cold and warm full-deck renders per theme"""
+    from deck_spec import deck_bytes
+
+    def warm(theme):
+        started = time.perf_counter()
+        data = deck_bytes(None, theme, deterministic=True)
+        return {"seconds": time.perf_counter() - started, "size_bytes": len(data)}
+
+    benchmarks = []
+    for theme in themes:
+        # Warm-ups: OS file cache and bytecode for cold runs, imports and template cache for warm ones
+        benchmarks.append(Benchmark(f"macro/cold/{theme}", partial(run_child, "cold", theme), True, {}))
+        benchmarks.append(Benchmark(f"macro/warm/{theme}", partial(warm, theme), True, {}))
+    return benchmarks
+
+
+def micro_benchmarks(themes, number=20):
+    """Each helper `number` times per sample, each call on a fresh slide; samples are per call"""
+    import shape_ids
+    import slide_append
+    from deck_spec import load_theme, new_presentation
+
+    def sample(module, call, takes_slide):
+        prs = new_presentation()
+        layout = prs.slide_layouts[6]
+        elapsed = 0.0
+        # Allocate IDs the way the generators do while they build
+        with shape_ids.tracking(), slide_append.tracking():
+            for _ in range(number):
+                target = prs.slides.add_slide(layout) if takes_slide else prs
+                started = time.perf_counter()
+                call(module, target)
+                elapsed += time.perf_counter() - started
+        return {"seconds": elapsed / number}
+
+    benchmarks = []
+    for theme, helper, call in MICRO:
+        if theme not in themes:
+            continue
+        module = load_theme(theme)
+        if _has(module, helper):
+            takes_slide = not helper.startswith("create_")
+            benchmarks.append(Benchmark(f"micro/{theme}/{helper}", partial(sample, module, call, takes_slide),
+                                        True, {}))
+    return benchmarks
+
+
+def scale_benchmarks(theme, sizes):
+    """Build and save decks of each size in fresh interpreters; only the smallest is warmed up"""
+    return [Benchmark(f"scale/{theme}/{slides}", partial(run_child, "scale", theme, slides),
+                      slides == min(sizes), {"slides": slides}) for slides in sizes]
+
+
+def shapes_benchmarks(counts=SHAPE_COUNTS):
+    """Alternate consulting add_card / add_small_label until one slide holds `count` shapes
+
+    The "layered" variant also puts every card behind the label drawn after it, through z_order.Layers.
+    """
+    import shape_ids
+    from deck_spec import load_theme, new_presentation
+    from z_order import Layers
+
+    module = load_theme("consulting")
+
+    def sample(count, layered):
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        started = time.perf_counter()
+        with shape_ids.tracking():
+            layers = Layers(slide) if layered else None
+            for _ in range(count // 2):
+                card = module.add_card(slide, 0.5, 1.5, 2, 1)
+                label = module.add_small_label(slide, "KEY FINDING", 0.6, 1.6)
+                if layers:
+                    layers.behind(card, label)
+            if layers:
+                layers.apply()
+        return {"seconds": time.perf_counter() - started}
+
+    return [Benchmark(f"shapes/{'consulting-layered' if layered else 'consulting'}/{count}",
+                      partial(sample, count, layered), False, {"shapes": count})
+            for layered in (False, True) for count in counts]
+
+
+def suite_benchmarks(suite, themes, scale_sizes=DEFAULT_SCALE, scale_theme="classic"):
+    """The benchmarks of one suite, in run order"""
+    if suite == "macro":
+        return macro_benchmarks(themes)
+    if suite == "micro":
+        return micro_benchmarks(themes)
+    if suite == "scale":
+        return scale_benchmarks(scale_theme, scale_sizes)
+    return shapes_benchmarks()
+
+
+def run_benchmark(benchmark, repeat):
+    """Warm up if the benchmark asks for it, then time `repeat` samples"""
+    if benchmark.warm_up:
+        benchmark.sample()
+    return summarize(benchmark, [benchmark.sample() for _ in range(repeat)])
+
+
+def run_suite(suites, themes, repeat=5, scale_sizes=DEFAULT_SCALE, scale_theme="classic",
+              scale_repeat=1, progress=None):
+    """Run the selected suites and return their results in order"""
+    results = []
+    for suite in SUITES:
+        if suite in suites:
+            if progress:
+                progress(suite)
+            results += [run_benchmark(b, scale_repeat if suite == "scale" else repeat)
+                        for b in suite_benchmarks(suite, themes, scale_sizes, scale_theme)]
+    return results
+
+
+def _serve(suites, themes, scale_sizes, scale_theme):
+    """Entry point of a Worker: announce the benchmarks, then time one sample per name read from stdin
+
+    The first request for a benchmark that wants a warm-up runs the warm-up first.
+    """
+    out, sys.stdout = sys.stdout, sys.stderr  # keep anything the generators print out of the replies
+    benchmarks = {b.name: b for suite in SUITES if suite in suites
+                  for b in suite_benchmarks(suite, themes, scale_sizes, scale_theme)}
+    out.write(json.dumps({name: b.extra for name, b in benchmarks.items()}) + "\n")
+    out.flush()
+    warmed = set()
+    for line in sys.stdin:
+        benchmark = benchmarks[line.strip()]
+        if benchmark.warm_up and benchmark.name not in warmed:
+            benchmark.sample()
+            warmed.add(benchmark.name)
+        out.write(json.dumps(benchmark.sample()) + "\n")
+        out.flush()
+
+
+class Worker:
+    """A long-lived interpreter timing single benchmark samples against the generators in `tree`
+
+    `benchmarks` maps the names of the benchmarks that tree can run to their extra result fields;
+    sample(name) times one more sample of one of them, warming it up first if it is new to the worker.
+    """
+
+    def __init__(self, tree, suites, themes, scale_sizes=DEFAULT_SCALE, scale_theme="classic"):
+        self.tree = tree
+        call = f"_serve({list(suites)!r}, {list(themes)!r}, {list(scale_sizes)!r}, {scale_theme!r})"
+        self._process = subprocess.Popen([sys.executable, "-c", _harness_code(tree, call)], cwd=tree,
+                                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        self.benchmarks = self._reply()
+
+    def _reply(self):
+        line = self._process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"benchmark worker for {self.tree} exited (exit code {self._process.wait()})")
+        return json.loads(line)
+
+    def sample(self, name):
+        self._process.stdin.write(name + "\n")
+        self._process.stdin.flush()
+        return self._reply()
+
+    def close(self):
+        self._process.stdin.close()
+        self._process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def git_commit():
+    """Short hash of the checked-out commit, or None outside a git checkout"""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_record(results):
+    """History entry for one suite run"""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def load_history(path):
+    """Runs recorded in a history file, oldest first (empty if the file does not exist)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["runs"]
+
+
+def append_history(path, record):
+    """Append one run record to the history file"""
+    runs = load_history(path) + [record]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"runs": runs}, f, indent=1)
+    return path
+
+
+def format_results(results):
+    """Text table of the results"""
+    lines = [f"{'benchmark':<48}{'min ms':>10}{'median ms':>11}{'peak MB':>9}{'size KB':>10}"]
+    for r in results:
+        rss = f"{r['peak_rss_kb'] / 1024:.1f}" if r.get("peak_rss_kb") else ""
+        size = f"{r['size_bytes'] / 1024:.1f}" if r.get("size_bytes") else ""
+        lines.append(f"{r['name']:<48}{r['min_ms']:>10.2f}{r['median_ms']:>11.2f}{rss:>9}{size:>10}")
+    return "\n".join(lines)
@@ -0,0 +1,230 @@
+"""
+Slide Components
+Autoshapes that carry their own text, and composite components stamped out by cloning
+
+    add_text_shape(slide, MSO_SHAPE.OVAL, left, top, 0.4, 0.4, "3", "creative.bullet_number",
+                   fill=PRIMARY_RED)
+    add_text_shape(slide, MSO_SHAPE.RECTANGLE, 0.6, y, 3.3, 0.55, role, "consulting.cell",
+                   fill=OFF_WHITE, line=MED_GRAY, line_width=0.25, insets=(0.3, 0, 0.1, 0))
+
+    SCOPE_CARD = Component("Scope Card", draw_scope_card, texts=("action", "desc"))
+    SCOPE_CARD.add(slide, x, y, BRIGHT_BLUE, action="Analyze", desc="...")
+
+A badge, table cell or week marker drawn as a filled shape plus a
+separate textbox costs two shapes, two sets of geometry and a second
+text body. Here the text frame of the shape itself holds the text, placed
+with insets and vertical anchoring, so each element is one shape.
+Geometry and insets are in inches, like the theme helpers; the text
+is set through text_builder's named styles.
+
+A Component is a card-like group drawn with those same primitives, but
+only once per variant (the positional arguments after the position, e.g.
+its colours): the draw function runs on a throwaway scratch slide with
+marker text in every slot, and the result is kept as a p:grpSp template. Each
+instance is a deep copy of the template with its offset, shape IDs and
+slot text written through node paths found when the template was built,
+so stamping a card costs a copy and a few attribute writes instead of
+dozens of python-pptx property edits.
+"""
+import threading
+from copy import deepcopy
+
+from pptx import Presentation
+from pptx.enum.text import MSO_ANCHOR
+from pptx.oxml.ns import qn
+from pptx.shapes.group import GroupShape
+from pptx.util import Inches, Pt
+
+import shape_ids
+from text_builder import set_paragraphs
+from z_order import new_group
+
+_INSET_ATTRS = ("lIns", "tIns", "rIns", "bIns")
+_A_BR = qn("a:br")
+_A_R = qn("a:r")
+_C_NV_PR = qn("p:cNvPr")
+_OFF_PATH = (1, 0, 0)  # grpSpPr/xfrm/off within a new_group() element
+_CH_OFF_PATH = (1, 0, 2)
+
+_scratch = threading.local()  # .prs: a private presentation per thread, so concurrent builds never share slides
+
+
+def add_text_shape(slide, autoshape_type, left, top, width, height, text, style=None,
+                   fill=None, line=None, line_width=None, insets=(0, 0, 0, 0),
+                   anchor=MSO_ANCHOR.MIDDLE, wrap=True, **overrides):
+    """Autoshape with a solid fill (or none), optional outline and `text` (a line or list of lines) inside it
+
+    `insets` are (left, top, right, bottom) in inches; `line_width` is in points.
+    """
+    shape = slide.shapes.add_shape(autoshape_type, Inches(left), Inches(top), Inches(width), Inches(height))
+    if fill is not None:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = fill
+    else:
+        shape.fill.background()
+    if line is not None:
+        shape.line.color.rgb = line
+        if line_width is not None:
+            shape.line.width = Pt(line_width)
+    else:
+        shape.line.fill.background()
+
+    # Set the bodyPr attributes directly; the text frame setters re-find the element for each one
+    tf = shape.text_frame
+    body_pr = tf._bodyPr
+    for attr, inches in zip(_INSET_ATTRS, insets):
+        body_pr.set(attr, str(Inches(inches)))
+    body_pr.set("anchor", anchor.xml_value)
+    body_pr.set("wrap", "square" if wrap else "none")
+    set_paragraphs(tf, [text] if isinstance(text, str) else text, style, **overrides)
+    return shape
+
+
+def _scratch_presentation():
+    """This thread's private presentation for drawing templates"""
+    prs = getattr(_scratch, "prs", None)
+    if prs is None:
+        prs = _scratch.prs = Presentation()
+    return prs
+
+
+def _scratch_slide():
+    """A fresh slide in this thread's scratch presentation"""
+    prs = _scratch_presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _drop_scratch_slide(slide):
+    """Remove `slide` from the scratch presentation, so it holds no finished drawings"""
+    prs = _scratch_presentation()
+    sldIdLst = prs.slides._sldIdLst
+    for sld_id in sldIdLst:
+        if prs.part.related_part(sld_id.rId) is slide.part:
+            sldIdLst.remove(sld_id)
+            prs.part.drop_rel(sld_id.rId)
+            return
+
+
+def _path(root, node):
+    """Child indices leading from `root` down to `node`"""
+    path = []
+    while node is not root:
+        parent = node.getparent()
+        path.append(parent.index(node))
+        node = parent
+    return tuple(reversed(path))
+
+
+def _follow(node, path):
+    for i in path:
+        node = node[i]
+    return node
+
+
+def _fill_paragraph(p, line):
+    """Put `line` into a cloned one-run paragraph; newlines become line breaks"""
+    run = p.find(_A_R)
+    parts = line.replace("\v", "\n").split("\n")
+    if parts == [""]:
+        p.remove(run)
+        return p
+    run[-1].text = parts[0]
+    prev = run
+    for part in parts[1:]:
+        br = p.makeelement(_A_BR)
+        prev.addnext(br)
+        prev = br
+        if part:
+            extra = deepcopy(run)
+            extra[-1].text = part
+            prev.addnext(extra)
+            prev = extra
+    return p
+
+
+class _Template:
+    """One drawn variant of a component: the group element and the node paths into it"""
+
+    def __init__(self, group, origin, id_paths, slots):
+        self.group = group
+        self.origin = origin  # the group's child offset (EMU): where the drawing starts
+        self.id_paths = id_paths
+        self.slots = slots  # slot name -> (path to its first a:p, pristine copy of that a:p)
+
+
+class Component:
+    """Composite of shapes drawn once per variant by `draw` and stamped onto slides by cloning
+
+    `draw(slide, *variant, **slots)` draws the component with its top-left at (0, 0) using the
+    usual primitives, passing each slot value (a marker string, or a list of markers for
+    `lists` slots) to set_text/set_paragraphs or add_text_shape unchanged.
+    """
+
+    def __init__(self, name, draw, texts=(), lists=()):
+        self.name = name
+        self.draw = draw
+        self.texts = tuple(texts)
+        self.lists = tuple(lists)
+        self._templates = {}
+
+    def _build(self, variant):
+        slide = _scratch_slide()
+        try:
+            spTree = slide.shapes._spTree
+            first = len(spTree)
+            markers = {name: f"__{name}__" for name in self.texts + self.lists}
+            # Two lines, so list slots get the shared list style a multi-line frame would
+            slots = {name: [marker, marker] if name in self.lists else marker for name, marker in markers.items()}
+            self.draw(slide, *variant, **slots)
+
+            # Moving the drawn shapes into the detached group leaves the slide empty; it is dropped below
+            children = list(spTree)[first:]
+            group = new_group(children, self.name)
+            group.extend(children)
+        finally:
+            _drop_scratch_slide(slide)
+
+        found = {}
+        for t in group.iter(qn("a:t")):
+            for name, marker in markers.items():
+                if t.text == marker and name not in found:
+                    found[name] = t.getparent().getparent()
+        missing = set(markers) - set(found)
+        if missing:
+            raise ValueError(f"component '{self.name}' did not draw slots {sorted(missing)}")
+        for name in self.lists:
+            found[name].getparent().remove(found[name].getnext())  # the second marker line
+        slots = {name: (_path(group, p), deepcopy(p)) for name, p in found.items()}
+        id_paths = [_path(group, c) for c in group.iter(_C_NV_PR)]
+        ch_off = _follow(group, _CH_OFF_PATH)
+        return _Template(group, (int(ch_off.get("x")), int(ch_off.get("y"))), id_paths, slots)
+
+    def add(self, slide, left, top, *variant, **texts):
+        """Stamp an instance with its top-left at (left, top) inches; returns the GroupShape"""
+        template = self._templates.get(variant)
+        if template is None:
+            # Threads racing on a new variant each build one; every caller then uses the first stored
+            template = self._templates.setdefault(variant, self._build(variant))
+
+        group = deepcopy(template.group)
+        off = _follow(group, _OFF_PATH)
+        off.set("x", str(Inches(left) + template.origin[0]))
+        off.set("y", str(Inches(top) + template.origin[1]))
+
+        spTree = slide.shapes._spTree
+        next_id = shape_ids.reserve_shape_ids(spTree, len(template.id_paths))
+        for i, path in enumerate(template.id_paths):
+            _follow(group, path).set("id", str(next_id + i))
+
+        for name, (path, pristine) in template.slots.items():
+            value = texts.get(name, "")
+            lines = [value] if isinstance(value, str) else list(value) or [""]
+            p = _follow(group, path)
+            _fill_paragraph(p, lines[0])
+            for line in lines[1:]:
+                nxt = _fill_paragraph(deepcopy(pristine), line)
+                p.addnext(nxt)
+                p = nxt
+
+        spTree.insert_element_before(group, "p:extLst")
+        return GroupShape(group, slide.shapes)
@@ -9,6 +9,13 @@ from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 from datetime import datetime
 
+from components import Component, add_text_shape
+from deck_output import write_presentation, presentation_bytes, save_presentation
+import shape_ids
+import slide_append
+from text_builder import define_style, set_paragraphs, set_text
+
+
 # Vibrant Color Palette
 PRIMARY_RED = RGBColor(220, 38, 38)
 DEEP_RED = RGBColor(153, 27, 27)
@@ -23,6 +30,58 @@ DARK_GRAY = RGBColor(55, 65, 81)
 ORANGE = RGBColor(249, 115, 22)
 CORAL = RGBColor(251, 146, 60)
 
+# Text styles
+define_style("creative.title", size=32, bold=True, color=WHITE)
+define_style("creative.slide_title", size=30, bold=True, color=WHITE)
+define_style("creative.slide_subtitle", size=14, bold=False, color=CREAM)
+define_style("creative.intro", size=14, italic=True, color=DARK_GRAY)
+define_style("creative.body", size=14, color=BLACK, space_after=6)
+define_style("creative.bullet_number", size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.bullet_text", size=12, color=BLACK)
+define_style("creative.badge", size=12, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.item_title", size=13, bold=True, color=DEEP_RED)
+define_style("creative.item_text", size=10, color=DARK_GRAY, space_after=4)
+define_style("creative.tile_icon", size=28)
+define_style("creative.tile_title", size=10, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.tile_text", size=8, color=DARK_GRAY, align=PP_ALIGN.CENTER)
+define_style("creative.panel_header", size=16, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.metric", size=14, bold=True, color=RGBColor(22, 101, 52), align=PP_ALIGN.CENTER)
+define_style("creative.desc", size=10, color=DARK_GRAY)
+define_style("creative.hub", size=11, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.node", size=10, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.note", size=11, color=DARK_GRAY, align=PP_ALIGN.CENTER)
+define_style("creative.avatar", size=36, align=PP_ALIGN.CENTER)
+define_style("creative.resp", size=10, color=DARK_GRAY, align=PP_ALIGN.CENTER)
+define_style("creative.total", size=13, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.gantt_week", size=12, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.pill", size=12, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.closing", size=16, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.week", size=11, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.phase_name", size=9, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.phase_item", size=8, color=DARK_GRAY, space_after=2, bullet="•")
+define_style("creative.bullet", size=10, color=DARK_GRAY, bullet="•")
+define_style("creative.cover_title", size=52, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.cover_subtitle", size=24, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.cover_company", size=28, color=BRIGHT_YELLOW, align=PP_ALIGN.CENTER)
+define_style("creative.cover_date", size=20, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.heading", size=14, bold=True, color=DEEP_RED)
+define_style("creative.text", size=11, color=DARK_GRAY)
+define_style("creative.role", size=12, bold=True, color=DEEP_RED)
+define_style("creative.section", size=13, bold=True, color=PRIMARY_RED)
+define_style("creative.list_item", size=12, color=DARK_GRAY)
+define_style("creative.callout", size=14, bold=True, color=PRIMARY_RED)
+define_style("creative.icon", size=24)
+define_style("creative.label", size=11, bold=True, color=DEEP_RED)
+define_style("creative.unit", size=9, color=DARK_GRAY)
+define_style("creative.current", size=10, color=RGBColor(239, 68, 68))
+define_style("creative.benefit", size=9, italic=True, color=DARK_GRAY)
+define_style("creative.disclaimer", size=10, italic=True, color=DARK_GRAY, align=PP_ALIGN.CENTER)
+define_style("creative.role_title", size=13, bold=True, color=DEEP_RED, align=PP_ALIGN.CENTER)
+define_style("creative.role_subtitle", size=10, italic=True, align=PP_ALIGN.CENTER)
+define_style("creative.milestone", size=8, color=DARK_GRAY, align=PP_ALIGN.CENTER)
+define_style("creative.closing_title", size=38, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+define_style("creative.closing_subtitle", size=16, color=CREAM, align=PP_ALIGN.CENTER)
+
 def add_gradient_header(slide, height=1.2):
     """Add gradient-style header with accent"""
     # Main header bar
@@ -70,11 +129,7 @@ def add_title_with_icon(slide, title, icon_shape=MSO_SHAPE.OVAL, top=0.25):
     title_box = slide.shapes.add_textbox(Inches(1.2), Inches(top), Inches(8.3), Inches(0.7))
     tf = title_box.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(32)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    set_text(tf, title, "creative.title")
     return title_box
 
 def add_content_box(slide, content_lines, left, top, width, height, 
@@ -95,46 +150,27 @@ def add_content_box(slide, content_lines, left, top, width, height,
     tf = tb.text_frame
     tf.word_wrap = True
     
-    for i, line in enumerate(content_lines):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = line
-        p.font.size = Pt(font_size)
-        p.font.color.rgb = BLACK
-        p.space_after = Pt(6)
+    set_paragraphs(tf, content_lines, "creative.body", size=font_size)
 
 def add_numbered_bullet(slide, number, text, left, top, width=8):
     """Add numbered bullet with circle"""
     # Number circle
-    circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, 
-                                     Inches(left), Inches(top), 
-                                     Inches(0.4), Inches(0.4))
-    circle.fill.solid()
-    circle.fill.fore_color.rgb = PRIMARY_RED
-    circle.line.fill.background()
-    
-    # Number
-    num_box = slide.shapes.add_textbox(Inches(left), Inches(top + 0.05), 
-                                        Inches(0.4), Inches(0.35))
-    tf = num_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = str(number)
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
+    add_text_shape(slide, MSO_SHAPE.OVAL, left, top, 0.4, 0.4, str(number), "creative.bullet_number",
+                   fill=PRIMARY_RED, wrap=False)
     
     # Text
     text_box = slide.shapes.add_textbox(Inches(left + 0.5), Inches(top), 
                                          Inches(width - 0.5), Inches(0.5))
     tf = text_box.text_frame
     tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(12)
-    p.font.color.rgb = BLACK
+    set_text(tf, text, "creative.bullet_text")
+
+def add_bullet_list(slide, items, left, top, width, pitch, font_size=10):
+    """Bulleted list in one textbox, one item every `pitch` inches"""
+    box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(pitch * len(items)))
+    set_paragraphs(box.text_frame, items, "creative.bullet", size=font_size,
+                   space_after=pitch * 72 - font_size * 1.2)
+    return box
 
 def add_visual_divider(slide, top, left=0.5, width=9):
     """Add decorative divider line"""
@@ -145,6 +181,58 @@ def add_visual_divider(slide, top, left=0.5, width=9):
     line.fill.fore_color.rgb = BRIGHT_YELLOW
     line.line.fill.background()
 
+def draw_info_box(slide, fill, accent, number, title, content):
+    """Infographic item: tinted card with a number badge, title and content lines"""
+    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, 0, 0, Inches(4.3), Inches(2.1))
+    box.fill.solid()
+    box.fill.fore_color.rgb = fill
+    box.line.color.rgb = accent
+    box.line.width = Pt(2)
+
+    add_text_shape(slide, MSO_SHAPE.OVAL, 0.1, 0.1, 0.35, 0.35, number, "creative.badge",
+                   fill=accent, wrap=False)
+
+    title_box = slide.shapes.add_textbox(Inches(0.55), Inches(0.15), Inches(3.6), Inches(0.4))
+    set_text(title_box.text_frame, title, "creative.item_title")
+
+    # Content starts one 18pt line down, where it has always been drawn
+    content_box = slide.shapes.add_textbox(Inches(0.2), Inches(0.9), Inches(3.9), Inches(1.1))
+    tf = content_box.text_frame
+    tf.word_wrap = True
+    set_paragraphs(tf, content, "creative.item_text")
+
+INFO_BOX = Component("Info Box", draw_info_box, texts=("number", "title"), lists=("content",))
+
+def draw_outcome_tile(slide, icon, title, desc):
+    """Deliverable tile: white card with an offset shadow, icon, title and description"""
+    # Shadow effect, drawn first so the card lands on top of it
+    shadow = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.05), Inches(0.05),
+                                    Inches(1.5), Inches(2.3))
+    shadow.fill.solid()
+    shadow.fill.fore_color.rgb = RGBColor(0, 0, 0)
+    shadow.line.fill.background()
+
+    card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, 0, 0, Inches(1.5), Inches(2.3))
+    card.fill.solid()
+    card.fill.fore_color.rgb = WHITE
+    card.line.color.rgb = GOLD
+    card.line.width = Pt(2)
+
+    icon_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(0.5), Inches(0.5))
+    set_text(icon_box.text_frame, icon, "creative.tile_icon")
+
+    title_box = slide.shapes.add_textbox(Inches(0.1), Inches(0.75), Inches(1.3), Inches(0.7))
+    tf = title_box.text_frame
+    tf.word_wrap = True
+    set_text(tf, title, "creative.tile_title")
+
+    desc_box = slide.shapes.add_textbox(Inches(0.1), Inches(1.4), Inches(1.3), Inches(0.8))
+    tf = desc_box.text_frame
+    tf.word_wrap = True
+    set_text(tf, desc, "creative.tile_text")
+
+OUTCOME_TILE = Component("Outcome Tile", draw_outcome_tile, texts=("icon", "title", "desc"))
+
 def create_infographic_slide(prs, title, items, subtitle=""):
     """Create slide with visual infographic layout"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -153,18 +241,10 @@ def create_infographic_slide(prs, title, items, subtitle=""):
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.6), Inches(0.3), Inches(8.8), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(30)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    
+    lines = [title]
     if subtitle:
-        p = tf.add_paragraph()
-        p.text = subtitle
-        p.font.size = Pt(14)
-        p.font.color.rgb = CREAM
+        lines.append((subtitle, "creative.slide_subtitle"))
+    set_paragraphs(title_box.text_frame, lines, "creative.slide_title")
     
     # Create visual boxes for items
     y_pos = 1.5
@@ -176,57 +256,8 @@ def create_infographic_slide(prs, title, items, subtitle=""):
         if i > 0 and i % 2 == 0:
             y_pos += 2.3
         
-        # Box
-        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                      Inches(x), Inches(y_pos),
-                                      Inches(4.3), Inches(2.1))
-        box.fill.solid()
-        box.fill.fore_color.rgb = colors[i % len(colors)]
-        box.line.color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
-        box.line.width = Pt(2)
-        
-        # Number badge
-        badge = slide.shapes.add_shape(MSO_SHAPE.OVAL,
-                                        Inches(x + 0.1), Inches(y_pos + 0.1),
-                                        Inches(0.35), Inches(0.35))
-        badge.fill.solid()
-        badge.fill.fore_color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
-        badge.line.fill.background()
-        
-        # Badge number
-        badge_text = slide.shapes.add_textbox(Inches(x + 0.1), Inches(y_pos + 0.13),
-                                               Inches(0.35), Inches(0.3))
-        tf = badge_text.text_frame
-        p = tf.paragraphs[0]
-        p.text = str(i + 1)
-        p.font.size = Pt(12)
-        p.font.bold = True
-        p.font.color.rgb = WHITE
-        p.alignment = PP_ALIGN.CENTER
-        
-        # Item title
-        item_title_box = slide.shapes.add_textbox(Inches(x + 0.55), Inches(y_pos + 0.15),
-                                                   Inches(3.6), Inches(0.4))
-        tf = item_title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = item_title
-        p.font.size = Pt(13)
-        p.font.bold = True
-        p.font.color.rgb = DEEP_RED
-        
-        # Item content
-        content_box = slide.shapes.add_textbox(Inches(x + 0.2), Inches(y_pos + 0.6),
-                                                Inches(3.9), Inches(1.4))
-        tf = content_box.text_frame
-        tf.word_wrap = True
-        for line in item_content:
-            p = tf.add_paragraph() if tf.paragraphs else tf.paragraphs[0]
-            if len(tf.paragraphs) > 1 or not p.text:
-                p = tf.add_paragraph() if p.text else p
-            p.text = line
-            p.font.size = Pt(10)
-            p.font.color.rgb = DARK_GRAY
-            p.space_after = Pt(4)
+        INFO_BOX.add(slide, x, y_pos, colors[i % len(colors)], PRIMARY_RED if i % 2 == 0 else ORANGE,
+                     number=str(i + 1), title=item_title, content=item_content)
 
 def create_timeline_slide(prs, title, phases):
     """Create visual timeline slide"""
@@ -236,12 +267,7 @@ def create_timeline_slide(prs, title, phases):
     
     # Title
     title_box = slide.shapes.add_textbox(Inches(0.6), Inches(0.3), Inches(8.8), Inches(0.8))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(30)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
+    set_text(title_box.text_frame, title, "creative.slide_title")
     
     # Timeline line
     timeline = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
@@ -268,1173 +294,766 @@ def create_timeline_slide(prs, title, phases):
         dot.line.width = Pt(2)
         
         # Week number
-        week_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                           Inches(x), Inches(2.5),
-                                           Inches(1.3), Inches(0.5))
-        week_box.fill.solid()
-        week_box.fill.fore_color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
-        week_box.line.fill.background()
-        
-        week_text = slide.shapes.add_textbox(Inches(x), Inches(2.58),
-                                              Inches(1.3), Inches(0.4))
-        tf = week_text.text_frame
-        p = tf.paragraphs[0]
-        p.text = f"W{i}"
-        p.font.size = Pt(11)
-        p.font.bold = True
-        p.font.color.rgb = WHITE
-        p.alignment = PP_ALIGN.CENTER
+        add_text_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x, 2.5, 1.3, 0.5, f"W{i}", "creative.week",
+                       fill=PRIMARY_RED if i % 2 == 0 else ORANGE, insets=(0.1, 0, 0.1, 0))
         
         # Phase name
         name_box = slide.shapes.add_textbox(Inches(x - 0.1), Inches(3.15),
                                              Inches(1.5), Inches(0.6))
         tf = name_box.text_frame
         tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = phase_name
-        p.font.size = Pt(9)
-        p.font.bold = True
-        p.font.color.rgb = DEEP_RED
-        p.alignment = PP_ALIGN.CENTER
-        
-        # Content box
-        content_box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                              Inches(x - 0.1), Inches(3.8),
-                                              Inches(1.5), Inches(2.5))
-        content_box.fill.solid()
-        content_box.fill.fore_color.rgb = CREAM
-        content_box.line.color.rgb = GOLD
-        content_box.line.width = Pt(1.5)
+        set_text(tf, phase_name, "creative.phase_name")
         
-        # Content items
-        content_text = slide.shapes.add_textbox(Inches(x - 0.05), Inches(3.9),
-                                                 Inches(1.4), Inches(2.3))
-        tf = content_text.text_frame
-        tf.word_wrap = True
-        for item in phase_items:
-            p = tf.add_paragraph() if tf.paragraphs else tf.paragraphs[0]
-            if len(tf.paragraphs) > 1 or not p.text:
-                p = tf.add_paragraph() if p.text else p
-            p.text = "• " + item
-            p.font.size = Pt(8)
-            p.font.color.rgb = DARK_GRAY
-            p.space_after = Pt(2)
-
-# Create presentation
-prs = Presentation()
-prs.slide_width = Inches(10)
-prs.slide_height = Inches(7.5)
-
-# ============ SLIDE 1 — CREATIVE COVER PAGE ============
-slide1 = prs.slides.add_slide(prs.slide_layouts[6])
-
-# Full gradient background effect with shapes
-bg1 = slide1.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(10), Inches(3.5))
-bg1.fill.solid()
-bg1.fill.fore_color.rgb = PRIMARY_RED
-bg1.line.fill.background()
-
-bg2 = slide1.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, Inches(3.5), Inches(10), Inches(4))
-bg2.fill.solid()
-bg2.fill.fore_color.rgb = DEEP_RED
-bg2.line.fill.background()
-
-# Yellow wave accent
-wave = slide1.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(-1), Inches(3.2), Inches(12), Inches(0.6))
-wave.fill.solid()
-wave.fill.fore_color.rgb = BRIGHT_YELLOW
-wave.line.fill.background()
-
-# Decorative circles
-circle1 = slide1.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.5), Inches(0.5), Inches(1.2), Inches(1.2))
-circle1.fill.solid()
-circle1.fill.fore_color.rgb = BRIGHT_YELLOW
-circle1.line.fill.background()
-
-circle2 = slide1.shapes.add_shape(MSO_SHAPE.OVAL, Inches(8.3), Inches(0.3), Inches(0.8), Inches(0.8))
-circle2.fill.solid()
-circle2.fill.fore_color.rgb = ORANGE
-circle2.line.fill.background()
-
-circle3 = slide1.shapes.add_shape(MSO_SHAPE.OVAL, Inches(8.8), Inches(5.5), Inches(0.6), Inches(0.6))
-circle3.fill.solid()
-circle3.fill.fore_color.rgb = GOLD
-circle3.line.fill.background()
-
-# Main title
-title_box = slide1.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(8.4), Inches(1.2))
-tf = title_box.text_frame
-p = tf.paragraphs[0]
-p.text = "XYZ Mobile App"
-p.font.size = Pt(52)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Subtitle with background
-sub_box = slide1.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, 
-                                   Inches(1.5), Inches(3.0),
-                                   Inches(7), Inches(0.8))
-sub_box.fill.solid()
-sub_box.fill.fore_color.rgb = WHITE
-sub_box.line.color.rgb = GOLD
-sub_box.line.width = Pt(3)
-
-sub_text = slide1.shapes.add_textbox(Inches(1.5), Inches(3.2), Inches(7), Inches(0.6))
-tf = sub_text.text_frame
-p = tf.paragraphs[0]
-p.text = "Performance & Release Management Diagnostic"
-p.font.size = Pt(24)
-p.font.bold = True
-p.font.color.rgb = DEEP_RED
-p.alignment = PP_ALIGN.CENTER
-
-# Company info
-comp_box = slide1.shapes.add_textbox(Inches(0.8), Inches(4.5), Inches(8.4), Inches(0.6))
-tf = comp_box.text_frame
-p = tf.paragraphs[0]
-p.text = "XYZ Company"
-p.font.size = Pt(28)
-p.font.color.rgb = BRIGHT_YELLOW
-p.alignment = PP_ALIGN.CENTER
-
-date_box = slide1.shapes.add_textbox(Inches(0.8), Inches(5.2), Inches(8.4), Inches(0.5))
-tf = date_box.text_frame
-p = tf.paragraphs[0]
-p.text = "January 2026"
-p.font.size = Pt(20)
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# ============ SLIDE 2 — Understanding Scope (Visual Cards) ============
-slide2 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide2)
-add_decorative_footer(slide2)
-
-# Title with icon
-add_title_with_icon(slide2, "Our Understanding of Scope", MSO_SHAPE.OVAL)
-
-# Intro text
-intro = slide2.shapes.add_textbox(Inches(0.6), Inches(1.3), Inches(8.8), Inches(0.4))
-tf = intro.text_frame
-p = tf.paragraphs[0]
-p.text = "Client seeks a comprehensive diagnostic-driven assessment:"
-p.font.size = Pt(14)
-p.font.italic = True
-p.font.color.rgb = DARK_GRAY
-
-# Visual cards for each objective
-cards = [
-    ("Analyze", "Mobile app latency across Home, Insurance, Spend Track, Quiz & other key user flows"),
-    ("Identify", "Root causes behind long load times (6 sec current vs 2-3 sec market benchmark)"),
-    ("Understand", "App size inflation patterns (Android: 160MB→400MB+; iOS: 402MB)"),
-    ("Determine", "Feasibility of moving to a monthly release cycle"),
-    ("Recommend", "Fixes backed by measurable Root Cause Analysis - no assumptions"),
-    ("Provide", "North Star performance vision to guide long-term optimization strategy")
-]
-
-y_pos = 1.9
-for i, (head, desc) in enumerate(cards):
-    x = 0.5 if i % 2 == 0 else 5.2
-    if i > 0 and i % 2 == 0:
-        y_pos += 1.8
-    
-    # Card background
-    card = slide2.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(x), Inches(y_pos),
-                                    Inches(4.3), Inches(1.6))
-    card.fill.solid()
-    card.fill.fore_color.rgb = CREAM if i % 2 == 0 else LIGHT_YELLOW
-    card.line.color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
-    card.line.width = Pt(2)
-    
-    # Icon circle
-    icon = slide2.shapes.add_shape(MSO_SHAPE.OVAL,
-                                    Inches(x + 0.1), Inches(y_pos + 0.1),
-                                    Inches(0.4), Inches(0.4))
-    icon.fill.solid()
-    icon.fill.fore_color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
-    icon.line.fill.background()
-    
-    # Heading
-    head_box = slide2.shapes.add_textbox(Inches(x + 0.6), Inches(y_pos + 0.15),
-                                          Inches(3.5), Inches(0.4))
-    tf = head_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = head
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    
-    # Description
-    desc_box = slide2.shapes.add_textbox(Inches(x + 0.15), Inches(y_pos + 0.6),
-                                          Inches(4.0), Inches(0.9))
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(11)
-    p.font.color.rgb = DARK_GRAY
-
-# ============ SLIDE 3 — Scope (Two-Column Visual) ============
-slide3 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide3)
-add_decorative_footer(slide3)
-
-add_title_with_icon(slide3, "Scope of Diagnostic", MSO_SHAPE.OVAL)
-
-# Left panel - AB Team
-left_panel = slide3.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                      Inches(0.4), Inches(1.4),
-                                      Inches(4.6), Inches(5.3))
-left_panel.fill.solid()
-left_panel.fill.fore_color.rgb = RGBColor(254, 242, 242)
-left_panel.line.color.rgb = PRIMARY_RED
-left_panel.line.width = Pt(3)
-
-# AB Team header
-ab_header = slide3.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                     Inches(0.4), Inches(1.4),
-                                     Inches(4.6), Inches(0.6))
-ab_header.fill.solid()
-ab_header.fill.fore_color.rgb = PRIMARY_RED
-ab_header.line.fill.background()
-
-ab_text = slide3.shapes.add_textbox(Inches(0.4), Inches(1.52), Inches(4.6), Inches(0.5))
-tf = ab_text.text_frame
-p = tf.paragraphs[0]
-p.text = "🔧 AB Team Resources"
-p.font.size = Pt(16)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Team list
-team_items = [
-    ("Mobile Performance Lead", "Flutter Expert"),
-    ("Mobile Performance Engineer", "Code Analysis"),
-    ("Engineering Manager", "Program Management")
-]
-y = 2.2
-for role, desc in team_items:
-    # Role
-    role_box = slide3.shapes.add_textbox(Inches(0.6), Inches(y), Inches(4.2), Inches(0.35))
-    tf = role_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "▸ " + role
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    
-    # Desc
-    desc_box = slide3.shapes.add_textbox(Inches(0.9), Inches(y + 0.35), Inches(3.9), Inches(0.3))
-    tf = desc_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
-    y += 0.8
-
-# Activities header
-act_header = slide3.shapes.add_textbox(Inches(0.6), Inches(4.5), Inches(4.2), Inches(0.4))
-tf = act_header.text_frame
-p = tf.paragraphs[0]
-p.text = "📋 Key Activities"
-p.font.size = Pt(13)
-p.font.bold = True
-p.font.color.rgb = PRIMARY_RED
-
-activities = ["Access setup: source code, UAT builds", "Journey & technical walkthrough",
-              "Environment & build readiness confirmation"]
-y = 4.9
-for act in activities:
-    act_box = slide3.shapes.add_textbox(Inches(0.7), Inches(y), Inches(4.0), Inches(0.35))
-    tf = act_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = "• " + act
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
-    y += 0.35
-
-# Right panel - Client Inputs
-right_panel = slide3.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                       Inches(5.1), Inches(1.4),
-                                       Inches(4.5), Inches(5.3))
-right_panel.fill.solid()
-right_panel.fill.fore_color.rgb = RGBColor(255, 251, 235)
-right_panel.line.color.rgb = GOLD
-right_panel.line.width = Pt(3)
-
-# Client header
-client_header = slide3.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                         Inches(5.1), Inches(1.4),
-                                         Inches(4.5), Inches(0.6))
-client_header.fill.solid()
-client_header.fill.fore_color.rgb = GOLD
-client_header.line.fill.background()
-
-client_text = slide3.shapes.add_textbox(Inches(5.1), Inches(1.52), Inches(4.5), Inches(0.5))
-tf = client_text.text_frame
-p = tf.paragraphs[0]
-p.text = "📦 Inputs From Client"
-p.font.size = Pt(16)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Client inputs with icons
-client_inputs = [
-    ("📱", "Latest production build (APK/IPA)"),
-    ("📊", "Access to Analytics, CMS"),
-    ("📑", "API documentation"),
-    ("🚀", "Release pipeline documentation"),
-    ("🔌", "Third-party SDK list")
-]
-y = 2.2
-for icon, item in client_inputs:
-    item_box = slide3.shapes.add_textbox(Inches(5.3), Inches(y), Inches(4.1), Inches(0.5))
-    tf = item_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"{icon} {item}"
-    p.font.size = Pt(12)
-    p.font.color.rgb = DARK_GRAY
-    y += 0.65
-
-# ============ SLIDE 4 — North Star (Visual Benchmark) ============
-slide4 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide4)
-add_decorative_footer(slide4)
-
-add_title_with_icon(slide4, "North Star Vision", MSO_SHAPE.OVAL)
-
-# Subtitle
-sub = slide4.shapes.add_textbox(Inches(0.6), Inches(1.15), Inches(8.8), Inches(0.4))
-tf = sub.text_frame
-p = tf.paragraphs[0]
-p.text = "🎯 Industry Benchmarks & Target Goals"
-p.font.size = Pt(14)
-p.font.color.rgb = PRIMARY_RED
-p.font.bold = True
-
-# Benchmark cards
-benchmarks = [
-    ("⚡", "Screen Load Time", "2 sec", "Target", "6 sec", "Current", "60% improvement"),
-    ("🔄", "Tab-Switch Latency", "150-250", "ms", "500+", "ms", "Visual feedback"),
-    ("💾", "App Size Reduction", "30-40%", "Target", "Growing", "Current", "User retention"),
-    ("🌐", "API Latency", "<150", "ms critical", "300+", "ms", "Core flows"),
-    ("🎬", "Frame Stability", "<16", "ms/frame", "Janky", "Current", "Smooth UX"),
-    ("📅", "Release Cadence", "Monthly", "Predictable", "Ad-hoc", "Current", "Consistent")
-]
-
-positions = [(0.4, 1.7), (3.5, 1.7), (6.6, 1.7), (0.4, 4.0), (3.5, 4.0), (6.6, 4.0)]
-
-for i, (icon, label, target_val, target_unit, curr_val, curr_unit, benefit) in enumerate(benchmarks):
-    x, y = positions[i]
-    
-    # Card
-    card = slide4.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(x), Inches(y),
-                                    Inches(2.8), Inches(2.15))
-    card.fill.solid()
-    card.fill.fore_color.rgb = CREAM if i % 2 == 0 else LIGHT_YELLOW
-    card.line.color.rgb = PRIMARY_RED
-    card.line.width = Pt(2)
-    
-    # Icon
-    icon_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 0.1), Inches(0.5), Inches(0.5))
-    tf = icon_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = icon
-    p.font.size = Pt(24)
-    
-    # Label
-    label_box = slide4.shapes.add_textbox(Inches(x + 0.6), Inches(y + 0.15), Inches(2.0), Inches(0.4))
-    tf = label_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = label
-    p.font.size = Pt(11)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    
-    # Target value (highlighted)
-    target_bg = slide4.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                         Inches(x + 0.1), Inches(y + 0.6),
-                                         Inches(1.2), Inches(0.6))
-    target_bg.fill.solid()
-    target_bg.fill.fore_color.rgb = RGBColor(220, 252, 231)
-    target_bg.line.color.rgb = RGBColor(34, 197, 94)
-    
-    target_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 0.7), Inches(1.2), Inches(0.5))
-    tf = target_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = target_val
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(22, 101, 52)
-    p.alignment = PP_ALIGN.CENTER
+        # Content items, one 18pt line down, where they have always been drawn
+        add_text_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, x - 0.1, 3.8, 1.5, 2.5, phase_items,
+                       "creative.phase_item", fill=CREAM, line=GOLD, line_width=1.5,
+                       insets=(0.15, 0.45, 0.15, 0), anchor=MSO_ANCHOR.TOP)
+
+def create_cover_slide(prs, title, subtitle, company, date):
+    """Create the creative cover slide with layered accents"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+
+    # Full gradient background effect with shapes
+    bg1 = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(10), Inches(3.5))
+    bg1.fill.solid()
+    bg1.fill.fore_color.rgb = PRIMARY_RED
+    bg1.line.fill.background()
+
+    bg2 = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, Inches(3.5), Inches(10), Inches(4))
+    bg2.fill.solid()
+    bg2.fill.fore_color.rgb = DEEP_RED
+    bg2.line.fill.background()
+
+    # Yellow wave accent
+    wave = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(-1), Inches(3.2), Inches(12), Inches(0.6))
+    wave.fill.solid()
+    wave.fill.fore_color.rgb = BRIGHT_YELLOW
+    wave.line.fill.background()
+
+    # Decorative circles
+    circle1 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.5), Inches(0.5), Inches(1.2), Inches(1.2))
+    circle1.fill.solid()
+    circle1.fill.fore_color.rgb = BRIGHT_YELLOW
+    circle1.line.fill.background()
+
+    circle2 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(8.3), Inches(0.3), Inches(0.8), Inches(0.8))
+    circle2.fill.solid()
+    circle2.fill.fore_color.rgb = ORANGE
+    circle2.line.fill.background()
+
+    circle3 = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(8.8), Inches(5.5), Inches(0.6), Inches(0.6))
+    circle3.fill.solid()
+    circle3.fill.fore_color.rgb = GOLD
+    circle3.line.fill.background()
+
+    # Main title
+    title_box = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(8.4), Inches(1.2))
+    set_text(title_box.text_frame, title, "creative.cover_title")
+
+    # Subtitle with background
+    add_text_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, 1.5, 3.0, 7, 0.8, subtitle, "creative.cover_subtitle",
+                   fill=WHITE, line=GOLD, line_width=3)
+
+    # Company info
+    comp_box = slide.shapes.add_textbox(Inches(0.8), Inches(4.5), Inches(8.4), Inches(0.6))
+    set_text(comp_box.text_frame, company, "creative.cover_company")
+
+    date_box = slide.shapes.add_textbox(Inches(0.8), Inches(5.2), Inches(8.4), Inches(0.5))
+    set_text(date_box.text_frame, date, "creative.cover_date")
+    return slide
+
+def create_content_slide(prs, title, bullets, subtitle=""):
+    """Create standard content slide with a styled content box"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide)
+    add_decorative_footer(slide)
+    add_title_with_icon(slide, title, MSO_SHAPE.OVAL)
     
-    target_unit_box = slide4.shapes.add_textbox(Inches(x + 1.35), Inches(y + 0.75), Inches(1.3), Inches(0.4))
-    tf = target_unit_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"{target_unit} (Target)"
-    p.font.size = Pt(9)
-    p.font.color.rgb = DARK_GRAY
+    top = 1.4
+    if subtitle:
+        intro = slide.shapes.add_textbox(Inches(0.6), Inches(1.3), Inches(8.8), Inches(0.4))
+        set_text(intro.text_frame, subtitle, "creative.intro")
+        top = 1.9
     
-    # Current value
-    curr_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 1.25), Inches(2.5), Inches(0.3))
-    tf = curr_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"vs {curr_val} {curr_unit}"
-    p.font.size = Pt(10)
-    p.font.color.rgb = RGBColor(239, 68, 68)
+    add_content_box(slide, bullets, 0.5, top, 9, 6.7 - top)
+    return slide
+
+# Layouts available to deck specs rendered with this theme
+SPEC_LAYOUTS = {
+    "cover": create_cover_slide,
+    "content": create_content_slide,
+    "cards": create_infographic_slide,
+    "timeline": create_timeline_slide,
+}
+
+@shape_ids.tracking()
+@slide_append.tracking()
+def build_presentation(prs=None):
+    """Build the creative diagnostic deck and return the Presentation
+
+    `prs` is a blank 10x7.5in Presentation to build into, such as deck_spec.new_presentation().
+    """
+    # Create presentation
+    if prs is None:
+        prs = Presentation()
+        prs.slide_width = Inches(10)
+        prs.slide_height = Inches(7.5)
+
+    # ============ SLIDE 1 — CREATIVE COVER PAGE ============
+    create_cover_slide(prs, "XYZ Mobile App", "Performance & Release Management Diagnostic",
+                       "XYZ Company", "January 2026")
+
+    # ============ SLIDE 2 — Understanding Scope (Visual Cards) ============
+    slide2 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide2)
+    add_decorative_footer(slide2)
+
+    # Title with icon
+    add_title_with_icon(slide2, "Our Understanding of Scope", MSO_SHAPE.OVAL)
+
+    # Intro text
+    intro = slide2.shapes.add_textbox(Inches(0.6), Inches(1.3), Inches(8.8), Inches(0.4))
+    tf = intro.text_frame
+    set_text(tf, "Client seeks a comprehensive diagnostic-driven assessment:", "creative.intro")
+
+    # Visual cards for each objective
+    cards = [
+        ("Analyze", "Mobile app latency across Home, Insurance, Spend Track, Quiz & other key user flows"),
+        ("Identify", "Root causes behind long load times (6 sec current vs 2-3 sec market benchmark)"),
+        ("Understand", "App size inflation patterns (Android: 160MB→400MB+; iOS: 402MB)"),
+        ("Determine", "Feasibility of moving to a monthly release cycle"),
+        ("Recommend", "Fixes backed by measurable Root Cause Analysis - no assumptions"),
+        ("Provide", "North Star performance vision to guide long-term optimization strategy")
+    ]
+
+    y_pos = 1.9
+    for i, (head, desc) in enumerate(cards):
+        x = 0.5 if i % 2 == 0 else 5.2
+        if i > 0 and i % 2 == 0:
+            y_pos += 1.8
     
-    # Benefit
-    benefit_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 1.6), Inches(2.5), Inches(0.4))
-    tf = benefit_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = f"✓ {benefit}"
-    p.font.size = Pt(9)
-    p.font.italic = True
-    p.font.color.rgb = DARK_GRAY
-
-# Disclaimer
-disc = slide4.shapes.add_textbox(Inches(0.4), Inches(6.3), Inches(9.2), Inches(0.4))
-tf = disc.text_frame
-p = tf.paragraphs[0]
-p.text = "📌 Note: These are reference benchmarks only. Actual commitments determined post-RCA."
-p.font.size = Pt(10)
-p.font.italic = True
-p.font.color.rgb = DARK_GRAY
-p.alignment = PP_ALIGN.CENTER
-
-# ============ SLIDE 5 — Assumptions (Visual) ============
-slide5 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide5)
-add_decorative_footer(slide5)
-
-add_title_with_icon(slide5, "Key Assumptions", MSO_SHAPE.OVAL)
-
-assumptions = [
-    ("1", "Client Access", "All access (code, builds, dashboards) will be provided by the client in a timely manner"),
-    ("2", "SDK Limitations", "Third-party SDK behavior and CMS limitations may restrict optimization scope"),
-    ("3", "Backend Scope", "No changes to backend or CMS unless explicitly included in the engagement"),
-    ("4", "RCA-Driven", "RCA outcomes will determine feasibility - not all items may be fixable"),
-    ("5", "Data-Driven", "Recommendations will be measurable and derived from profiling & telemetry data"),
-    ("6", "UX Stability", "Business-driven UI/UX changes out of scope unless mutually agreed"),
-    ("7", "Advisory Role", "Release Management changes are advisory; client DevOps owns implementation")
-]
-
-y_pos = 1.5
-for num, title, desc in assumptions:
-    # Number circle
-    circle = slide5.shapes.add_shape(MSO_SHAPE.OVAL,
-                                      Inches(0.5), Inches(y_pos + 0.05),
-                                      Inches(0.5), Inches(0.5))
-    circle.fill.solid()
-    circle.fill.fore_color.rgb = PRIMARY_RED
-    circle.line.fill.background()
+        # Card background
+        card = slide2.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                        Inches(x), Inches(y_pos),
+                                        Inches(4.3), Inches(1.6))
+        card.fill.solid()
+        card.fill.fore_color.rgb = CREAM if i % 2 == 0 else LIGHT_YELLOW
+        card.line.color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
+        card.line.width = Pt(2)
     
-    num_text = slide5.shapes.add_textbox(Inches(0.5), Inches(y_pos + 0.12), Inches(0.5), Inches(0.4))
-    tf = num_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = num
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
+        # Icon circle
+        icon = slide2.shapes.add_shape(MSO_SHAPE.OVAL,
+                                        Inches(x + 0.1), Inches(y_pos + 0.1),
+                                        Inches(0.4), Inches(0.4))
+        icon.fill.solid()
+        icon.fill.fore_color.rgb = PRIMARY_RED if i % 2 == 0 else ORANGE
+        icon.line.fill.background()
     
-    # Title
-    title_box = slide5.shapes.add_textbox(Inches(1.15), Inches(y_pos), Inches(3.0), Inches(0.4))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(13)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
+        # Heading
+        head_box = slide2.shapes.add_textbox(Inches(x + 0.6), Inches(y_pos + 0.15),
+                                              Inches(3.5), Inches(0.4))
+        tf = head_box.text_frame
+        set_text(tf, head, "creative.heading")
     
-    # Description box
-    desc_box = slide5.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                        Inches(4.2), Inches(y_pos - 0.05),
-                                        Inches(5.3), Inches(0.7))
-    desc_box.fill.solid()
-    desc_box.fill.fore_color.rgb = CREAM
-    desc_box.line.color.rgb = GOLD
+        # Description
+        desc_box = slide2.shapes.add_textbox(Inches(x + 0.15), Inches(y_pos + 0.6),
+                                              Inches(4.0), Inches(0.9))
+        tf = desc_box.text_frame
+        tf.word_wrap = True
+        set_text(tf, desc, "creative.text")
+
+    # ============ SLIDE 3 — Scope (Two-Column Visual) ============
+    slide3 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide3)
+    add_decorative_footer(slide3)
+
+    add_title_with_icon(slide3, "Scope of Diagnostic", MSO_SHAPE.OVAL)
+
+    # Left panel - AB Team
+    left_panel = slide3.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                          Inches(0.4), Inches(1.4),
+                                          Inches(4.6), Inches(5.3))
+    left_panel.fill.solid()
+    left_panel.fill.fore_color.rgb = RGBColor(254, 242, 242)
+    left_panel.line.color.rgb = PRIMARY_RED
+    left_panel.line.width = Pt(3)
+
+    # AB Team header
+    add_text_shape(slide3, MSO_SHAPE.RECTANGLE, 0.4, 1.4, 4.6, 0.6, "🔧 AB Team Resources", "creative.panel_header",
+                   fill=PRIMARY_RED)
+
+    # Team list
+    team_items = [
+        ("Mobile Performance Lead", "Flutter Expert"),
+        ("Mobile Performance Engineer", "Code Analysis"),
+        ("Engineering Manager", "Program Management")
+    ]
+    y = 2.2
+    for role, desc in team_items:
+        # Role
+        role_box = slide3.shapes.add_textbox(Inches(0.6), Inches(y), Inches(4.2), Inches(0.35))
+        tf = role_box.text_frame
+        set_text(tf, "▸ " + role, "creative.role")
     
-    desc_text = slide5.shapes.add_textbox(Inches(4.35), Inches(y_pos + 0.05), Inches(5.0), Inches(0.55))
-    tf = desc_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
+        # Desc
+        desc_box = slide3.shapes.add_textbox(Inches(0.9), Inches(y + 0.35), Inches(3.9), Inches(0.3))
+        tf = desc_box.text_frame
+        set_text(tf, desc, "creative.desc")
+        y += 0.8
+
+    # Activities header
+    act_header = slide3.shapes.add_textbox(Inches(0.6), Inches(4.5), Inches(4.2), Inches(0.4))
+    tf = act_header.text_frame
+    set_text(tf, "📋 Key Activities", "creative.section")
+
+    activities = ["Access setup: source code, UAT builds", "Journey & technical walkthrough",
+                  "Environment & build readiness confirmation"]
+    add_bullet_list(slide3, activities, 0.7, 4.9, 4.0, 0.35)
+
+    # Right panel - Client Inputs
+    right_panel = slide3.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                           Inches(5.1), Inches(1.4),
+                                           Inches(4.5), Inches(5.3))
+    right_panel.fill.solid()
+    right_panel.fill.fore_color.rgb = RGBColor(255, 251, 235)
+    right_panel.line.color.rgb = GOLD
+    right_panel.line.width = Pt(3)
+
+    # Client header
+    add_text_shape(slide3, MSO_SHAPE.RECTANGLE, 5.1, 1.4, 4.5, 0.6, "📦 Inputs From Client", "creative.panel_header",
+                   fill=GOLD)
+
+    # Client inputs with icons
+    client_inputs = [
+        ("📱", "Latest production build (APK/IPA)"),
+        ("📊", "Access to Analytics, CMS"),
+        ("📑", "API documentation"),
+        ("🚀", "Release pipeline documentation"),
+        ("🔌", "Third-party SDK list")
+    ]
+    y = 2.2
+    for icon, item in client_inputs:
+        item_box = slide3.shapes.add_textbox(Inches(5.3), Inches(y), Inches(4.1), Inches(0.5))
+        tf = item_box.text_frame
+        set_text(tf, f"{icon} {item}", "creative.list_item")
+        y += 0.65
+
+    # ============ SLIDE 4 — North Star (Visual Benchmark) ============
+    slide4 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide4)
+    add_decorative_footer(slide4)
+
+    add_title_with_icon(slide4, "North Star Vision", MSO_SHAPE.OVAL)
+
+    # Subtitle
+    sub = slide4.shapes.add_textbox(Inches(0.6), Inches(1.15), Inches(8.8), Inches(0.4))
+    tf = sub.text_frame
+    set_text(tf, "🎯 Industry Benchmarks & Target Goals", "creative.callout")
+
+    # Benchmark cards
+    benchmarks = [
+        ("⚡", "Screen Load Time", "2 sec", "Target", "6 sec", "Current", "60% improvement"),
+        ("🔄", "Tab-Switch Latency", "150-250", "ms", "500+", "ms", "Visual feedback"),
+        ("💾", "App Size Reduction", "30-40%", "Target", "Growing", "Current", "User retention"),
+        ("🌐", "API Latency", "<150", "ms critical", "300+", "ms", "Core flows"),
+        ("🎬", "Frame Stability", "<16", "ms/frame", "Janky", "Current", "Smooth UX"),
+        ("📅", "Release Cadence", "Monthly", "Predictable", "Ad-hoc", "Current", "Consistent")
+    ]
+
+    positions = [(0.4, 1.7), (3.5, 1.7), (6.6, 1.7), (0.4, 4.0), (3.5, 4.0), (6.6, 4.0)]
+
+    for i, (icon, label, target_val, target_unit, curr_val, curr_unit, benefit) in enumerate(benchmarks):
+        x, y = positions[i]
     
-    y_pos += 0.85
-
-# ============ SLIDE 6 — Architecture (Visual Hub) ============
-slide6 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide6)
-add_decorative_footer(slide6)
-
-add_title_with_icon(slide6, "Architecture & Design Focus", MSO_SHAPE.OVAL)
-
-# Central hub visualization
-# Center circle
-center = slide6.shapes.add_shape(MSO_SHAPE.OVAL,
-                                  Inches(4.0), Inches(3.0),
-                                  Inches(2), Inches(2))
-center.fill.solid()
-center.fill.fore_color.rgb = PRIMARY_RED
-center.line.color.rgb = BRIGHT_YELLOW
-center.line.width = Pt(4)
-
-center_text = slide6.shapes.add_textbox(Inches(4.0), Inches(3.7), Inches(2), Inches(0.8))
-tf = center_text.text_frame
-p = tf.paragraphs[0]
-p.text = "Architecture\nAssessment"
-p.font.size = Pt(11)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Surrounding nodes
-nodes = [
-    ("Modular\nLayers", 1.5, 1.8, CREAM),
-    ("API\nSequencing", 7.5, 1.8, LIGHT_YELLOW),
-    ("Async\nRendering", 0.8, 4.0, RGBColor(254, 242, 242)),
-    ("SDK\nFootprint", 8.2, 4.0, RGBColor(255, 251, 235)),
-    ("Lazy\nLoading", 1.5, 5.8, RGBColor(236, 254, 255)),
-    ("Asset\nCache", 7.5, 5.8, RGBColor(245, 243, 255))
-]
-
-for label, x, y, color in nodes:
-    # Connection line
-    line_x = 4.5 + (x - 4.5) * 0.5
-    line_y = 3.5 + (y - 3.5) * 0.5
+        # Card
+        card = slide4.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                        Inches(x), Inches(y),
+                                        Inches(2.8), Inches(2.15))
+        card.fill.solid()
+        card.fill.fore_color.rgb = CREAM if i % 2 == 0 else LIGHT_YELLOW
+        card.line.color.rgb = PRIMARY_RED
+        card.line.width = Pt(2)
     
-    # Node
-    node = slide6.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(x), Inches(y),
-                                    Inches(1.8), Inches(1.0))
-    node.fill.solid()
-    node.fill.fore_color.rgb = color
-    node.line.color.rgb = PRIMARY_RED
-    node.line.width = Pt(2)
+        # Icon
+        icon_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 0.1), Inches(0.5), Inches(0.5))
+        tf = icon_box.text_frame
+        set_text(tf, icon, "creative.icon")
     
-    # Label
-    label_box = slide6.shapes.add_textbox(Inches(x), Inches(y + 0.25), Inches(1.8), Inches(0.6))
-    tf = label_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = label
-    p.font.size = Pt(10)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    p.alignment = PP_ALIGN.CENTER
-
-# Additional considerations at bottom
-bottom_box = slide6.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                      Inches(2.5), Inches(6.4),
-                                      Inches(5), Inches(0.6))
-bottom_box.fill.solid()
-bottom_box.fill.fore_color.rgb = CREAM
-bottom_box.line.color.rgb = GOLD
-
-bottom_text = slide6.shapes.add_textbox(Inches(2.6), Inches(6.55), Inches(4.8), Inches(0.4))
-tf = bottom_text.text_frame
-p = tf.paragraphs[0]
-p.text = "🎯 Plus: Separation of concerns, Release governance, Branching strategy review"
-p.font.size = Pt(11)
-p.font.color.rgb = DARK_GRAY
-p.alignment = PP_ALIGN.CENTER
-
-# ============ SLIDE 7 — Diagnostic View (Layered) ============
-slide7 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide7)
-add_decorative_footer(slide7)
-
-add_title_with_icon(slide7, "Proposed Diagnostic Architecture", MSO_SHAPE.FLOWCHART_PROCESS)
-
-# Layered architecture visualization
-layers = [
-    ("📱 App Frontend", "Flutter architecture deep-dive", RGBColor(254, 242, 242), 0.5),
-    ("🌐 API Gateway", "Interaction patterns & latency", RGBColor(255, 251, 235), 1.4),
-    ("📦 CMS Modules", "Content-driven module analysis", RGBColor(236, 254, 255), 2.3),
-    ("🔌 SDK Integrations", "Fly, MarTech, Payments, Firebase", RGBColor(245, 243, 255), 3.2),
-    ("📊 Telemetry", "Performance data flows", RGBColor(255, 241, 242), 4.1),
-    ("🚀 CI/CD Pipeline", "Release workflows & automation", RGBColor(255, 247, 237), 5.0)
-]
-
-for icon_label, desc, color, y_offset in layers:
-    # Layer bar
-    layer = slide7.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(2), Inches(1.5 + y_offset),
-                                     Inches(6), Inches(0.75))
-    layer.fill.solid()
-    layer.fill.fore_color.rgb = color
-    layer.line.color.rgb = PRIMARY_RED
-    layer.line.width = Pt(2)
+        # Label
+        label_box = slide4.shapes.add_textbox(Inches(x + 0.6), Inches(y + 0.15), Inches(2.0), Inches(0.4))
+        tf = label_box.text_frame
+        set_text(tf, label, "creative.label")
     
-    # Icon + Label
-    label_box = slide7.shapes.add_textbox(Inches(2.2), Inches(1.58 + y_offset),
-                                           Inches(3.5), Inches(0.6))
-    tf = label_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = icon_label
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
+        # Target value (highlighted)
+        add_text_shape(slide4, MSO_SHAPE.ROUNDED_RECTANGLE, x + 0.1, y + 0.6, 1.2, 0.6, target_val, "creative.metric",
+                       fill=RGBColor(220, 252, 231), line=RGBColor(34, 197, 94))
     
-    # Description
-    desc_box = slide7.shapes.add_textbox(Inches(5.5), Inches(1.65 + y_offset),
-                                          Inches(2.3), Inches(0.55))
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
+        target_unit_box = slide4.shapes.add_textbox(Inches(x + 1.35), Inches(y + 0.75), Inches(1.3), Inches(0.4))
+        tf = target_unit_box.text_frame
+        set_text(tf, f"{target_unit} (Target)", "creative.unit")
     
-    # Arrow down (except last)
-    if y_offset < 5.0:
-        arrow = slide7.shapes.add_shape(MSO_SHAPE.DOWN_ARROW,
-                                         Inches(4.8), Inches(2.28 + y_offset),
-                                         Inches(0.4), Inches(0.35))
-        arrow.fill.solid()
-        arrow.fill.fore_color.rgb = GOLD
-        arrow.line.fill.background()
-
-# ============ SLIDE 8 — Timeline (Visual Flow) ============
-phases = [
-    ("Setup", ["Access provision", "Environment", "Build validation"]),
-    ("Profiling", ["Load benchmarks", "API mapping", "Size breakdown", "Cache profiling"]),
-    ("RCA", ["Root-cause ID", "Fixable analysis", "SDK constraints", "Pipeline review"]),
-    ("Validation", ["Joint walkthrough", "Team validation", "Feasibility check", "Release model"]),
-    ("Report", ["Target alignment", "Uplift range", "Fixes list", "Execution plan"])
-]
-create_timeline_slide(prs, "Diagnostic Approach: Week 0-4", phases)
-
-# ============ SLIDE 9 — Team (Visual Org) ============
-slide9 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide9)
-add_decorative_footer(slide9)
-
-add_title_with_icon(slide9, "Expert Team Structure", MSO_SHAPE.OVAL)
-
-# Team visualization with photos placeholder
-team_data = [
-    ("👨‍💻", "Mobile Performance Lead", "Flutter Expert", "Profiling, rendering, optimization",
-     "1", PRIMARY_RED),
-    ("👩‍💻", "Mobile Engineers", "Code Analysts", "Code analysis, architecture assessment",
-     "2", ORANGE),
-    ("🎯", "Solution Architect", "Strategic Lead", "Engineering Mgmt, Program Mgmt, Architecture",
-     "1", GOLD)
-]
-
-x_positions = [0.5, 3.7, 6.9]
-for i, (icon, role, subtitle, resp, count, color) in enumerate(team_data):
-    x = x_positions[i]
+        # Current value
+        curr_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 1.25), Inches(2.5), Inches(0.3))
+        tf = curr_box.text_frame
+        set_text(tf, f"vs {curr_val} {curr_unit}", "creative.current")
     
-    # Card
-    card = slide9.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(x), Inches(1.8),
-                                    Inches(2.6), Inches(4.5))
-    card.fill.solid()
-    card.fill.fore_color.rgb = CREAM
-    card.line.color.rgb = color
-    card.line.width = Pt(3)
+        # Benefit
+        benefit_box = slide4.shapes.add_textbox(Inches(x + 0.1), Inches(y + 1.6), Inches(2.5), Inches(0.4))
+        tf = benefit_box.text_frame
+        set_text(tf, f"✓ {benefit}", "creative.benefit")
+
+    # Disclaimer
+    disc = slide4.shapes.add_textbox(Inches(0.4), Inches(6.3), Inches(9.2), Inches(0.4))
+    tf = disc.text_frame
+    set_text(tf, "📌 Note: These are reference benchmarks only. Actual commitments determined post-RCA.",
+             "creative.disclaimer")
+
+    # ============ SLIDE 5 — Assumptions (Visual) ============
+    slide5 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide5)
+    add_decorative_footer(slide5)
+
+    add_title_with_icon(slide5, "Key Assumptions", MSO_SHAPE.OVAL)
+
+    assumptions = [
+        ("1", "Client Access", "All access (code, builds, dashboards) will be provided by the client in a timely manner"),
+        ("2", "SDK Limitations", "Third-party SDK behavior and CMS limitations may restrict optimization scope"),
+        ("3", "Backend Scope", "No changes to backend or CMS unless explicitly included in the engagement"),
+        ("4", "RCA-Driven", "RCA outcomes will determine feasibility - not all items may be fixable"),
+        ("5", "Data-Driven", "Recommendations will be measurable and derived from profiling & telemetry data"),
+        ("6", "UX Stability", "Business-driven UI/UX changes out of scope unless mutually agreed"),
+        ("7", "Advisory Role", "Release Management changes are advisory; client DevOps owns implementation")
+    ]
+
+    y_pos = 1.5
+    for num, title, desc in assumptions:
+        # Number circle
+        add_text_shape(slide5, MSO_SHAPE.OVAL, 0.5, y_pos + 0.05, 0.5, 0.5, num, "creative.bullet_number",
+                       fill=PRIMARY_RED)
     
-    # Avatar circle
-    avatar = slide9.shapes.add_shape(MSO_SHAPE.OVAL,
-                                      Inches(x + 0.8), Inches(2.0),
-                                      Inches(1), Inches(1))
-    avatar.fill.solid()
-    avatar.fill.fore_color.rgb = color
-    avatar.line.color.rgb = WHITE
-    avatar.line.width = Pt(3)
+        # Title
+        title_box = slide5.shapes.add_textbox(Inches(1.15), Inches(y_pos), Inches(3.0), Inches(0.4))
+        tf = title_box.text_frame
+        set_text(tf, title, "creative.item_title")
     
-    # Icon
-    icon_box = slide9.shapes.add_textbox(Inches(x + 0.8), Inches(2.2), Inches(1), Inches(0.6))
-    tf = icon_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = icon
-    p.font.size = Pt(36)
-    p.alignment = PP_ALIGN.CENTER
+        # Description box
+        add_text_shape(slide5, MSO_SHAPE.ROUNDED_RECTANGLE, 4.2, y_pos - 0.05, 5.3, 0.7, desc, "creative.desc",
+                       fill=CREAM, line=GOLD, insets=(0.25, 0.15, 0.25, 0), anchor=MSO_ANCHOR.TOP)
     
-    # Role
-    role_box = slide9.shapes.add_textbox(Inches(x + 0.1), Inches(3.2), Inches(2.4), Inches(0.5))
-    tf = role_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = role
-    p.font.size = Pt(13)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    p.alignment = PP_ALIGN.CENTER
+        y_pos += 0.85
+
+    # ============ SLIDE 6 — Architecture (Visual Hub) ============
+    slide6 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide6)
+    add_decorative_footer(slide6)
+
+    add_title_with_icon(slide6, "Architecture & Design Focus", MSO_SHAPE.OVAL)
+
+    # Central hub visualization
+    # Center circle
+    add_text_shape(slide6, MSO_SHAPE.OVAL, 4.0, 3.0, 2, 2, "Architecture\nAssessment", "creative.hub",
+                   fill=PRIMARY_RED, line=BRIGHT_YELLOW, line_width=4)
+
+    # Surrounding nodes
+    nodes = [
+        ("Modular\nLayers", 1.5, 1.8, CREAM),
+        ("API\nSequencing", 7.5, 1.8, LIGHT_YELLOW),
+        ("Async\nRendering", 0.8, 4.0, RGBColor(254, 242, 242)),
+        ("SDK\nFootprint", 8.2, 4.0, RGBColor(255, 251, 235)),
+        ("Lazy\nLoading", 1.5, 5.8, RGBColor(236, 254, 255)),
+        ("Asset\nCache", 7.5, 5.8, RGBColor(245, 243, 255))
+    ]
+
+    for label, x, y, color in nodes:
+        # Connection line
+        line_x = 4.5 + (x - 4.5) * 0.5
+        line_y = 3.5 + (y - 3.5) * 0.5
     
-    # Subtitle
-    sub_box = slide9.shapes.add_textbox(Inches(x + 0.1), Inches(3.7), Inches(2.4), Inches(0.4))
-    tf = sub_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = subtitle
-    p.font.size = Pt(10)
-    p.font.italic = True
-    p.font.color.rgb = color
-    p.alignment = PP_ALIGN.CENTER
+        # Node
+        add_text_shape(slide6, MSO_SHAPE.ROUNDED_RECTANGLE, x, y, 1.8, 1.0, label, "creative.node",
+                       fill=color, line=PRIMARY_RED, line_width=2)
+
+    # Additional considerations at bottom
+    add_text_shape(slide6, MSO_SHAPE.ROUNDED_RECTANGLE, 2.5, 6.4, 5, 0.6,
+                   "🎯 Plus: Separation of concerns, Release governance, Branching strategy review", "creative.note",
+                   fill=CREAM, line=GOLD, insets=(0.2, 0, 0.2, 0), wrap=False)
+
+    # ============ SLIDE 7 — Diagnostic View (Layered) ============
+    slide7 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide7)
+    add_decorative_footer(slide7)
+
+    add_title_with_icon(slide7, "Proposed Diagnostic Architecture", MSO_SHAPE.FLOWCHART_PROCESS)
+
+    # Layered architecture visualization
+    layers = [
+        ("📱 App Frontend", "Flutter architecture deep-dive", RGBColor(254, 242, 242), 0.5),
+        ("🌐 API Gateway", "Interaction patterns & latency", RGBColor(255, 251, 235), 1.4),
+        ("📦 CMS Modules", "Content-driven module analysis", RGBColor(236, 254, 255), 2.3),
+        ("🔌 SDK Integrations", "Fly, MarTech, Payments, Firebase", RGBColor(245, 243, 255), 3.2),
+        ("📊 Telemetry", "Performance data flows", RGBColor(255, 241, 242), 4.1),
+        ("🚀 CI/CD Pipeline", "Release workflows & automation", RGBColor(255, 247, 237), 5.0)
+    ]
+
+    for icon_label, desc, color, y_offset in layers:
+        # Layer bar
+        layer = slide7.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                         Inches(2), Inches(1.5 + y_offset),
+                                         Inches(6), Inches(0.75))
+        layer.fill.solid()
+        layer.fill.fore_color.rgb = color
+        layer.line.color.rgb = PRIMARY_RED
+        layer.line.width = Pt(2)
     
-    # Count badge
-    badge = slide9.shapes.add_shape(MSO_SHAPE.OVAL,
-                                     Inches(x + 1.9), Inches(1.6),
-                                     Inches(0.5), Inches(0.5))
-    badge.fill.solid()
-    badge.fill.fore_color.rgb = color
-    badge.line.fill.background()
+        # Icon + Label
+        label_box = slide7.shapes.add_textbox(Inches(2.2), Inches(1.58 + y_offset),
+                                               Inches(3.5), Inches(0.6))
+        tf = label_box.text_frame
+        set_text(tf, icon_label, "creative.heading")
     
-    count_text = slide9.shapes.add_textbox(Inches(x + 1.9), Inches(1.68), Inches(0.5), Inches(0.4))
-    tf = count_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = count
-    p.font.size = Pt(14)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
+        # Description
+        desc_box = slide7.shapes.add_textbox(Inches(5.5), Inches(1.65 + y_offset),
+                                              Inches(2.3), Inches(0.55))
+        tf = desc_box.text_frame
+        tf.word_wrap = True
+        set_text(tf, desc, "creative.desc")
     
-    # Responsibility
-    resp_bg = slide9.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                       Inches(x + 0.2), Inches(4.2),
-                                       Inches(2.2), Inches(1.8))
-    resp_bg.fill.solid()
-    resp_bg.fill.fore_color.rgb = WHITE
-    resp_bg.line.color.rgb = GOLD
+        # Arrow down (except last)
+        if y_offset < 5.0:
+            arrow = slide7.shapes.add_shape(MSO_SHAPE.DOWN_ARROW,
+                                             Inches(4.8), Inches(2.28 + y_offset),
+                                             Inches(0.4), Inches(0.35))
+            arrow.fill.solid()
+            arrow.fill.fore_color.rgb = GOLD
+            arrow.line.fill.background()
+
+    # ============ SLIDE 8 — Timeline (Visual Flow) ============
+    phases = [
+        ("Setup", ["Access provision", "Environment", "Build validation"]),
+        ("Profiling", ["Load benchmarks", "API mapping", "Size breakdown", "Cache profiling"]),
+        ("RCA", ["Root-cause ID", "Fixable analysis", "SDK constraints", "Pipeline review"]),
+        ("Validation", ["Joint walkthrough", "Team validation", "Feasibility check", "Release model"]),
+        ("Report", ["Target alignment", "Uplift range", "Fixes list", "Execution plan"])
+    ]
+    create_timeline_slide(prs, "Diagnostic Approach: Week 0-4", phases)
+
+    # ============ SLIDE 9 — Team (Visual Org) ============
+    slide9 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide9)
+    add_decorative_footer(slide9)
+
+    add_title_with_icon(slide9, "Expert Team Structure", MSO_SHAPE.OVAL)
+
+    # Team visualization with photos placeholder
+    team_data = [
+        ("👨‍💻", "Mobile Performance Lead", "Flutter Expert", "Profiling, rendering, optimization",
+         "1", PRIMARY_RED),
+        ("👩‍💻", "Mobile Engineers", "Code Analysts", "Code analysis, architecture assessment",
+         "2", ORANGE),
+        ("🎯", "Solution Architect", "Strategic Lead", "Engineering Mgmt, Program Mgmt, Architecture",
+         "1", GOLD)
+    ]
+
+    x_positions = [0.5, 3.7, 6.9]
+    for i, (icon, role, subtitle, resp, count, color) in enumerate(team_data):
+        x = x_positions[i]
     
-    resp_text = slide9.shapes.add_textbox(Inches(x + 0.3), Inches(4.35), Inches(2.0), Inches(1.6))
-    tf = resp_text.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = resp
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-# Total team
-total_box = slide9.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(3), Inches(6.5),
-                                     Inches(4), Inches(0.5))
-total_box.fill.solid()
-total_box.fill.fore_color.rgb = PRIMARY_RED
-total_box.line.fill.background()
-
-total_text = slide9.shapes.add_textbox(Inches(3), Inches(6.6), Inches(4), Inches(0.4))
-tf = total_text.text_frame
-p = tf.paragraphs[0]
-p.text = "🚀 Total Team: 3 Members (Diagnostic Phase)"
-p.font.size = Pt(13)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# ============ SLIDE 10 — Gantt (Visual Bars) ============
-slide10 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide10)
-add_decorative_footer(slide10)
-
-add_title_with_icon(slide10, "Project Timeline (Gantt View)", MSO_SHAPE.RECTANGLE)
-
-# Gantt chart
-weeks = ["W0", "W1", "W2", "W3", "W4"]
-tasks = [
-    ("Setup & Access", 0, 1, PRIMARY_RED),
-    ("Profiling & Analysis", 1, 1, ORANGE),
-    ("RCA & Observations", 2, 1, GOLD),
-    ("Discussions & Validation", 3, 1, RGBColor(34, 197, 94)),
-    ("Final Report", 4, 1, RGBColor(59, 130, 246))
-]
-
-# Week headers
-for i, week in enumerate(weeks):
-    header = slide10.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                       Inches(4 + i * 1.15), Inches(1.5),
-                                       Inches(1.05), Inches(0.5))
-    header.fill.solid()
-    header.fill.fore_color.rgb = DEEP_RED
-    header.line.fill.background()
+        # Card
+        card = slide9.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                        Inches(x), Inches(1.8),
+                                        Inches(2.6), Inches(4.5))
+        card.fill.solid()
+        card.fill.fore_color.rgb = CREAM
+        card.line.color.rgb = color
+        card.line.width = Pt(3)
     
-    week_text = slide10.shapes.add_textbox(Inches(4 + i * 1.15), Inches(1.58),
-                                            Inches(1.05), Inches(0.4))
-    tf = week_text.text_frame
-    p = tf.paragraphs[0]
-    p.text = week
-    p.font.size = Pt(12)
-    p.font.bold = True
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.CENTER
-
-# Task bars
-y_pos = 2.3
-for task_name, start, duration, color in tasks:
-    # Task label
-    label = slide10.shapes.add_textbox(Inches(0.3), Inches(y_pos), Inches(3.5), Inches(0.5))
-    tf = label.text_frame
-    p = tf.paragraphs[0]
-    p.text = task_name
-    p.font.size = Pt(11)
-    p.font.color.rgb = DARK_GRAY
+        # Avatar circle
+        add_text_shape(slide9, MSO_SHAPE.OVAL, x + 0.8, 2.0, 1, 1, icon, "creative.avatar",
+                       fill=color, line=WHITE, line_width=3, wrap=False)
     
-    # Bar
-    bar = slide10.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(4 + start * 1.15), Inches(y_pos + 0.05),
-                                    Inches(duration * 1.05), Inches(0.4))
-    bar.fill.solid()
-    bar.fill.fore_color.rgb = color
-    bar.line.color.rgb = WHITE
-    bar.line.width = Pt(2)
+        # Role
+        role_box = slide9.shapes.add_textbox(Inches(x + 0.1), Inches(3.2), Inches(2.4), Inches(0.5))
+        tf = role_box.text_frame
+        set_text(tf, role, "creative.role_title")
     
-    y_pos += 0.7
-
-# Milestones
-milestones = [
-    (4.55, "Kickoff"),
-    (5.7, "Data Ready"),
-    (6.85, "Findings"),
-    (8.0, "Validation"),
-    (9.15, "Delivery")
-]
-
-for x, label in milestones:
-    # Diamond marker
-    diamond = slide10.shapes.add_shape(MSO_SHAPE.DIAMOND,
-                                        Inches(x - 0.1), Inches(6.0),
-                                        Inches(0.2), Inches(0.2))
-    diamond.fill.solid()
-    diamond.fill.fore_color.rgb = GOLD
-    diamond.line.fill.background()
+        # Subtitle
+        sub_box = slide9.shapes.add_textbox(Inches(x + 0.1), Inches(3.7), Inches(2.4), Inches(0.4))
+        tf = sub_box.text_frame
+        set_text(tf, subtitle, "creative.role_subtitle", color=color)
     
-    # Label
-    m_label = slide10.shapes.add_textbox(Inches(x - 0.4), Inches(6.3), Inches(0.8), Inches(0.4))
-    tf = m_label.text_frame
-    p = tf.paragraphs[0]
-    p.text = label
-    p.font.size = Pt(8)
-    p.font.color.rgb = DARK_GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-# ============ SLIDE 11 — Commercial (Visual Pricing) ============
-slide11 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide11)
-add_decorative_footer(slide11)
-
-add_title_with_icon(slide11, "Investment Structure", MSO_SHAPE.OVAL)
-
-# Phase boxes - side by side
-# Diagnostic Phase
-diag_box = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(0.5), Inches(1.6),
-                                     Inches(4.4), Inches(4.8))
-diag_box.fill.solid()
-diag_box.fill.fore_color.rgb = RGBColor(254, 242, 242)
-diag_box.line.color.rgb = PRIMARY_RED
-diag_box.line.width = Pt(3)
-
-# Header
-diag_header = slide11.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                        Inches(0.5), Inches(1.6),
-                                        Inches(4.4), Inches(0.8))
-diag_header.fill.solid()
-diag_header.fill.fore_color.rgb = PRIMARY_RED
-diag_header.line.fill.background()
-
-diag_title = slide11.shapes.add_textbox(Inches(0.5), Inches(1.75), Inches(4.4), Inches(0.6))
-tf = diag_title.text_frame
-p = tf.paragraphs[0]
-p.text = "🔍 DIAGNOSTIC PHASE"
-p.font.size = Pt(16)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Duration badge
-duration_badge = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                           Inches(1.8), Inches(2.55),
-                                           Inches(1.8), Inches(0.5))
-duration_badge.fill.solid()
-duration_badge.fill.fore_color.rgb = BRIGHT_YELLOW
-duration_badge.line.fill.background()
-
-dur_text = slide11.shapes.add_textbox(Inches(1.8), Inches(2.62), Inches(1.8), Inches(0.4))
-tf = dur_text.text_frame
-p = tf.paragraphs[0]
-p.text = "⏱ 4 WEEKS"
-p.font.size = Pt(12)
-p.font.bold = True
-p.font.color.rgb = DEEP_RED
-p.alignment = PP_ALIGN.CENTER
-
-# Features
-diag_features = [
-    "✓ Fixed fee structure",
-    "✓ 4-5 resources (1 month FTE)",
-    "✓ Comprehensive analysis",
-    "✓ Root cause documentation",
-    "✓ Release advisory report"
-]
-y = 3.2
-for feat in diag_features:
-    feat_box = slide11.shapes.add_textbox(Inches(0.8), Inches(y), Inches(3.8), Inches(0.4))
-    tf = feat_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = feat
-    p.font.size = Pt(11)
-    p.font.color.rgb = DARK_GRAY
-    y += 0.5
-
-# Execution Phase
-exec_box = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(5.1), Inches(1.6),
-                                     Inches(4.4), Inches(4.8))
-exec_box.fill.solid()
-exec_box.fill.fore_color.rgb = RGBColor(255, 251, 235)
-exec_box.line.color.rgb = GOLD
-exec_box.line.width = Pt(3)
-
-exec_header = slide11.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                        Inches(5.1), Inches(1.6),
-                                        Inches(4.4), Inches(0.8))
-exec_header.fill.solid()
-exec_header.fill.fore_color.rgb = GOLD
-exec_header.line.fill.background()
-
-exec_title = slide11.shapes.add_textbox(Inches(5.1), Inches(1.75), Inches(4.4), Inches(0.6))
-tf = exec_title.text_frame
-p = tf.paragraphs[0]
-p.text = "🚀 EXECUTION PHASE"
-p.font.size = Pt(16)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-exec_badge = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                       Inches(6.4), Inches(2.55),
-                                       Inches(1.8), Inches(0.5))
-exec_badge.fill.solid()
-exec_badge.fill.fore_color.rgb = ORANGE
-exec_badge.line.fill.background()
-
-exec_badge_text = slide11.shapes.add_textbox(Inches(6.4), Inches(2.62), Inches(1.8), Inches(0.4))
-tf = exec_badge_text.text_frame
-p = tf.paragraphs[0]
-p.text = "📋 TBD"
-p.font.size = Pt(12)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-exec_features = [
-    "⏳ Estimation post-diagnostic",
-    "⏳ Dependent on fixable scope",
-    "⏳ Detailed sprint planning",
-    "⏳ Resource allocation",
-    "⏳ Timeline confirmation"
-]
-y = 3.2
-for feat in exec_features:
-    feat_box = slide11.shapes.add_textbox(Inches(5.4), Inches(y), Inches(3.8), Inches(0.4))
-    tf = feat_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = feat
-    p.font.size = Pt(11)
-    p.font.color.rgb = DARK_GRAY
-    y += 0.5
-
-# Arrow between
-arrow = slide11.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW,
-                                  Inches(4.7), Inches(3.5),
-                                  Inches(0.6), Inches(0.4))
-arrow.fill.solid()
-arrow.fill.fore_color.rgb = PRIMARY_RED
-arrow.line.fill.background()
-
-# ============ SLIDE 12 — Risks (Visual Warning) ============
-slide12 = prs.slides.add_slide(prs.slide_layouts[6])
-add_gradient_header(slide12)
-add_decorative_footer(slide12)
-
-add_title_with_icon(slide12, "Risk Factors & Dependencies", MSO_SHAPE.OVAL)
-
-risks = [
-    ("⚠️", "Third-Party SDKs", "External SDK behavior may limit optimization options"),
-    ("📡", "CMS Constraints", "Content Management System payload restrictions"),
-    ("⏰", "API Dependencies", "Launch-time API calls blocking user experience"),
-    ("📱", "Device Fragmentation", "Low-RAM device behavior variations"),
-    ("🚀", "Release Maturity", "Current release process capabilities"),
-    ("🔧", "Environment Access", "UAT/Production environment availability")
-]
-
-positions = [(0.5, 1.6), (5.2, 1.6), (0.5, 3.6), (5.2, 3.6), (0.5, 5.6), (5.2, 5.6)]
-
-for i, (icon, title, desc) in enumerate(risks):
-    x, y = positions[i]
+        # Count badge
+        add_text_shape(slide9, MSO_SHAPE.OVAL, x + 1.9, 1.6, 0.5, 0.5, count, "creative.bullet_number",
+                       fill=color)
     
-    # Risk card
-    card = slide12.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(x), Inches(y),
-                                     Inches(4.3), Inches(1.8))
-    card.fill.solid()
-    card.fill.fore_color.rgb = RGBColor(254, 242, 242)
-    card.line.color.rgb = PRIMARY_RED
-    card.line.width = Pt(2)
+        # Responsibility
+        add_text_shape(slide9, MSO_SHAPE.ROUNDED_RECTANGLE, x + 0.2, 4.2, 2.2, 1.8, resp, "creative.resp",
+                       fill=WHITE, line=GOLD, insets=(0.2, 0.2, 0.2, 0), anchor=MSO_ANCHOR.TOP)
+
+    # Total team
+    add_text_shape(slide9, MSO_SHAPE.ROUNDED_RECTANGLE, 3, 6.5, 4, 0.5, "🚀 Total Team: 3 Members (Diagnostic Phase)",
+                   "creative.total", fill=PRIMARY_RED)
+
+    # ============ SLIDE 10 — Gantt (Visual Bars) ============
+    slide10 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide10)
+    add_decorative_footer(slide10)
+
+    add_title_with_icon(slide10, "Project Timeline (Gantt View)", MSO_SHAPE.RECTANGLE)
+
+    # Gantt chart
+    weeks = ["W0", "W1", "W2", "W3", "W4"]
+    tasks = [
+        ("Setup & Access", 0, 1, PRIMARY_RED),
+        ("Profiling & Analysis", 1, 1, ORANGE),
+        ("RCA & Observations", 2, 1, GOLD),
+        ("Discussions & Validation", 3, 1, RGBColor(34, 197, 94)),
+        ("Final Report", 4, 1, RGBColor(59, 130, 246))
+    ]
+
+    # Week headers
+    for i, week in enumerate(weeks):
+        add_text_shape(slide10, MSO_SHAPE.ROUNDED_RECTANGLE, 4 + i * 1.15, 1.5, 1.05, 0.5, week, "creative.gantt_week",
+                       fill=DEEP_RED)
+
+    # Task bars
+    y_pos = 2.3
+    for task_name, start, duration, color in tasks:
+        # Task label
+        label = slide10.shapes.add_textbox(Inches(0.3), Inches(y_pos), Inches(3.5), Inches(0.5))
+        tf = label.text_frame
+        set_text(tf, task_name, "creative.text")
     
-    # Warning stripe
-    stripe = slide12.shapes.add_shape(MSO_SHAPE.RECTANGLE,
-                                       Inches(x), Inches(y),
-                                       Inches(0.15), Inches(1.8))
-    stripe.fill.solid()
-    stripe.fill.fore_color.rgb = ORANGE
-    stripe.line.fill.background()
+        # Bar
+        bar = slide10.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                        Inches(4 + start * 1.15), Inches(y_pos + 0.05),
+                                        Inches(duration * 1.05), Inches(0.4))
+        bar.fill.solid()
+        bar.fill.fore_color.rgb = color
+        bar.line.color.rgb = WHITE
+        bar.line.width = Pt(2)
     
-    # Icon
-    icon_box = slide12.shapes.add_textbox(Inches(x + 0.25), Inches(y + 0.1), Inches(0.6), Inches(0.6))
-    tf = icon_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = icon
-    p.font.size = Pt(24)
+        y_pos += 0.7
+
+    # Milestones
+    milestones = [
+        (4.55, "Kickoff"),
+        (5.7, "Data Ready"),
+        (6.85, "Findings"),
+        (8.0, "Validation"),
+        (9.15, "Delivery")
+    ]
+
+    for x, label in milestones:
+        # Diamond marker
+        diamond = slide10.shapes.add_shape(MSO_SHAPE.DIAMOND,
+                                            Inches(x - 0.1), Inches(6.0),
+                                            Inches(0.2), Inches(0.2))
+        diamond.fill.solid()
+        diamond.fill.fore_color.rgb = GOLD
+        diamond.line.fill.background()
     
-    # Title
-    title_box = slide12.shapes.add_textbox(Inches(x + 0.9), Inches(y + 0.15), Inches(3.2), Inches(0.4))
-    tf = title_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(13)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
+        # Label
+        m_label = slide10.shapes.add_textbox(Inches(x - 0.4), Inches(6.3), Inches(0.8), Inches(0.4))
+        tf = m_label.text_frame
+        set_text(tf, label, "creative.milestone")
+
+    # ============ SLIDE 11 — Commercial (Visual Pricing) ============
+    slide11 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide11)
+    add_decorative_footer(slide11)
+
+    add_title_with_icon(slide11, "Investment Structure", MSO_SHAPE.OVAL)
+
+    # Phase boxes - side by side
+    # Diagnostic Phase
+    diag_box = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                         Inches(0.5), Inches(1.6),
+                                         Inches(4.4), Inches(4.8))
+    diag_box.fill.solid()
+    diag_box.fill.fore_color.rgb = RGBColor(254, 242, 242)
+    diag_box.line.color.rgb = PRIMARY_RED
+    diag_box.line.width = Pt(3)
+
+    # Header
+    add_text_shape(slide11, MSO_SHAPE.RECTANGLE, 0.5, 1.6, 4.4, 0.8, "🔍 DIAGNOSTIC PHASE", "creative.panel_header",
+                   fill=PRIMARY_RED)
+
+    # Duration badge
+    add_text_shape(slide11, MSO_SHAPE.ROUNDED_RECTANGLE, 1.8, 2.55, 1.8, 0.5, "⏱ 4 WEEKS", "creative.pill",
+                   fill=BRIGHT_YELLOW)
+
+    # Features
+    diag_features = [
+        "✓ Fixed fee structure",
+        "✓ 4-5 resources (1 month FTE)",
+        "✓ Comprehensive analysis",
+        "✓ Root cause documentation",
+        "✓ Release advisory report"
+    ]
+    y = 3.2
+    for feat in diag_features:
+        feat_box = slide11.shapes.add_textbox(Inches(0.8), Inches(y), Inches(3.8), Inches(0.4))
+        tf = feat_box.text_frame
+        set_text(tf, feat, "creative.text")
+        y += 0.5
+
+    # Execution Phase
+    exec_box = slide11.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                         Inches(5.1), Inches(1.6),
+                                         Inches(4.4), Inches(4.8))
+    exec_box.fill.solid()
+    exec_box.fill.fore_color.rgb = RGBColor(255, 251, 235)
+    exec_box.line.color.rgb = GOLD
+    exec_box.line.width = Pt(3)
+
+    add_text_shape(slide11, MSO_SHAPE.RECTANGLE, 5.1, 1.6, 4.4, 0.8, "🚀 EXECUTION PHASE", "creative.panel_header",
+                   fill=GOLD)
+
+
+    add_text_shape(slide11, MSO_SHAPE.ROUNDED_RECTANGLE, 6.4, 2.55, 1.8, 0.5, "📋 TBD", "creative.pill",
+                   fill=ORANGE, color=WHITE)
+
+    exec_features = [
+        "⏳ Estimation post-diagnostic",
+        "⏳ Dependent on fixable scope",
+        "⏳ Detailed sprint planning",
+        "⏳ Resource allocation",
+        "⏳ Timeline confirmation"
+    ]
+    y = 3.2
+    for feat in exec_features:
+        feat_box = slide11.shapes.add_textbox(Inches(5.4), Inches(y), Inches(3.8), Inches(0.4))
+        tf = feat_box.text_frame
+        set_text(tf, feat, "creative.text")
+        y += 0.5
+
+    # Arrow between
+    arrow = slide11.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW,
+                                      Inches(4.7), Inches(3.5),
+                                      Inches(0.6), Inches(0.4))
+    arrow.fill.solid()
+    arrow.fill.fore_color.rgb = PRIMARY_RED
+    arrow.line.fill.background()
+
+    # ============ SLIDE 12 — Risks (Visual Warning) ============
+    slide12 = prs.slides.add_slide(prs.slide_layouts[6])
+    add_gradient_header(slide12)
+    add_decorative_footer(slide12)
+
+    add_title_with_icon(slide12, "Risk Factors & Dependencies", MSO_SHAPE.OVAL)
+
+    risks = [
+        ("⚠️", "Third-Party SDKs", "External SDK behavior may limit optimization options"),
+        ("📡", "CMS Constraints", "Content Management System payload restrictions"),
+        ("⏰", "API Dependencies", "Launch-time API calls blocking user experience"),
+        ("📱", "Device Fragmentation", "Low-RAM device behavior variations"),
+        ("🚀", "Release Maturity", "Current release process capabilities"),
+        ("🔧", "Environment Access", "UAT/Production environment availability")
+    ]
+
+    positions = [(0.5, 1.6), (5.2, 1.6), (0.5, 3.6), (5.2, 3.6), (0.5, 5.6), (5.2, 5.6)]
+
+    for i, (icon, title, desc) in enumerate(risks):
+        x, y = positions[i]
     
-    # Description
-    desc_box = slide12.shapes.add_textbox(Inches(x + 0.25), Inches(y + 0.75), Inches(3.9), Inches(0.9))
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(10)
-    p.font.color.rgb = DARK_GRAY
-
-# ============ SLIDE 13 — Final Outcome (Celebration) ============
-slide13 = prs.slides.add_slide(prs.slide_layouts[6])
-
-# Gradient background
-bg_top = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(10), Inches(4))
-bg_top.fill.solid()
-bg_top.fill.fore_color.rgb = PRIMARY_RED
-bg_top.line.fill.background()
-
-bg_bottom = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, Inches(4), Inches(10), Inches(3.5))
-bg_bottom.fill.solid()
-bg_bottom.fill.fore_color.rgb = CREAM
-bg_bottom.line.fill.background()
-
-# Yellow wave
-wave2 = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(-1), Inches(3.6), Inches(12), Inches(0.5))
-wave2.fill.solid()
-wave2.fill.fore_color.rgb = BRIGHT_YELLOW
-wave2.line.fill.background()
-
-add_decorative_footer(slide13)
-
-# Title
-final_title = slide13.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(1))
-tf = final_title.text_frame
-p = tf.paragraphs[0]
-p.text = "🎯 Final Deliverables"
-p.font.size = Pt(38)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Subtitle
-final_sub = slide13.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(0.5))
-tf = final_sub.text_frame
-p = tf.paragraphs[0]
-p.text = "Your comprehensive, data-backed performance roadmap"
-p.font.size = Pt(16)
-p.font.color.rgb = CREAM
-p.alignment = PP_ALIGN.CENTER
-
-# Deliverable cards
-deliverables = [
-    ("✅", "Improvement Plan", "What CAN be improved with estimated impact"),
-    ("❌", "Constraints Doc", "What CANNOT be improved & why (SDK/CMS limits)"),
-    ("📈", "Uplift Range", "Expected performance gains per optimization area"),
-    ("👥", "Execution Plan", "Team structure & timeline for implementation"),
-    ("📅", "Release Readiness", "Monthly release train feasibility assessment")
-]
-
-x_positions = [0.4, 2.1, 3.8, 5.5, 7.2]
-for i, (icon, title, desc) in enumerate(deliverables):
-    x = x_positions[i]
+        # Risk card
+        card = slide12.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
+                                         Inches(x), Inches(y),
+                                         Inches(4.3), Inches(1.8))
+        card.fill.solid()
+        card.fill.fore_color.rgb = RGBColor(254, 242, 242)
+        card.line.color.rgb = PRIMARY_RED
+        card.line.width = Pt(2)
     
-    # Card
-    card = slide13.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                     Inches(x), Inches(2.2),
-                                     Inches(1.5), Inches(2.3))
-    card.fill.solid()
-    card.fill.fore_color.rgb = WHITE
-    card.line.color.rgb = GOLD
-    card.line.width = Pt(2)
+        # Warning stripe
+        stripe = slide12.shapes.add_shape(MSO_SHAPE.RECTANGLE,
+                                           Inches(x), Inches(y),
+                                           Inches(0.15), Inches(1.8))
+        stripe.fill.solid()
+        stripe.fill.fore_color.rgb = ORANGE
+        stripe.line.fill.background()
     
-    # Shadow effect
-    shadow = slide13.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                       Inches(x + 0.05), Inches(2.25),
-                                       Inches(1.5), Inches(2.3))
-    shadow.fill.solid()
-    shadow.fill.fore_color.rgb = RGBColor(0, 0, 0)
-    shadow.line.fill.background()
-    # Move shadow behind (would need to reorder, visual only)
+        # Icon
+        icon_box = slide12.shapes.add_textbox(Inches(x + 0.25), Inches(y + 0.1), Inches(0.6), Inches(0.6))
+        tf = icon_box.text_frame
+        set_text(tf, icon, "creative.icon")
     
-    # Icon
-    icon_box = slide13.shapes.add_textbox(Inches(x + 0.5), Inches(2.4), Inches(0.5), Inches(0.5))
-    tf = icon_box.text_frame
-    p = tf.paragraphs[0]
-    p.text = icon
-    p.font.size = Pt(28)
+        # Title
+        title_box = slide12.shapes.add_textbox(Inches(x + 0.9), Inches(y + 0.15), Inches(3.2), Inches(0.4))
+        tf = title_box.text_frame
+        set_text(tf, title, "creative.item_title")
     
+        # Description
+        desc_box = slide12.shapes.add_textbox(Inches(x + 0.25), Inches(y + 0.75), Inches(3.9), Inches(0.9))
+        tf = desc_box.text_frame
+        tf.word_wrap = True
+        set_text(tf, desc, "creative.desc")
+
+    # ============ SLIDE 13 — Final Outcome (Celebration) ============
+    slide13 = prs.slides.add_slide(prs.slide_layouts[6])
+
+    # Gradient background
+    bg_top = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(10), Inches(4))
+    bg_top.fill.solid()
+    bg_top.fill.fore_color.rgb = PRIMARY_RED
+    bg_top.line.fill.background()
+
+    bg_bottom = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, Inches(4), Inches(10), Inches(3.5))
+    bg_bottom.fill.solid()
+    bg_bottom.fill.fore_color.rgb = CREAM
+    bg_bottom.line.fill.background()
+
+    # Yellow wave
+    wave2 = slide13.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(-1), Inches(3.6), Inches(12), Inches(0.5))
+    wave2.fill.solid()
+    wave2.fill.fore_color.rgb = BRIGHT_YELLOW
+    wave2.line.fill.background()
+
+    add_decorative_footer(slide13)
+
     # Title
-    title_box = slide13.shapes.add_textbox(Inches(x + 0.1), Inches(2.95), Inches(1.3), Inches(0.7))
-    tf = title_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = title
-    p.font.size = Pt(10)
-    p.font.bold = True
-    p.font.color.rgb = DEEP_RED
-    p.alignment = PP_ALIGN.CENTER
-    
-    # Desc
-    desc_box = slide13.shapes.add_textbox(Inches(x + 0.1), Inches(3.6), Inches(1.3), Inches(0.8))
-    tf = desc_box.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = desc
-    p.font.size = Pt(8)
-    p.font.color.rgb = DARK_GRAY
-    p.alignment = PP_ALIGN.CENTER
-
-# Closing statement
-closing = slide13.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE,
-                                    Inches(1), Inches(5.0),
-                                    Inches(8), Inches(1.0))
-closing.fill.solid()
-closing.fill.fore_color.rgb = PRIMARY_RED
-closing.line.fill.background()
-
-closing_text = slide13.shapes.add_textbox(Inches(1), Inches(5.3), Inches(8), Inches(0.6))
-tf = closing_text.text_frame
-p = tf.paragraphs[0]
-p.text = "🚀 North Star Aligned • Data-Backed • Feasible & Actionable"
-p.font.size = Pt(16)
-p.font.bold = True
-p.font.color.rgb = WHITE
-p.alignment = PP_ALIGN.CENTER
-
-# Save with timestamp
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-output_name = f'XYZ_Mobile_App_Diagnostic_Creative_{timestamp}.pptx'
-output_path = f'/Users/Mudassar.Hakim/tempfiles/{output_name}'
-
-prs.save(output_path)
-print(f"🎨 Creative presentation created successfully: {output_name}")
-print(f"📊 Features: Infographics, visual timelines, team cards, benchmark grids")
+    final_title = slide13.shapes.add_textbox(Inches(0.5), Inches(0.4), Inches(9), Inches(1))
+    tf = final_title.text_frame
+    set_text(tf, "🎯 Final Deliverables", "creative.closing_title")
+
+    # Subtitle
+    final_sub = slide13.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(0.5))
+    tf = final_sub.text_frame
+    set_text(tf, "Your comprehensive, data-backed performance roadmap", "creative.closing_subtitle")
+
+    # Deliverable cards
+    deliverables = [
+        ("✅", "Improvement Plan", "What CAN be improved with estimated impact"),
+        ("❌", "Constraints Doc", "What CANNOT be improved & why (SDK/CMS limits)"),
+        ("📈", "Uplift Range", "Expected performance gains per optimization area"),
+        ("👥", "Execution Plan", "Team structure & timeline for implementation"),
+        ("📅", "Release Readiness", "Monthly release train feasibility assessment")
+    ]
+
+    x_positions = [0.4, 2.1, 3.8, 5.5, 7.2]
+    for x, (icon, title, desc) in zip(x_positions, deliverables):
+        OUTCOME_TILE.add(slide13, x, 2.2, icon=icon, title=title, desc=desc)
+
+    # Closing statement
+    add_text_shape(slide13, MSO_SHAPE.ROUNDED_RECTANGLE, 1, 5.0, 8, 1.0,
+                   "🚀 North Star Aligned • Data-Backed • Feasible & Actionable", "creative.closing", fill=PRIMARY_RED)
+    return prs
+
+
+def render(stream):
+    """Build the deck and write the .pptx package to a binary stream"""
+    return write_presentation(build_presentation(), stream)
+
+def render_bytes():
+    """Build the deck and return the .pptx package as a memoryview"""
+    return presentation_bytes(build_presentation())
+
+if __name__ == "__main__":
+    # Save with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_name = f'XYZ_Mobile_App_Diagnostic_Creative_{timestamp}.pptx'
+    output_path = f'/Users/Mudassar.Hakim/tempfiles/{output_name}'
+
+    save_presentation(build_presentation(), output_path)
+    print(f"🎨 Creative presentation created successfully: {output_name}")
+    print(f"📊 Features: Infographics, visual timelines, team cards, benchmark grids")
@@ -0,0 +1,93 @@
+"""
+Async Deck Rendering
+asyncio-native render API that keeps slide construction and zip compression off the event loop
+
+    renderer = AsyncRenderer(executor="process", max_workers=4, max_concurrency=8)
+    data = await renderer.render_deck(spec, "consulting", timeout=30)
+
+or, with the shared default renderer:
+
+    data = await render_deck(spec, "creative")
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from deck_spec import deck_bytes, warm_themes
+
+
+class AsyncRenderer:
+    """Runs deck builds in a thread or process executor with bounded concurrency"""
+
+    def __init__(self, executor="thread", max_workers=None, max_concurrency=4, timeout=None):
+        if isinstance(executor, Executor):
+            self._executor = executor
+            self._owns_executor = False
+        elif executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="deck-render")
+            self._owns_executor = True
+        elif executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=warm_themes)
+            self._owns_executor = True
+        else:
+            raise ValueError(f"executor must be 'thread', 'process' or an Executor, not {executor!r}")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def render_deck(self, spec, theme, timeout=None):
+        """Render a spec (or the theme's built-in deck) to .pptx bytes
+
+        Raises TimeoutError when the job exceeds `timeout` seconds (falling back
+        to the renderer default). A cancelled or timed-out job that has not
+        started yet is dropped from the executor; one that is already running
+        keeps its concurrency slot until it actually finishes, so cancellations
+        cannot be used to exceed max_concurrency.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        await self._semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            job = self._executor.submit(deck_bytes, spec, theme)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        job.add_done_callback(lambda _: self._release_from(loop))
+        return await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+
+    def _release_from(self, loop):
+        # Executor callbacks run on worker/manager threads
+        try:
+            loop.call_soon_threadsafe(self._semaphore.release)
+        except RuntimeError:
+            pass  # event loop already closed
+
+    def close(self, wait=True):
+        """Shut down the executor if this renderer created it"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+_default_renderer = None
+
+
+def configure(executor="thread", max_workers=None, max_concurrency=4, timeout=None):
+    """Replace the shared renderer used by the module-level render_deck()"""
+    global _default_renderer
+    if _default_renderer is not None:
+        _default_renderer.close(wait=False)
+    _default_renderer = AsyncRenderer(executor, max_workers, max_concurrency, timeout)
+    return _default_renderer
+
+
+async def render_deck(spec, theme, timeout=None):
+    """Render a deck to .pptx bytes on the shared renderer without blocking the event loop"""
+    if _default_renderer is None:
+        configure()
+    return await _default_renderer.render_deck(spec, theme, timeout)
@@ -0,0 +1,88 @@
+"""
+Deck Budgets
+Per-slide and per-deck limits on shape count and serialized slide XML, checked at save time
+
+    python deckgen.py render --theme creative --max-shapes 60 --max-slide-kb 40
+    python deckgen.py batch --theme all --budget budgets.json
+
+A budget file is a JSON object with any of the Budget fields, e.g.
+{"max_shapes": 60, "max_slide_bytes": 40000, "max_deck_bytes": 400000}.
+"""
+import json
+from collections import namedtuple
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+Budget = namedtuple(
+    "Budget", "max_shapes max_slide_bytes max_deck_shapes max_deck_bytes",
+    defaults=(None, None, None, None),
+)
+SlideUsage = namedtuple("SlideUsage", "slide shapes xml_bytes")
+
+SHAPE_TAGS = tuple(qn(tag) for tag in ("p:sp", "p:pic", "p:grpSp", "p:graphicFrame", "p:cxnSp"))
+
+
+class BudgetExceededError(ValueError):
+    """Raised when a deck breaks one of its budgets"""
+
+    def __init__(self, violations, usage):
+        self.violations = violations
+        self.usage = usage
+        super().__init__("Deck over budget:\n" + "\n".join(f"  {v}" for v in violations)
+                         + "\n" + format_offenders(usage))
+
+
+def load_budget(path):
+    """Read a Budget from a JSON file"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    unknown = set(data) - set(Budget._fields)
+    if unknown:
+        raise ValueError(f"Unknown budget fields in {path}: {', '.join(sorted(unknown))}")
+    return Budget(**data)
+
+
+def slide_usage(prs):
+    """Shape count and serialized XML size of every slide"""
+    usage = []
+    for number, slide in enumerate(prs.slides, 1):
+        element = slide._element
+        shapes = sum(1 for _ in element.cSld.spTree.iter(*SHAPE_TAGS))
+        xml_bytes = len(etree.tostring(element, encoding="UTF-8", standalone=True))
+        usage.append(SlideUsage(number, shapes, xml_bytes))
+    return usage
+
+
+def budget_violations(usage, budget):
+    """Human-readable descriptions of every broken limit"""
+    violations = []
+    for u in usage:
+        if budget.max_shapes is not None and u.shapes > budget.max_shapes:
+            violations.append(f"slide {u.slide}: {u.shapes} shapes > {budget.max_shapes}")
+        if budget.max_slide_bytes is not None and u.xml_bytes > budget.max_slide_bytes:
+            violations.append(f"slide {u.slide}: {u.xml_bytes:,} XML bytes > {budget.max_slide_bytes:,}")
+    total_shapes = sum(u.shapes for u in usage)
+    total_bytes = sum(u.xml_bytes for u in usage)
+    if budget.max_deck_shapes is not None and total_shapes > budget.max_deck_shapes:
+        violations.append(f"deck: {total_shapes} shapes > {budget.max_deck_shapes}")
+    if budget.max_deck_bytes is not None and total_bytes > budget.max_deck_bytes:
+        violations.append(f"deck: {total_bytes:,} slide XML bytes > {budget.max_deck_bytes:,}")
+    return violations
+
+
+def format_offenders(usage, count=5):
+    """The slides with the most shapes and the most XML"""
+    by_shapes = sorted(usage, key=lambda u: u.shapes, reverse=True)[:count]
+    by_bytes = sorted(usage, key=lambda u: u.xml_bytes, reverse=True)[:count]
+    return ("Most shapes: " + ", ".join(f"slide {u.slide} ({u.shapes})" for u in by_shapes) + "\n"
+            + "Most XML:    " + ", ".join(f"slide {u.slide} ({u.xml_bytes / 1024:.1f} KB)" for u in by_bytes))
+
+
+def check_budget(prs, budget):
+    """Raise BudgetExceededError if the deck breaks `budget`; returns the per-slide usage"""
+    usage = slide_usage(prs)
+    violations = budget_violations(usage, budget)
+    if violations:
+        raise BudgetExceededError(violations, usage)
+    return usage
@@ -0,0 +1,191 @@
+"""
+Structural Deck Diff
+Compare two .pptx decks by slide and shape content rather than XML
+
+    python deckgen.py diff old.pptx new.pptx
+    python deckgen.py diff old.pptx new.pptx --json
+
+Shape IDs and XML ordering are ignored. Slides are paired by a hash of
+their full content first, then by title, then by position; shapes within a
+changed slide are paired by exact signature, then by geometry (a text or
+style edit), then by text (a move or resize). Every pairing pass is a dict
+lookup, so the diff is linear in the number of slides and shapes apart from
+one O(n log n) longest-increasing-run pass that tells moved slides from
+ones that only shifted.
+"""
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+
+from render_plan import EMU_PER_PT, plan_deck
+
+
+def _text_key(shape):
+    if shape.text is None:
+        return None
+    return tuple((p.text, p.size, p.bold, p.italic, p.color) for p in shape.text.paragraphs)
+
+
+def _geometry_key(shape):
+    return shape.geometry, shape.x, shape.y, shape.w, shape.h
+
+
+def _signature(shape):
+    return _geometry_key(shape), shape.fill, shape.line, shape.line_width, _text_key(shape)
+
+
+def _plain_text(shape):
+    return "\n".join(p.text for p in shape.text.paragraphs) if shape.text is not None else ""
+
+
+def slide_title(plan):
+    """Text of the slide's largest-font text shape (first wins on ties), or ''"""
+    best, best_size = "", 0
+    for shape in plan.shapes:
+        if shape.text is not None:
+            size = max(p.size for p in shape.text.paragraphs)
+            if size > best_size:
+                best, best_size = _plain_text(shape), size
+    return best.split("\n")[0]
+
+
+def _pair(old_items, new_items, key):
+    """Pair items with equal keys in order; returns (pairs, unmatched_old, unmatched_new)"""
+    index = defaultdict(deque)
+    for item in old_items:
+        index[key(item)].append(item)
+    pairs, unmatched_new = [], []
+    for item in new_items:
+        bucket = index.get(key(item))
+        if bucket:
+            pairs.append((bucket.popleft(), item))
+        else:
+            unmatched_new.append(item)
+    paired_old = {id(old) for old, _ in pairs}
+    return pairs, [item for item in old_items if id(item) not in paired_old], unmatched_new
+
+
+def _shape_ref(shape):
+    return {
+        "name": shape.name,
+        "geometry": shape.geometry,
+        "box_in": [round(v / EMU_PER_PT / 72, 2) for v in (shape.x, shape.y, shape.w, shape.h)],
+        "text": _plain_text(shape),
+    }
+
+
+def diff_shapes(old_shapes, new_shapes):
+    """Shape-level changes between two slides"""
+    _, old_rest, new_rest = _pair(old_shapes, new_shapes, _signature)
+    by_geometry, old_rest, new_rest = _pair(old_rest, new_rest, _geometry_key)
+    # Shapes without text never pair by text: id() keys are unique
+    by_text, old_rest, new_rest = _pair(old_rest, new_rest, lambda s: _text_key(s) or id(s))
+
+    changes = []
+    for old, new in by_geometry:
+        if _text_key(old) != _text_key(new):
+            changes.append({"change": "text", "shape": _shape_ref(new),
+                            "old_text": _plain_text(old), "new_text": _plain_text(new)})
+        else:
+            changes.append({"change": "style", "shape": _shape_ref(new),
+                            "old": {"fill": old.fill, "line": old.line, "line_width": old.line_width},
+                            "new": {"fill": new.fill, "line": new.line, "line_width": new.line_width}})
+    for old, new in by_text:
+        changes.append({"change": "moved", "shape": _shape_ref(new), "old_box_in": _shape_ref(old)["box_in"]})
+    changes.extend({"change": "removed", "shape": _shape_ref(s)} for s in old_rest)
+    changes.extend({"change": "added", "shape": _shape_ref(s)} for s in new_rest)
+    return changes
+
+
+def _slide_key(plan):
+    # Order-insensitive multiset of shape signatures
+    return frozenset(Counter(_signature(s) for s in plan.shapes).items())
+
+
+def _in_order(pairs):
+    """ids of the new plans in the longest run of pairs that kept their relative order"""
+    pairs = sorted(pairs, key=lambda pair: pair[1].index)
+    tails, tail_pos, parent = [], [], [None] * len(pairs)
+    for i, (old, _) in enumerate(pairs):
+        pos = bisect_left(tails, old.index)
+        if pos == len(tails):
+            tails.append(old.index)
+            tail_pos.append(i)
+        else:
+            tails[pos] = old.index
+            tail_pos[pos] = i
+        parent[i] = tail_pos[pos - 1] if pos else None
+    kept = set()
+    i = tail_pos[-1] if tail_pos else None
+    while i is not None:
+        kept.add(id(pairs[i][1]))
+        i = parent[i]
+    return kept
+
+
+def diff_plans(old_plans, new_plans):
+    """Slide- and shape-level differences between two lists of slide plans"""
+    keys = {id(p): _slide_key(p) for p in (*old_plans, *new_plans)}
+    identical, old_rest, new_rest = _pair(old_plans, new_plans, lambda p: keys[id(p)])
+    by_title, old_rest, new_rest = _pair(old_rest, new_rest, slide_title)
+    by_position, old_rest, new_rest = _pair(old_rest, new_rest, lambda p: p.index)
+
+    # Slides that merely shifted because others were added or removed are not "moved"
+    kept = _in_order(identical)
+    slides = []
+    for old, new in identical:
+        if id(new) not in kept:
+            slides.append({"change": "moved", "old": old.index + 1, "new": new.index + 1, "title": slide_title(new)})
+    for old, new in by_title + by_position:
+        slides.append({"change": "modified", "old": old.index + 1, "new": new.index + 1,
+                       "title": slide_title(new), "shapes": diff_shapes(old.shapes, new.shapes)})
+    slides.extend({"change": "removed", "old": p.index + 1, "title": slide_title(p)} for p in old_rest)
+    slides.extend({"change": "added", "new": p.index + 1, "title": slide_title(p)} for p in new_rest)
+    slides.sort(key=lambda s: (s.get("new") or s.get("old"), s["change"]))
+    return {
+        "old_slides": len(old_plans),
+        "new_slides": len(new_plans),
+        "unchanged": len(kept),
+        "slides": slides,
+    }
+
+
+def diff_decks(old_path, new_path):
+    """Structural diff of two .pptx files"""
+    from pptx import Presentation
+
+    report = diff_plans(plan_deck(Presentation(old_path)), plan_deck(Presentation(new_path)))
+    report.update(old=old_path, new=new_path)
+    return report
+
+
+def format_diff(report):
+    """Human-readable summary of a diff report"""
+    lines = [f"--- {report['old']} ({report['old_slides']} slides)",
+             f"+++ {report['new']} ({report['new_slides']} slides)"]
+    for slide in report["slides"]:
+        title = f" {slide['title']!r}" if slide["title"] else ""
+        change = slide["change"]
+        if change == "added":
+            lines.append(f"+ slide {slide['new']}{title}")
+        elif change == "removed":
+            lines.append(f"- slide {slide['old']}{title}")
+        elif change == "moved":
+            lines.append(f"~ slide {slide['old']} -> {slide['new']}{title} (moved)")
+        else:
+            where = slide["new"] if slide["old"] == slide["new"] else f"{slide['old']} -> {slide['new']}"
+            lines.append(f"* slide {where}{title}")
+            for shape in slide["shapes"]:
+                ref = shape["shape"]
+                label = ref["name"] or ref["geometry"]
+                if shape["change"] == "text":
+                    lines.append(f"    text   {label}: {shape['old_text']!r} -> {shape['new_text']!r}")
+                elif shape["change"] == "style":
+                    lines.append(f"    style  {label}: {shape['old']} -> {shape['new']}")
+                elif shape["change"] == "moved":
+                    lines.append(f"    moved  {label}: {shape['old_box_in']} -> {ref['box_in']} in")
+                else:
+                    marker = "+" if shape["change"] == "added" else "-"
+                    text = f" {ref['text']!r}" if ref["text"] else ""
+                    lines.append(f"    {marker} {ref['geometry']} at {ref['box_in']} in{text}")
+    lines.append(f"{report['unchanged']} slides unchanged, {len(report['slides'])} with differences")
+    return "\n".join(lines)
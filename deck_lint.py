@@ -0,0 +1,214 @@
+"""
+Layout Linter
+Find colliding text, text spilling out of its card and off-slide geometry
+
+    python deckgen.py lint --theme all
+    python deckgen.py lint build/deck.pptx --ignore off-slide
+
+Every filled shape contributes its geometry box and every text shape the
+box of its laid-out text (render_plan.text_extent), so oversized textboxes
+that only look crowded are not reported. Candidate pairs come from a
+sweep over x whose active boxes are queried by y-range (see _ActiveBoxes),
+so boxes that overlap nothing are never revisited: O(n log n) plus
+O(log n) per overlapping pair on each slide.
+"""
+from bisect import bisect_left, bisect_right
+from heapq import heappop, heappush
+from collections import namedtuple
+
+from render_plan import EMU_PER_PT, plan_deck, text_extent
+
+TOLERANCE_PT = 1.0  # overlaps and overhangs smaller than this are ignored
+
+LintIssue = namedtuple("LintIssue", "slide rule shapes amount_in message")
+_Box = namedtuple("_Box", "left top right bottom z shape is_text")
+
+
+def _boxes(plan):
+    boxes = []
+    for z, shape in enumerate(plan.shapes):
+        if shape.fill:
+            boxes.append(_Box(shape.x / EMU_PER_PT, shape.y / EMU_PER_PT, (shape.x + shape.w) / EMU_PER_PT,
+                              (shape.y + shape.h) / EMU_PER_PT, z, shape, False))
+        if shape.text is not None:
+            extent = text_extent(shape)
+            if extent is not None:
+                boxes.append(_Box(*extent, z, shape, True))
+    return boxes
+
+
+class _ActiveBoxes:
+    """Boxes crossing the sweep line, queried by y-range without visiting boxes outside it
+
+    A segment tree over the slots between distinct y values holds each box in the
+    O(log n) nodes covering its span (for "which boxes span y"), and a count tree over
+    the sorted top edges finds the boxes whose top lies in a range. Insert and remove
+    cost O(log n); a query costs O(log n) plus O(log n) per box reported.
+    """
+
+    def __init__(self, boxes):
+        self.ys = sorted({y for box in boxes for y in (box.top, box.bottom)})
+        self.tops = sorted({box.top for box in boxes})
+        self._span_size = 1 << max(len(self.ys) - 1, 1).bit_length()
+        self._spans = {}  # segment tree node -> set of box indices covering it
+        self._top_size = 1 << max(len(self.tops), 1).bit_length()
+        self._counts = [0] * (2 * self._top_size)
+        self._at_top = {}  # top rank -> set of box indices
+
+    def _span_nodes(self, box):
+        lo = bisect_left(self.ys, box.top) + self._span_size
+        hi = bisect_left(self.ys, box.bottom) + self._span_size
+        while lo < hi:
+            if lo & 1:
+                yield lo
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                yield hi
+            lo >>= 1
+            hi >>= 1
+
+    def _count(self, rank, delta):
+        node = rank + self._top_size
+        while node:
+            self._counts[node] += delta
+            node >>= 1
+
+    def add(self, i, box):
+        for node in self._span_nodes(box):
+            self._spans.setdefault(node, set()).add(i)
+        rank = bisect_left(self.tops, box.top)
+        self._at_top.setdefault(rank, set()).add(i)
+        self._count(rank, 1)
+
+    def remove(self, i, box):
+        for node in self._span_nodes(box):
+            self._spans[node].discard(i)
+        rank = bisect_left(self.tops, box.top)
+        self._at_top[rank].discard(i)
+        self._count(rank, -1)
+
+    def spanning(self, y):
+        """Boxes with top <= y < bottom"""
+        slot = bisect_right(self.ys, y) - 1
+        if slot < 0 or slot >= len(self.ys) - 1:
+            return
+        node = slot + self._span_size
+        while node:
+            yield from self._spans.get(node, ())
+            node >>= 1
+
+    def starting_between(self, low, high):
+        """Boxes with low < top < high"""
+        lo, hi = bisect_right(self.tops, low), bisect_left(self.tops, high)
+        stack = [(1, 0, self._top_size)]
+        while stack:
+            node, start, end = stack.pop()
+            if end <= lo or start >= hi or not self._counts[node]:
+                continue
+            if end - start == 1:
+                yield from self._at_top[start]
+                continue
+            mid = (start + end) // 2
+            stack.append((2 * node + 1, mid, end))
+            stack.append((2 * node, start, mid))
+
+
+def _overlapping_pairs(boxes):
+    """Pairs of boxes whose interiors intersect, via a sweep over x"""
+    boxes = sorted(boxes, key=lambda b: b.left)
+    active = _ActiveBoxes(boxes)
+    ending = []  # heap of (right, index) for the active boxes
+    pairs = []
+    for i, box in enumerate(boxes):
+        while ending and ending[0][0] <= box.left + TOLERANCE_PT:
+            _, j = heappop(ending)  # ended left of the sweep line: can never overlap again
+            active.remove(j, boxes[j])
+        low, high = box.top + TOLERANCE_PT, box.bottom - TOLERANCE_PT
+        # An active box overlaps in y if it spans `low` or starts strictly between `low` and `high`
+        for j in active.spanning(low):
+            if boxes[j].top < high:
+                pairs.append((boxes[j], box))
+        for j in active.starting_between(low, high):
+            pairs.append((boxes[j], box))
+        active.add(i, box)
+        heappush(ending, (box.right, i))
+    return pairs
+
+
+def _overhang(inner, outer):
+    """Largest distance in points that `inner` extends past `outer` on any side"""
+    return max(outer.left - inner.left, outer.top - inner.top,
+               inner.right - outer.right, inner.bottom - outer.bottom, 0.0)
+
+
+def _area(box):
+    return max(box.right - box.left, 0.0) * max(box.bottom - box.top, 0.0)
+
+
+def _intersection(a, b):
+    return max(min(a.right, b.right) - max(a.left, b.left), 0.0) * \
+        max(min(a.bottom, b.bottom) - max(a.top, b.top), 0.0)
+
+
+def _label(shape):
+    if shape.text is not None:
+        text = shape.text.paragraphs[0].text
+        return f"{shape.name} {text[:30]!r}"
+    return shape.name
+
+
+def lint_plan(plan, ignore=()):
+    """Layout issues on one slide plan"""
+    slide = plan.index + 1
+    issues = []
+    width, height = plan.width / EMU_PER_PT, plan.height / EMU_PER_PT
+    boxes = _boxes(plan)
+
+    if "off-slide" not in ignore:
+        page = _Box(0.0, 0.0, width, height, -1, None, False)
+        for box in boxes:
+            overhang = _overhang(box, page)
+            if overhang > TOLERANCE_PT:
+                what = "text" if box.is_text else box.shape.geometry
+                issues.append(LintIssue(slide, "off-slide", (box.shape.name,), round(overhang / 72, 2),
+                                        f"{what} of {_label(box.shape)} extends {overhang / 72:.2f} in past the slide"))
+
+    parents = {}  # id(text box) -> (card area, text, card, overhang) for the smallest card it mostly sits on
+    for a, b in _overlapping_pairs(boxes):
+        if a.is_text and b.is_text:
+            if "overlap" not in ignore:
+                first, second = sorted((a, b), key=lambda box: box.z)
+                amount = min(a.right, b.right) - max(a.left, b.left), min(a.bottom, b.bottom) - max(a.top, b.top)
+                issues.append(LintIssue(slide, "overlap", (first.shape.name, second.shape.name),
+                                        round(min(amount) / 72, 2),
+                                        f"text of {_label(first.shape)} and {_label(second.shape)} collide"))
+            continue
+        text, card = (a, b) if a.is_text else (b, a)
+        if not text.is_text or card.z > text.z:
+            continue  # both cards, or the card is drawn over the text (a shape's own text sits on its own fill)
+        if _intersection(text, card) >= 0.5 * _area(text):
+            area = _area(card)
+            if id(text) not in parents or area < parents[id(text)][0]:
+                parents[id(text)] = (area, text, card, _overhang(text, card))
+
+    if "spill" not in ignore:
+        for _, text, card, overhang in parents.values():
+            if overhang > TOLERANCE_PT:
+                issues.append(LintIssue(slide, "spill", (text.shape.name, card.shape.name), round(overhang / 72, 2),
+                                        f"text of {_label(text.shape)} spills {overhang / 72:.2f} in "
+                                        f"outside {card.shape.name}"))
+    return issues
+
+
+def lint_presentation(prs, ignore=()):
+    """Layout issues across every slide of a Presentation"""
+    issues = []
+    for plan in plan_deck(prs):
+        issues.extend(lint_plan(plan, ignore))
+    return issues
+
+
+def format_issues(issues):
+    """One line per issue"""
+    return "\n".join(f"slide {i.slide:>3}  {i.rule:<9}  {i.message}" for i in issues)
@@ -0,0 +1,95 @@
+"""
+Deck Output Helpers
+Stream and in-memory save targets shared by the presentation generators
+"""
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+# Fixed timestamp for reproducible output (zip entries and core properties)
+DETERMINISTIC_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class _FixedTimeZipWriter:
+    """Stand-in for python-pptx's zip writer that stamps every entry with one fixed time"""
+
+    def __init__(self, stream):
+        self._zipf = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._zipf.close()
+
+    def write(self, pack_uri, blob):
+        info = zipfile.ZipInfo(pack_uri.membername, date_time=DETERMINISTIC_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o600 << 16
+        self._zipf.writestr(info, blob)
+
+
+def _write_deterministic(prs, stream):
+    """Save with fixed core-property dates and zip timestamps so identical decks are byte-identical"""
+    from pptx.opc.serialized import PackageWriter
+
+    core = prs.core_properties
+    fixed = datetime(*DETERMINISTIC_DATE_TIME)
+    core.created = fixed
+    core.modified = fixed
+    core.last_printed = fixed
+    core.revision = 1
+
+    package = prs.part.package
+    # Drive PackageWriter's part serialization through our own zip writer;
+    # python-pptx has no public hook for entry timestamps
+    writer = PackageWriter(stream, package._rels, tuple(package.iter_parts()))
+    with _FixedTimeZipWriter(stream) as phys_writer:
+        writer._write_content_types_stream(phys_writer)
+        writer._write_pkg_rels(phys_writer)
+        writer._write_parts(phys_writer)
+
+
+def _check_before_save(prs, overflow=None, budget=None, plans=None):
+    """Run the optional pre-save checks; raises ValueError subclasses on failure"""
+    if budget is not None:
+        from deck_budget import check_budget
+
+        check_budget(prs, budget)
+    if overflow:
+        from text_overflow import check_overflow
+
+        check_overflow(prs, overflow, plans=plans)
+
+
+def write_presentation(prs, stream, deterministic=False, overflow=None, budget=None):
+    """Write the .pptx package to any writable binary stream (file, BytesIO, socket file, pipe)
+
+    `overflow` ('warn' or 'fail') measures every text frame against its box first;
+    `budget` (a deck_budget.Budget) enforces shape and XML size limits.
+    """
+    _check_before_save(prs, overflow, budget)
+    # zipfile falls back to data descriptors when the stream cannot seek,
+    # so pipes and socket files work without buffering the whole deck
+    if deterministic:
+        _write_deterministic(prs, stream)
+    else:
+        prs.save(stream)
+    stream.flush()
+    return stream
+
+
+def presentation_bytes(prs, deterministic=False, overflow=None, budget=None):
+    """Return the finished .pptx package as a memoryview without an extra copy"""
+    buffer = BytesIO()
+    write_presentation(prs, buffer, deterministic, overflow, budget)
+    return buffer.getbuffer()
+
+
+def save_presentation(prs, output_path, deterministic=False, overflow=None, budget=None, plans=None):
+    """Write the .pptx package to a file path; `plans` spares the overflow check re-planning the deck"""
+    # Check before opening so a failed check leaves no truncated file behind
+    _check_before_save(prs, overflow, budget, plans)
+    with open(output_path, "wb") as f:
+        write_presentation(prs, f, deterministic)
+    return output_path
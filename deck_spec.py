@@ -0,0 +1,109 @@
+"""
+Deck Spec Rendering
+Build decks from JSON specs using any of the four generator themes
+
+A spec is a dict (usually loaded from JSON) with a list of slides:
+
+    {"slides": [
+        {"layout": "cover", "title": "XYZ Mobile App", "subtitle": "...",
+         "company": "XYZ Company", "date": "January 2026"},
+        {"layout": "content", "title": "Assumptions", "bullets": ["...", "..."]}
+    ]}
+
+Each slide's fields are passed to the theme's layout function from its
+SPEC_LAYOUTS table. A missing or empty spec renders the theme's built-in deck.
+"""
+import importlib
+import json
+from functools import lru_cache
+from io import BytesIO
+
+# Theme name -> generator module
+THEMES = {
+    "classic": "create_presentation",
+    "creative": "create_creative_presentation",
+    "professional": "create_professional_presentation",
+    "consulting": "create_consulting_presentation",
+}
+
+
+def load_theme(theme):
+    """Import and return the generator module for a theme name"""
+    if theme not in THEMES:
+        raise ValueError(f"Unknown theme {theme!r}; expected one of: {', '.join(THEMES)}")
+    return importlib.import_module(THEMES[theme])
+
+
+def load_spec(path):
+    """Read a deck spec from a JSON file"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def template_blob():
+    """Blank 10x7.5in template package, built once per process"""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def new_presentation():
+    """Open a fresh Presentation from the cached template"""
+    from pptx import Presentation
+
+    return Presentation(BytesIO(template_blob()))
+
+
+def warm_themes():
+    """Import every theme module and build the cached template (worker initializer)"""
+    for theme in THEMES:
+        load_theme(theme)
+    template_blob()
+
+
+def add_spec_slide(prs, module, slide_spec):
+    """Add one spec slide to prs using the theme module's layout table"""
+    fields = dict(slide_spec)
+    layout = fields.pop("layout", "content")
+    layouts = module.SPEC_LAYOUTS
+    if layout not in layouts:
+        raise ValueError(f"Layout {layout!r} is not available in {module.__name__}; "
+                         f"expected one of: {', '.join(layouts)}")
+    try:
+        return layouts[layout](prs, **fields)
+    except TypeError as e:
+        raise ValueError(f"Invalid fields for layout {layout!r}: {e}") from None
+
+
+def build_deck(spec, theme):
+    """Build a Presentation from a spec, or the theme's built-in deck when spec is empty"""
+    module = load_theme(theme)
+    if not spec:
+        return module.build_presentation(new_presentation())
+    slides = spec.get("slides")
+    if not isinstance(slides, list):
+        raise ValueError("Deck spec must contain a 'slides' list")
+    import shape_ids
+    import slide_append
+
+    prs = new_presentation()
+    with shape_ids.tracking(), slide_append.tracking():
+        for slide_spec in slides:
+            if not isinstance(slide_spec, dict):
+                raise ValueError(f"Each slide in a deck spec must be an object, not {slide_spec!r}")
+            add_spec_slide(prs, module, slide_spec)
+    return prs
+
+
+def deck_bytes(spec, theme, deterministic=False):
+    """Build a deck and return the finished .pptx package as bytes"""
+    from deck_output import presentation_bytes
+
+    return bytes(presentation_bytes(build_deck(spec, theme), deterministic))
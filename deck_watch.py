@@ -0,0 +1,241 @@
+"""
+Deck Watch Mode
+Rebuild a deck whenever its spec file changes, re-rendering only the slides that changed
+
+    python deckgen.py watch proposal.json --theme consulting --out build/proposal.pptx
+
+Changes are picked up through inotify on Linux, falling back to mtime
+polling elsewhere, and debounced so an editor's save burst triggers a
+single rebuild.
+"""
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from collections import defaultdict, deque
+
+import shape_ids
+import slide_append
+from deck_spec import add_spec_slide, load_spec, load_theme, new_presentation
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding for inotify directory watches"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+
+    def add_watch(self, directory):
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def read(self, timeout):
+        """Paths touched within `timeout` seconds (empty list on timeout)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self._dirs and name:
+                paths.append(os.path.join(self._dirs[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class SpecWatcher:
+    """Watches a set of files, via inotify when available and mtime polling otherwise"""
+
+    def __init__(self, paths, poll_interval=0.25, force_poll=False):
+        self.paths = {os.path.abspath(p) for p in paths}
+        self.poll_interval = poll_interval
+        self._inotify = None
+        if not force_poll and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+                # Watch parent directories: editors often save by renaming a temp file over the original
+                for directory in {os.path.dirname(p) for p in self.paths}:
+                    self._inotify.add_watch(directory)
+            except (OSError, AttributeError):
+                self._inotify = None
+        self._stamps = {p: self._stamp(p) for p in self.paths}
+
+    @property
+    def backend(self):
+        return "inotify" if self._inotify else "polling"
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _poll(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                stamp = self._stamp(path)
+                if stamp != self._stamps[path]:
+                    self._stamps[path] = stamp
+                    changed.add(path)
+            if changed or time.monotonic() >= deadline:
+                return changed
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def _read(self, timeout):
+        if self._inotify is None:
+            return self._poll(timeout)
+        return {p for p in self._inotify.read(timeout) if p in self.paths}
+
+    def wait(self, debounce=0.15, timeout=None):
+        """Block until a watched file changes, then until it is quiet for `debounce` seconds"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = set()
+        while not changed:
+            # Events for other files in the watched directories (an editor's temp file) come back empty
+            remaining = 3600 if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return changed
+            changed = self._read(remaining)
+        while True:
+            more = self._read(debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+
+
+class IncrementalRenderer:
+    """Keeps a built Presentation warm and rebuilds only the spec slides that changed
+
+    Slides are matched by a fingerprint of their spec entry, so unchanged
+    slides are kept (and simply reordered when slides are inserted or moved);
+    only new or edited entries go through the theme's layout functions.
+    """
+
+    def __init__(self, theme):
+        self.theme = theme
+        self.module = load_theme(theme)
+        self.prs = None
+        self._fingerprints = []
+
+    def update(self, spec):
+        """Apply a spec; returns the indexes of the slides that were (re)built"""
+        slides = spec.get("slides") if isinstance(spec, dict) else None
+        if not isinstance(slides, list):
+            raise ValueError("Deck spec must contain a 'slides' list")
+        fingerprints = [json.dumps(s, sort_keys=True) for s in slides]
+        try:
+            with shape_ids.tracking(), slide_append.tracking():
+                if self.prs is None:
+                    self.prs = new_presentation()
+                    for slide_spec in slides:
+                        add_spec_slide(self.prs, self.module, slide_spec)
+                    rebuilt = list(range(len(slides)))
+                else:
+                    rebuilt = self._apply(slides, fingerprints)
+        except Exception:
+            # A half-applied update leaves the deck inconsistent; start fresh next time
+            self.prs = None
+            self._fingerprints = []
+            raise
+        self._fingerprints = fingerprints
+        return rebuilt
+
+    def _apply(self, slides, fingerprints):
+        prs = self.prs
+        sldIdLst = prs.slides._sldIdLst
+        reusable = defaultdict(deque)
+        for fingerprint, sldId in zip(self._fingerprints, list(sldIdLst)):
+            reusable[fingerprint].append(sldId)
+
+        order, rebuilt = [], []
+        for index, (fingerprint, slide_spec) in enumerate(zip(fingerprints, slides)):
+            if reusable[fingerprint]:
+                order.append(reusable[fingerprint].popleft())
+            else:
+                add_spec_slide(prs, self.module, slide_spec)
+                order.append(sldIdLst[-1])
+                rebuilt.append(index)
+
+        # Rebuild the slide list in its new order, then drop slides no longer referenced
+        for sldId in list(sldIdLst):
+            sldIdLst.remove(sldId)
+        for sldId in order:
+            sldIdLst.append(sldId)
+        for stale in reusable.values():
+            for sldId in stale:
+                prs.part.drop_rel(sldId.rId)
+        prs.part.rename_slide_parts([sldId.rId for sldId in order])
+        # python-pptx caches each relationship's target partname the first time the deck
+        # is saved; drop the cached values so the renamed partnames are written out
+        for rel in prs.part.rels.values():
+            rel.__dict__.pop("target_partname", None)
+            rel.__dict__.pop("target_ref", None)
+        return rebuilt
+
+
+def watch(spec_path, theme, output_path, debounce=0.15, force_poll=False, deterministic=False):
+    """Build once, then rebuild changed slides and save on every spec change until interrupted"""
+    from deck_output import save_presentation
+
+    renderer = IncrementalRenderer(theme)
+    watcher = SpecWatcher([spec_path], force_poll=force_poll)
+    print(f"Watching {spec_path} ({watcher.backend}) -> {output_path}")
+
+    def rebuild():
+        started = time.perf_counter()
+        try:
+            rebuilt = renderer.update(load_spec(spec_path))
+        except Exception as e:  # keep watching through half-finished edits
+            print(f"✗ {spec_path}: {e}")
+            return
+        rendered = time.perf_counter()
+        save_presentation(renderer.prs, output_path, deterministic)
+        done = time.perf_counter()
+        slides = ", ".join(str(i + 1) for i in rebuilt) or "none"
+        print(f"↻ rebuilt slides [{slides}] of {len(renderer.prs.slides)} in "
+              f"{(done - started) * 1000:.0f} ms "
+              f"(render {(rendered - started) * 1000:.0f} ms, save {(done - rendered) * 1000:.0f} ms)")
+
+    rebuild()
+    try:
+        while True:
+            watcher.wait(debounce)
+            rebuild()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
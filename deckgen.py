@@ -0,0 +1,564 @@
+"""
+deckgen - command-line front end for the presentation generators
+
+    python deckgen.py render --theme creative --out build/
+    python deckgen.py render --spec proposal.json --theme consulting --deterministic
+    python deckgen.py batch specs/*.json --theme all --jobs 4 --out build/
+    python deckgen.py bench --theme all --repeat 5
+    python deckgen.py bench --suite all --history bench_history.json
+    python deckgen.py bench compare --baseline bench_baseline.json
+    python deckgen.py inspect build/deck.pptx
+    python deckgen.py diff old.pptx new.pptx
+    python deckgen.py lint --theme all
+    python deckgen.py watch proposal.json --theme consulting --out build/proposal.pptx
+    python deckgen.py preview --theme creative --out build/preview/
+    python deckgen.py live proposal.json --theme consulting --port 8766
+    python deckgen.py html --theme consulting --spec proposal.json --out site/
+
+python-pptx and the generator modules are imported inside the commands that
+need them, so --help and inspect start without loading them.
+"""
+import argparse
+import os
+import sys
+import time
+
+from deck_spec import THEMES
+
+
+def resolve_themes(names):
+    """Expand a list of --theme values, where 'all' means every theme"""
+    if not names:
+        return ["classic"]
+    themes = []
+    for name in names:
+        for theme in (THEMES if name == "all" else [name]):
+            if theme not in themes:
+                themes.append(theme)
+    return themes
+
+
+def default_output_name(theme, spec_path=None, deterministic=False):
+    """Output file name for a render; deterministic builds drop the timestamp"""
+    if spec_path:
+        stem = f"{os.path.splitext(os.path.basename(spec_path))[0]}_{theme}"
+    else:
+        stem = f"XYZ_Mobile_App_Diagnostic_{theme.title()}"
+    if deterministic:
+        return f"{stem}.pptx"
+    return f"{stem}_{time.strftime('%Y%m%d_%H%M%S')}.pptx"
+
+
+def save_checks(args):
+    """Keyword arguments for the save pipeline's optional checks (--overflow, budgets)"""
+    checks = {"overflow": args.overflow}
+    limits = {
+        "max_shapes": args.max_shapes,
+        "max_slide_bytes": args.max_slide_kb and int(args.max_slide_kb * 1024),
+        "max_deck_shapes": args.max_deck_shapes,
+        "max_deck_bytes": args.max_deck_kb and int(args.max_deck_kb * 1024),
+    }
+    if args.budget or any(v is not None for v in limits.values()):
+        from deck_budget import Budget, load_budget
+
+        budget = load_budget(args.budget) if args.budget else Budget()
+        checks["budget"] = budget._replace(**{k: v for k, v in limits.items() if v is not None})
+    return checks
+
+
+def render_to_path(spec_path, theme, output_path, deterministic=False, pdf=False, **checks):
+    """Render one deck to a file (plus a .pdf beside it); returns (output_path, size_bytes, seconds)
+
+    `checks` are passed to the save pipeline (overflow=, budget=).
+    """
+    from deck_output import save_presentation
+    from deck_spec import build_deck, load_spec
+
+    started = time.perf_counter()
+    spec = load_spec(spec_path) if spec_path else None
+    prs = build_deck(spec, theme)
+    if pdf:
+        from pdf_export import save_pptx_and_pdf
+
+        save_pptx_and_pdf(prs, output_path, os.path.splitext(output_path)[0] + ".pdf", deterministic, **checks)
+    else:
+        save_presentation(prs, output_path, deterministic, **checks)
+    return output_path, os.path.getsize(output_path), time.perf_counter() - started
+
+
+PROFILE_OUT = {"cprofile": "deckgen.prof", "slides": "deckgen-slides.json", "sample": "deckgen.speedscope.json"}
+
+
+def run_profiled(args, func):
+    """Run func() under the profiler selected by --profile, or directly when disabled"""
+    if not args.profile:
+        return func()
+    out = args.profile_out or PROFILE_OUT[args.profile]
+    if args.profile == "slides":
+        from slide_profiler import format_report, profile_slides, write_report
+
+        with profile_slides() as profile:
+            result = func()
+        decks = profile.report()
+        print(format_report(decks), file=sys.stderr)
+        print(f"Slide profile written to {write_report(decks, out)}", file=sys.stderr)
+        return result
+    if args.profile == "sample":
+        from stack_sampler import sampling
+
+        with sampling() as sampler:
+            result = func()
+        print(f"{sampler.samples} samples over {sampler.cpu_seconds * 1000:.0f} ms CPU "
+              f"({sampler.sample_weight * 1000:.1f} ms each); top self time:", file=sys.stderr)
+        for name, own, total in sampler.top_functions():
+            print(f"{own:>7} {total:>7}  {name}", file=sys.stderr)
+        print(f"Sample profile written to {sampler.write(out, args.command)}", file=sys.stderr)
+        return result
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(out)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(25)
+        print(f"Profile written to {out}", file=sys.stderr)
+
+
+def cmd_render(args):
+    themes = resolve_themes(args.theme)
+    if len(themes) != 1:
+        raise SystemExit("render takes a single --theme; use batch for several")
+    theme = themes[0]
+
+    checks = save_checks(args)
+    if args.out == "-":
+        if args.pdf:
+            raise SystemExit("--pdf needs a file or directory --out")
+
+        def work():
+            from deck_output import write_presentation
+            from deck_spec import build_deck, load_spec
+
+            spec = load_spec(args.spec) if args.spec else None
+            write_presentation(build_deck(spec, theme), sys.stdout.buffer, args.deterministic, **checks)
+        run_profiled(args, work)
+        return 0
+
+    output_path = args.out or default_output_name(theme, args.spec, args.deterministic)
+    if os.path.isdir(output_path):
+        output_path = os.path.join(output_path, default_output_name(theme, args.spec, args.deterministic))
+    path, size, seconds = run_profiled(
+        args, lambda: render_to_path(args.spec, theme, output_path, args.deterministic, args.pdf, **checks))
+    print(f"✓ {path} ({size / 1024:.1f} KB, {seconds * 1000:.0f} ms)")
+    return 0
+
+
+def cmd_batch(args):
+    themes = resolve_themes(args.theme)
+    specs = args.specs or [None]
+    out_dir = args.out or "."
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(spec, theme, os.path.join(out_dir, default_output_name(theme, spec, args.deterministic)))
+            for spec in specs for theme in themes]
+    checks = save_checks(args)
+
+    def work():
+        if args.jobs <= 1 or args.profile:
+            return [render_to_path(spec, theme, path, args.deterministic, args.pdf, **checks)
+                    for spec, theme, path in jobs]
+        from concurrent.futures import ProcessPoolExecutor
+        from deck_spec import warm_themes
+
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=warm_themes) as pool:
+            futures = [pool.submit(render_to_path, spec, theme, path, args.deterministic, args.pdf, **checks)
+                       for spec, theme, path in jobs]
+            return [future.result() for future in futures]
+
+    started = time.perf_counter()
+    results = run_profiled(args, work)
+    for path, size, seconds in results:
+        print(f"✓ {path} ({size / 1024:.1f} KB, {seconds * 1000:.0f} ms)")
+    print(f"{len(results)} decks in {time.perf_counter() - started:.2f} s")
+    return 0
+
+
+def cmd_bench(args):
+    themes = resolve_themes(args.theme or ["all"])
+    if args.mode == "compare":
+        return bench_compare(args, themes)
+    if args.suite:
+        return bench_suite(args, themes)
+
+    def work():
+        from statistics import median
+        from deck_spec import deck_bytes, load_spec
+
+        spec = load_spec(args.spec) if args.spec else None
+        rows = []
+        for theme in themes:
+            deck_bytes(spec, theme)  # warm-up: imports and template cache
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                data = deck_bytes(spec, theme, args.deterministic)
+                timings.append(time.perf_counter() - started)
+            rows.append((theme, min(timings), median(timings), len(data)))
+        return rows
+
+    rows = run_profiled(args, work)
+    print(f"{'theme':<14}{'min ms':>10}{'median ms':>12}{'size KB':>10}")
+    for theme, best, mid, size in rows:
+        print(f"{theme:<14}{best * 1000:>10.1f}{mid * 1000:>12.1f}{size / 1024:>10.1f}")
+    return 0
+
+
+def bench_suite(args, themes):
+    """bench --suite: macro/micro/scale benchmarks appended to the history file"""
+    import bench_suite
+
+    suites = bench_suite.SUITES if "all" in args.suite else args.suite
+    sizes = [int(n) for n in args.scale.split(",")] if args.scale else bench_suite.DEFAULT_SCALE
+    results = run_profiled(args, lambda: bench_suite.run_suite(
+        suites, themes, args.repeat, sizes, args.scale_theme,
+        progress=lambda suite: print(f"running {suite} benchmarks...", file=sys.stderr)))
+    print(bench_suite.format_results(results))
+    if args.history != "-":
+        path = bench_suite.append_history(args.history, bench_suite.run_record(results))
+        print(f"Results appended to {path}")
+    return 0
+
+
+def bench_compare(args, themes):
+    """bench compare: time the baseline's commit against the working copy and exit 1 on a significant regression"""
+    import bench_compare
+    import bench_suite
+
+    thresholds = {metric: value for metric, value in (
+        ("time", args.time_threshold), ("time_ms", args.min_effect_ms), ("memory", args.memory_threshold),
+        ("size", args.size_threshold))
+        if value is not None}
+    if args.update:
+        suites = bench_suite.SUITES if not args.suite or "all" in args.suite else args.suite
+        sizes = [int(n) for n in args.scale.split(",")] if args.scale else bench_suite.DEFAULT_SCALE[:3]
+        results = bench_suite.run_suite(suites, themes, args.repeat, sizes, args.scale_theme, args.repeat,
+                                        lambda suite: print(f"running {suite} benchmarks...", file=sys.stderr))
+        print(bench_suite.format_results(results))
+        path = bench_compare.write_baseline(args.baseline, bench_suite.run_record(results), thresholds)
+        print(f"Baseline written to {path}")
+        return 0
+
+    baseline = bench_compare.load_baseline(args.baseline)
+    reference = args.against or baseline.get("commit")
+    if not reference:
+        raise SystemExit(f"{args.baseline} records no commit; pass --against <ref>")
+    suites, themes, sizes, scale_theme = bench_compare.baseline_plan(baseline)
+    with bench_compare.reference_tree(reference) as tree:
+        reference_results, results = bench_compare.run_ab(
+            tree, suites, themes, sizes, scale_theme, args.rounds,
+            progress=lambda step: print(f"running {step}...", file=sys.stderr))
+    comparisons = bench_compare.compare_results(
+        reference_results, results, {**baseline.get("thresholds", {}), **thresholds})
+    print(bench_compare.format_comparisons(comparisons, regressions_only=not args.verbose))
+    for name in bench_compare.missing_benchmarks(baseline["results"], results):
+        print(f"warning: {name} is in the baseline but {reference} or the working copy cannot run it",
+              file=sys.stderr)
+    regressions = [c for c in comparisons if c.regressed]
+    print(f"{len(regressions)} regressions in {len(comparisons)} comparisons against {reference}")
+    return 1 if regressions else 0
+
+
+def inspect_package(path):
+    """Per-slide shape, run and size counts read straight from the .pptx zip"""
+    import posixpath
+    import zipfile
+    import xml.etree.ElementTree as ET
+
+    ns = {
+        "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+        "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+        "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+        "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    }
+    shape_tags = {f"{{{ns['p']}}}{tag}" for tag in ("sp", "pic", "grpSp", "graphicFrame", "cxnSp")}
+    run_tag = f"{{{ns['a']}}}r"
+
+    with zipfile.ZipFile(path) as z:
+        rels = ET.fromstring(z.read("ppt/_rels/presentation.xml.rels"))
+        targets = {rel.get("Id"): posixpath.normpath(posixpath.join("ppt", rel.get("Target")))
+                   for rel in rels.findall("rel:Relationship", ns)}
+        presentation = ET.fromstring(z.read("ppt/presentation.xml"))
+        slide_ids = presentation.findall("p:sldIdLst/p:sldId", ns)
+        slides = []
+        for number, sld_id in enumerate(slide_ids, 1):
+            member = targets[sld_id.get(f"{{{ns['r']}}}id")]
+            info = z.getinfo(member)
+            root = ET.fromstring(z.read(member))
+            shapes = runs = 0
+            for element in root.iter():
+                if element.tag in shape_tags:
+                    shapes += 1
+                elif element.tag == run_tag:
+                    runs += 1
+            slides.append({
+                "slide": number,
+                "part": member,
+                "shapes": shapes,
+                "runs": runs,
+                "xml_bytes": info.file_size,
+                "compressed_bytes": info.compress_size,
+            })
+    return {"path": path, "size_bytes": os.path.getsize(path), "slides": slides}
+
+
+def cmd_inspect(args):
+    for path in args.files:
+        report = inspect_package(path)
+        if args.json:
+            import json
+
+            print(json.dumps(report, indent=2))
+            continue
+        print(f"{path}: {len(report['slides'])} slides, {report['size_bytes'] / 1024:.1f} KB")
+        print(f"{'slide':>6}{'shapes':>8}{'runs':>7}{'xml KB':>9}{'zip KB':>9}")
+        for s in report["slides"]:
+            print(f"{s['slide']:>6}{s['shapes']:>8}{s['runs']:>7}"
+                  f"{s['xml_bytes'] / 1024:>9.1f}{s['compressed_bytes'] / 1024:>9.1f}")
+    return 0
+
+
+def cmd_diff(args):
+    from deck_diff import diff_decks, format_diff
+
+    report = diff_decks(args.old, args.new)
+    if args.json:
+        import json
+
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_diff(report))
+    return 1 if report["slides"] else 0
+
+
+def cmd_lint(args):
+    from deck_lint import format_issues, lint_presentation
+
+    decks = []
+    if args.files:
+        from pptx import Presentation
+
+        decks = [(path, lambda path=path: Presentation(path)) for path in args.files]
+    if args.theme or not args.files:
+        from deck_spec import build_deck, load_spec
+
+        spec = load_spec(args.spec) if args.spec else None
+        decks += [(theme, lambda theme=theme: build_deck(spec, theme)) for theme in resolve_themes(args.theme)]
+
+    total = 0
+    for name, load in decks:
+        prs = load()
+        started = time.perf_counter()
+        issues = lint_presentation(prs, args.ignore or ())
+        elapsed = time.perf_counter() - started
+        total += len(issues)
+        print(f"{name}: {len(issues)} issues in {len(prs.slides)} slides ({elapsed * 1000:.0f} ms)")
+        if issues:
+            print(format_issues(issues))
+    return 1 if total else 0
+
+
+def cmd_watch(args):
+    from deck_watch import watch
+
+    themes = resolve_themes(args.theme)
+    if len(themes) != 1:
+        raise SystemExit("watch takes a single --theme")
+    output_path = args.out or default_output_name(themes[0], args.spec, deterministic=True)
+    if os.path.isdir(output_path):
+        output_path = os.path.join(output_path, default_output_name(themes[0], args.spec, deterministic=True))
+    watch(args.spec, themes[0], output_path, args.debounce / 1000, args.poll, args.deterministic)
+    return 0
+
+
+def cmd_preview(args):
+    from svg_preview import write_svg_preview
+
+    started = time.perf_counter()
+    if args.file:
+        from pptx import Presentation
+
+        prs = Presentation(args.file)
+        stem = os.path.splitext(os.path.basename(args.file))[0]
+    else:
+        from deck_spec import build_deck, load_spec
+
+        themes = resolve_themes(args.theme)
+        if len(themes) != 1:
+            raise SystemExit("preview takes a single --theme")
+        prs = build_deck(load_spec(args.spec) if args.spec else None, themes[0])
+        stem = default_output_name(themes[0], args.spec, deterministic=True)[:-len(".pptx")]
+    out_dir = args.out or f"{stem}_preview"
+    paths = write_svg_preview(prs, out_dir, columns=args.columns)
+    print(f"✓ {out_dir}: {len(paths) - 1} slides + index.svg "
+          f"({(time.perf_counter() - started) * 1000:.0f} ms)")
+    return 0
+
+
+def cmd_html(args):
+    from deck_spec import build_deck, load_spec
+    from html_export import export_html
+
+    themes = resolve_themes(args.theme)
+    started = time.perf_counter()
+    for theme in themes:
+        prs = build_deck(load_spec(args.spec) if args.spec else None, theme)
+        stem = default_output_name(theme, args.spec, deterministic=True)[:-len(".pptx")]
+        path = export_html(prs, args.out, stem, theme)
+        print(f"✓ {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    print(f"{len(themes)} decks in {time.perf_counter() - started:.2f} s")
+    return 0
+
+
+def cmd_live(args):
+    from preview_server import serve
+
+    themes = resolve_themes(args.theme)
+    if len(themes) != 1:
+        raise SystemExit("live takes a single --theme")
+    serve(args.spec, themes[0], args.host, args.port, args.debounce / 1000, args.poll, not args.verbose)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="deckgen", description="Render and inspect diagnostic decks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p, multi_theme=False):
+        p.add_argument("--theme", action="append", choices=[*THEMES, "all"] if multi_theme else list(THEMES),
+                       help="Theme to render" + (" (repeatable, or 'all')" if multi_theme else ""))
+        p.add_argument("--deterministic", action="store_true",
+                       help="Fixed timestamps and metadata so identical input gives identical bytes")
+        p.add_argument("--profile", nargs="?", const="cprofile", choices=list(PROFILE_OUT),
+                       help="Profile the command: cprofile (default), per-slide build stats, "
+                            "or a sampling profiler writing speedscope JSON / collapsed stacks")
+        p.add_argument("--profile-out", help="Where to write profile output (default depends on --profile)")
+
+    def add_save_checks(p):
+        p.add_argument("--overflow", choices=["warn", "fail"], help="Measure text frames against their boxes before saving")
+        p.add_argument("--budget", help="JSON file of shape/byte budgets to enforce before saving")
+        p.add_argument("--max-shapes", type=int, help="Budget: shapes per slide")
+        p.add_argument("--max-slide-kb", type=float, help="Budget: serialized XML per slide, in KB")
+        p.add_argument("--max-deck-shapes", type=int, help="Budget: shapes per deck")
+        p.add_argument("--max-deck-kb", type=float, help="Budget: serialized slide XML per deck, in KB")
+
+    p = sub.add_parser("render", help="Render one deck")
+    add_common(p)
+    p.add_argument("--spec", help="JSON deck spec (default: the theme's built-in deck)")
+    p.add_argument("--out", help="Output file or directory, or '-' for stdout")
+    p.add_argument("--pdf", action="store_true", help="Also write a PDF next to the .pptx")
+    add_save_checks(p)
+    p.set_defaults(func=cmd_render)
+
+    p = sub.add_parser("batch", help="Render every spec with every selected theme")
+    add_common(p, multi_theme=True)
+    p.add_argument("specs", nargs="*", help="JSON deck specs (default: the built-in decks)")
+    p.add_argument("--out", help="Output directory (default: current directory)")
+    p.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Parallel worker processes")
+    p.add_argument("--pdf", action="store_true", help="Also write a PDF next to each .pptx")
+    add_save_checks(p)
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("bench", help="Time warm renders per theme, run the benchmark suite, or gate on a baseline")
+    p.add_argument("mode", nargs="?", choices=["run", "compare"], default="run",
+                   help="'compare' re-runs a baseline's benchmarks and exits 1 on regressions")
+    add_common(p, multi_theme=True)
+    p.add_argument("--spec", help="JSON deck spec (default: the built-in decks)")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--suite", action="append", choices=["macro", "micro", "scale", "shapes", "all"],
+                   help="Run the benchmark suite instead (repeatable, or 'all')")
+    p.add_argument("--scale", help="Comma-separated slide counts for the scale suite (default 10,100,1000,10000)")
+    p.add_argument("--scale-theme", choices=list(THEMES), default="classic", help="Theme for the scale suite")
+    p.add_argument("--history", default="bench_history.json",
+                   help="JSON history file the suite appends to ('-' to skip)")
+    p.add_argument("--baseline", default="bench_baseline.json",
+                   help="compare: baseline run record naming the reference commit and benchmarks")
+    p.add_argument("--against", help="compare: reference commit to time against (default: the baseline's)")
+    p.add_argument("--update", action="store_true", help="compare: record a new baseline instead of comparing")
+    p.add_argument("--time-threshold", type=float, help="compare: allowed median slowdown (default 0.10)")
+    p.add_argument("--rounds", type=int, default=8,
+                   help="compare: alternating rounds per side (Holm correction needs about 8)")
+    p.add_argument("--min-effect-ms", type=float,
+                   help="compare: smallest median slowdown that counts, in ms (default 0.05)")
+    p.add_argument("--memory-threshold", type=float, help="compare: allowed peak RSS growth (default 0.10)")
+    p.add_argument("--size-threshold", type=float, help="compare: allowed output size growth (default 0.02)")
+    p.add_argument("--verbose", action="store_true", help="compare: list every comparison, not just regressions")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("inspect", help="Summarise slides, shapes and sizes of .pptx files")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--json", action="store_true", help="Print a JSON report")
+    p.set_defaults(func=cmd_inspect)
+
+    p = sub.add_parser("diff", help="Report added, removed, moved and edited slides and shapes between two decks")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--json", action="store_true", help="Print a JSON report")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("lint", help="Report colliding text, text spilling out of cards and off-slide shapes")
+    p.add_argument("files", nargs="*", help=".pptx files to lint (default: render --theme/--spec)")
+    p.add_argument("--theme", action="append", choices=[*THEMES, "all"], help="Theme (repeatable, or 'all')")
+    p.add_argument("--spec", help="JSON deck spec (default: the built-in decks)")
+    p.add_argument("--ignore", action="append", choices=["overlap", "spill", "off-slide"], help="Skip a rule")
+    p.set_defaults(func=cmd_lint)
+
+    p = sub.add_parser("watch", help="Rebuild changed slides whenever a spec file changes")
+    p.add_argument("spec", help="JSON deck spec to watch")
+    p.add_argument("--theme", action="append", choices=list(THEMES))
+    p.add_argument("--out", help="Output file or directory")
+    p.add_argument("--debounce", type=float, default=150, help="Quiet period in ms before rebuilding")
+    p.add_argument("--poll", action="store_true", help="Use mtime polling instead of inotify")
+    p.add_argument("--deterministic", action="store_true")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("preview", help="Draw slides as SVG files plus a thumbnail contact sheet")
+    p.add_argument("file", nargs="?", help="Existing .pptx to preview (default: render --theme/--spec)")
+    p.add_argument("--theme", action="append", choices=list(THEMES))
+    p.add_argument("--spec", help="JSON deck spec (default: the theme's built-in deck)")
+    p.add_argument("--out", help="Output directory (default: <deck>_preview)")
+    p.add_argument("--columns", type=int, default=4, help="Thumbnails per row in index.svg")
+    p.set_defaults(func=cmd_preview)
+
+    p = sub.add_parser("html", help="Export decks as static HTML pages sharing one CSS file per theme")
+    p.add_argument("--theme", action="append", choices=[*THEMES, "all"], help="Theme (repeatable, or 'all')")
+    p.add_argument("--spec", help="JSON deck spec (default: the built-in decks)")
+    p.add_argument("--out", default=".", help="Output directory (css/ is written beneath it)")
+    p.set_defaults(func=cmd_html)
+
+    p = sub.add_parser("live", help="Serve SVG previews of a spec that refresh in the browser as it changes")
+    p.add_argument("spec", help="JSON deck spec to watch")
+    p.add_argument("--theme", action="append", choices=list(THEMES))
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8766)
+    p.add_argument("--debounce", type=float, default=50, help="Quiet period in ms before refreshing")
+    p.add_argument("--poll", action="store_true", help="Use mtime polling instead of inotify")
+    p.add_argument("--verbose", action="store_true", help="Log every HTTP request")
+    p.set_defaults(func=cmd_live)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"deckgen: error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
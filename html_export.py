@@ -0,0 +1,156 @@
+"""
+HTML Export
+Static HTML pages of absolutely-positioned slide elements, styled by one shared CSS file per theme
+
+    python deckgen.py html --theme consulting --spec proposal.json --out site/
+
+writes site/<deck>.html plus site/css/deck-consulting.css. The theme CSS
+holds the layout rules and a colour class for every colour in the theme's
+palette and built-in deck, so it is identical for every deck of that theme
+and can be cached by the browser; each page only carries its own geometry
+and text. Colours a spec introduces beyond the palette go in a small
+<style> block on the page. Pages are drawn from the render plan, so text
+wraps exactly as in the SVG and PDF exports.
+"""
+import os
+from functools import lru_cache
+from html import escape
+
+from render_plan import EMU_PER_PT, place_text, plan_deck
+from svg_preview import FONT_STACK, ROUND_RECT_RADIUS
+
+BASELINE_OFFSET = 0.8  # baseline position within a line box of line-height 1, in em
+
+BASE_CSS = f"""\
+.deck {{ display: flex; flex-direction: column; align-items: center; gap: 24px; padding: 24px;
+  background: #E5E5E5; font-family: {FONT_STACK}; }}
+.slide {{ position: relative; overflow: hidden; box-shadow: 0 1px 4px rgba(0,0,0,.2); }}
+.s {{ position: absolute; box-sizing: border-box; border: 0 solid transparent; }}
+.e {{ border-radius: 50%; }}
+.t {{ position: absolute; white-space: pre; line-height: 1; }}
+.ac {{ transform: translateX(-50%); }}
+.ar {{ transform: translateX(-100%); }}
+.b {{ font-weight: bold; }}
+.i {{ font-style: italic; }}
+"""
+
+
+def _color_rules(colors):
+    return "".join(f".bg{c} {{ background: #{c}; }}\n.fg{c} {{ color: #{c}; }}\n.bd{c} {{ border-color: #{c}; }}\n"
+                   for c in sorted(colors))
+
+
+def _plan_colors(plans):
+    colors = set()
+    for plan in plans:
+        colors.add(plan.background)
+        for shape in plan.shapes:
+            colors.update(c for c in (shape.fill, shape.line) if c)
+            if shape.text is not None:
+                colors.update(p.color for p in shape.text.paragraphs)
+    return colors
+
+
+@lru_cache(maxsize=None)
+def theme_colors(theme):
+    """Every colour of a theme: its module palette constants plus those drawn in its built-in deck"""
+    from pptx.dml.color import RGBColor
+
+    from deck_spec import build_deck, load_theme
+
+    module = load_theme(theme)
+    colors = {str(value) for value in vars(module).values() if isinstance(value, RGBColor)}
+    return frozenset(colors | _plan_colors(plan_deck(build_deck(None, theme))))
+
+
+def theme_css(theme):
+    """Shared stylesheet for every deck of a theme"""
+    return BASE_CSS + _color_rules(theme_colors(theme))
+
+
+def _num(points):
+    return f"{points:.1f}".rstrip("0").rstrip(".")
+
+
+def _pt(emu):
+    return _num(emu / EMU_PER_PT)
+
+
+def _slide_html(plan, out):
+    out.append(f'<section class="slide bg{plan.background}" '
+               f'style="width:{_pt(plan.width)}pt;height:{_pt(plan.height)}pt">')
+    for shape in plan.shapes:
+        if shape.fill or shape.line:
+            classes = ["s"]
+            style = f"left:{_pt(shape.x)}pt;top:{_pt(shape.y)}pt;width:{_pt(shape.w)}pt;height:{_pt(shape.h)}pt"
+            if shape.fill:
+                classes.append(f"bg{shape.fill}")
+            if shape.line:
+                classes.append(f"bd{shape.line}")
+                style += f";border-width:{_pt(shape.line_width)}pt"
+            if shape.geometry == "ellipse":
+                classes.append("e")
+            elif shape.geometry == "roundRect":
+                style += f";border-radius:{_pt(min(shape.w, shape.h) * ROUND_RECT_RADIUS)}pt"
+            out.append(f'<div class="{" ".join(classes)}" style="{style}"></div>')
+        if shape.text is not None:
+            for placed in place_text(shape):
+                p = placed.paragraph
+                classes = ["t", f"fg{p.color}"]
+                if p.bold:
+                    classes.append("b")
+                if p.italic:
+                    classes.append("i")
+                if placed.align in ("ctr", "r"):
+                    classes.append("a" + placed.align[0])
+                top = placed.baseline - p.size * BASELINE_OFFSET
+                out.append(f'<span class="{" ".join(classes)}" style="left:{_num(placed.x)}pt;'
+                           f'top:{_num(top)}pt;font-size:{p.size:g}pt">{escape(placed.text)}</span>')
+    out.append("</section>")
+
+
+def deck_html(plans, title, css_href=None, theme=None):
+    """HTML page for a deck's plans; colours outside the theme palette are styled inline"""
+    out = ["<!DOCTYPE html>", '<html><head><meta charset="utf-8">', f"<title>{escape(title)}</title>"]
+    colors = _plan_colors(plans)
+    if css_href:
+        out.append(f'<link rel="stylesheet" href="{escape(css_href)}">')
+        css = _color_rules(colors - theme_colors(theme)) if theme else _color_rules(colors)
+    else:
+        css = BASE_CSS + _color_rules(colors)
+    if css:
+        out.append(f"<style>\n{css}</style>")
+    out.append('</head><body class="deck">')
+    for plan in plans:
+        _slide_html(plan, out)
+    out.append("</body></html>\n")
+    return "\n".join(out)
+
+
+def write_theme_css(theme, out_dir):
+    """Write css/deck-<theme>.css under out_dir unless it is already up to date; returns its path"""
+    path = os.path.join(out_dir, "css", f"deck-{theme}.css")
+    css = theme_css(theme)
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == css:
+                return path
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(css)
+    return path
+
+
+def export_html(prs, out_dir, stem, theme=None):
+    """Write <stem>.html (plus the shared theme CSS when a theme is given); returns the page path"""
+    os.makedirs(out_dir, exist_ok=True)
+    css_href = None
+    if theme:
+        write_theme_css(theme, out_dir)
+        css_href = f"css/deck-{theme}.css"
+    path = os.path.join(out_dir, f"{stem}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(deck_html(plan_deck(prs), stem, css_href, theme))
+    return path
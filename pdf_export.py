@@ -0,0 +1,194 @@
+"""
+PDF Export
+Pure-Python PDF writer that draws render plans with PDF path and text operators
+
+    python deckgen.py render --theme consulting --pdf --out build/
+
+Shapes map directly to PDF paths (rectangles, Bézier ellipses and rounded
+rectangles) and text is set in the standard Helvetica faces, horizontally
+condensed for Calibri-family text so advances match the text_metrics
+measurements used for wrapping. No fonts are embedded, so text is limited
+to WinAnsi: common symbols outside it (non-breaking hyphens, arrows, check
+marks) are drawn as their nearest equivalent and emoji are left out. The
+output is deterministic (no creation dates).
+"""
+import zlib
+from functools import lru_cache
+
+from render_plan import EMU_PER_PT, place_text, plan_deck
+from svg_preview import ROUND_RECT_RADIUS
+from text_metrics import FAMILY_SCALE, text_width
+
+KAPPA = 0.5523  # Bézier control distance for a quarter circle
+FONTS = {
+    (False, False): ("F1", "Helvetica"),
+    (True, False): ("F2", "Helvetica-Bold"),
+    (False, True): ("F3", "Helvetica-Oblique"),
+    (True, True): ("F4", "Helvetica-BoldOblique"),
+}
+
+
+def _num(value):
+    """Compact PDF number"""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return text if text not in ("-0", "") else "0"
+
+
+def _rgb(hex_color):
+    return " ".join(_num(int(hex_color[i:i + 2], 16) / 255) for i in (0, 2, 4))
+
+
+# Common characters outside WinAnsi, as the nearest text the standard fonts can draw
+_WINANSI = str.maketrans({
+    "\u2010": "-", "\u2011": "-", "\u2012": "-", "\u2212": "-",  # hyphens and minus
+    "\u2192": "->", "\u2190": "<-", "\u2194": "<->", "\u21d2": "=>",  # arrows
+    "\u2713": "\u2022", "\u2714": "\u2022", "\u2705": "\u2022",  # check marks
+    "\u25b8": "\u00bb", "\u25b6": "\u00bb", "\u25ba": "\u00bb",  # pointers
+    "\u274c": "\u00d7", "\u2717": "\u00d7", "\u2718": "\u00d7",  # crosses
+    "\u26a0": "!", "\u2264": "<=", "\u2265": ">=",
+})
+
+
+@lru_cache(maxsize=None)
+def _encodable(ch):
+    try:
+        ch.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def winansi_text(text):
+    """`text` as the standard fonts will draw it: common symbols mapped, anything else (emoji) dropped"""
+    mapped = text.translate(_WINANSI)
+    if all(map(_encodable, mapped)):
+        return mapped
+    kept = "".join(filter(_encodable, mapped))
+    # "🚀 Launch" -> "Launch", not " Launch"
+    return kept.lstrip() if not text[:1].isspace() else kept
+
+
+def _pdf_string(text):
+    """PDF literal string for text already passed through winansi_text()"""
+    data = text.encode("cp1252").decode("latin-1")
+    return "(" + data.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _ellipse_path(x, y, w, h):
+    rx, ry = w / 2, h / 2
+    cx, cy = x + rx, y + ry
+    kx, ky = rx * KAPPA, ry * KAPPA
+    n = _num
+    return (f"{n(cx + rx)} {n(cy)} m "
+            f"{n(cx + rx)} {n(cy + ky)} {n(cx + kx)} {n(cy + ry)} {n(cx)} {n(cy + ry)} c "
+            f"{n(cx - kx)} {n(cy + ry)} {n(cx - rx)} {n(cy + ky)} {n(cx - rx)} {n(cy)} c "
+            f"{n(cx - rx)} {n(cy - ky)} {n(cx - kx)} {n(cy - ry)} {n(cx)} {n(cy - ry)} c "
+            f"{n(cx + kx)} {n(cy - ry)} {n(cx + rx)} {n(cy - ky)} {n(cx + rx)} {n(cy)} c h")
+
+
+def _round_rect_path(x, y, w, h):
+    r = min(w, h) * ROUND_RECT_RADIUS
+    k = r * (1 - KAPPA)
+    n = _num
+    right, top = x + w, y + h
+    return (f"{n(x + r)} {n(y)} m {n(right - r)} {n(y)} l "
+            f"{n(right - k)} {n(y)} {n(right)} {n(y + k)} {n(right)} {n(y + r)} c "
+            f"{n(right)} {n(top - r)} l "
+            f"{n(right)} {n(top - k)} {n(right - k)} {n(top)} {n(right - r)} {n(top)} c "
+            f"{n(x + r)} {n(top)} l "
+            f"{n(x + k)} {n(top)} {n(x)} {n(top - k)} {n(x)} {n(top - r)} c "
+            f"{n(x)} {n(y + r)} l "
+            f"{n(x)} {n(y + k)} {n(x + k)} {n(y)} {n(x + r)} {n(y)} c h")
+
+
+def page_content(plan):
+    """PDF content stream operators for one slide plan"""
+    page_h = plan.height / EMU_PER_PT
+    ops = [f"{_rgb(plan.background)} rg 0 0 {_num(plan.width / EMU_PER_PT)} {_num(page_h)} re f"]
+    for shape in plan.shapes:
+        if shape.fill or shape.line:
+            w, h = shape.w / EMU_PER_PT, shape.h / EMU_PER_PT
+            x, y = shape.x / EMU_PER_PT, page_h - shape.y / EMU_PER_PT - h
+            if shape.geometry == "ellipse":
+                path = _ellipse_path(x, y, w, h)
+            elif shape.geometry == "roundRect":
+                path = _round_rect_path(x, y, w, h)
+            else:
+                path = f"{_num(x)} {_num(y)} {_num(w)} {_num(h)} re"
+            if shape.fill:
+                ops.append(f"{_rgb(shape.fill)} rg")
+            if shape.line:
+                ops.append(f"{_rgb(shape.line)} RG {_num(shape.line_width / EMU_PER_PT)} w")
+            ops.append(f"{path} {'B' if shape.fill and shape.line else 'f' if shape.fill else 'S'}")
+        if shape.text is not None:
+            for placed in place_text(shape):
+                p = placed.paragraph
+                font_name = FONTS[(p.bold, p.italic)][0]
+                scale = FAMILY_SCALE.get(p.font.lower(), 1.0)
+                text = winansi_text(placed.text)
+                if not text:
+                    continue
+                x = placed.x
+                if placed.align in ("ctr", "r"):
+                    # Measure what is drawn, so centring holds when characters were mapped or dropped
+                    width = text_width(text, p.size, p.bold, p.font)
+                    x -= width / 2 if placed.align == "ctr" else width
+                ops.append(f"BT /{font_name} {_num(p.size)} Tf {_num(scale * 100)} Tz {_rgb(p.color)} rg "
+                           f"{_num(x)} {_num(page_h - placed.baseline)} Td {_pdf_string(text)} Tj ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def write_pdf(plans, stream):
+    """Write a PDF with one page per slide plan to a binary stream"""
+    # Object numbers: 1 catalog, 2 page tree, 3-6 fonts, then a page + content pair per slide
+    font_ids = {name: 3 + i for i, (name, _) in enumerate(FONTS.values())}
+    first_page = 3 + len(FONTS)
+    page_ids = [first_page + 2 * i for i in range(len(plans))]
+
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(plans)} >>".encode(),
+    }
+    for name, base_font in FONTS.values():
+        objects[font_ids[name]] = (f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} "
+                                   f"/Encoding /WinAnsiEncoding >>").encode()
+    font_resources = " ".join(f"/{name} {oid} 0 R" for name, oid in font_ids.items())
+    for page_id, plan in zip(page_ids, plans):
+        content = zlib.compress(page_content(plan), 6)
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R "
+                            f"/MediaBox [0 0 {_num(plan.width / EMU_PER_PT)} {_num(plan.height / EMU_PER_PT)}] "
+                            f"/Resources << /Font << {font_resources} >> >> "
+                            f"/Contents {page_id + 1} 0 R >>").encode()
+        objects[page_id + 1] = (f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode()
+                                + content + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for oid in range(1, len(objects) + 1):
+        offsets.append(len(out))
+        out += f"{oid} 0 obj\n".encode() + objects[oid] + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n").encode()
+    stream.write(out)
+    return stream
+
+
+def save_pdf(prs, output_path, plans=None):
+    """Write a Presentation (or its precomputed plans) to a PDF file"""
+    with open(output_path, "wb") as f:
+        write_pdf(plans if plans is not None else plan_deck(prs), f)
+    return output_path
+
+
+def save_pptx_and_pdf(prs, pptx_path, pdf_path, deterministic=False, overflow=None, budget=None):
+    """Write the .pptx and a matching PDF from one built Presentation, planning the deck once"""
+    from deck_output import save_presentation
+
+    plans = plan_deck(prs)
+    save_presentation(prs, pptx_path, deterministic, overflow, budget, plans)
+    save_pdf(prs, pdf_path, plans)
+    return pptx_path, pdf_path
@@ -0,0 +1,236 @@
+"""
+Live Preview Server
+Serve SVG slide previews of a spec and push changed slides to the browser as the spec is edited
+
+    python deckgen.py live proposal.json --theme consulting --port 8766
+
+    GET /              preview page (connects to /events)
+    GET /events        server-sent events: "deck" (slide count, timing), "slide" (index + SVG), "error"
+    GET /slides/N.svg  current SVG of slide N (1-based)
+
+The deck stays warm in an IncrementalRenderer, so a spec edit only rebuilds
+and redraws the slides whose spec entries changed, and each connected page
+is sent only the slides whose SVG differs from what it already shows.
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from deck_spec import load_spec
+from deck_watch import IncrementalRenderer, SpecWatcher
+from render_plan import plan_slide
+from svg_preview import slide_svg
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ margin: 0; background: #E5E5E5; font-family: sans-serif; }}
+#status {{ position: sticky; top: 0; padding: 6px 12px; background: #1F2937; color: #F9FAFB; font-size: 13px; }}
+#status.error {{ background: #B91C1C; }}
+#deck {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(480px, 1fr)); gap: 16px; padding: 16px; }}
+.slide {{ background: white; box-shadow: 0 1px 4px rgba(0,0,0,.2); }}
+.slide svg {{ display: block; width: 100%; height: auto; }}
+.slide.fresh {{ outline: 3px solid #FBBF24; }}
+</style></head>
+<body><div id="status">connecting…</div><div id="deck"></div>
+<script>
+const deck = document.getElementById("deck"), status = document.getElementById("status");
+const events = new EventSource("/events");
+events.addEventListener("deck", e => {{
+  const info = JSON.parse(e.data);
+  while (deck.children.length > info.count) deck.lastChild.remove();
+  while (deck.children.length < info.count) {{
+    const div = document.createElement("div"); div.className = "slide"; deck.appendChild(div);
+  }}
+  status.className = "";
+  status.textContent = `${{info.count}} slides · updated ${{info.changed}} in ${{info.ms}} ms`;
+}});
+events.addEventListener("slide", e => {{
+  const info = JSON.parse(e.data), div = deck.children[info.index];
+  if (!div) return;
+  div.innerHTML = info.svg;
+  div.classList.add("fresh"); setTimeout(() => div.classList.remove("fresh"), 600);
+}});
+events.addEventListener("error", e => {{
+  if (!e.data) return;
+  status.className = "error"; status.textContent = JSON.parse(e.data).error;
+}});
+</script></body></html>
+"""
+
+
+class PreviewState:
+    """Warm renderer plus the current per-slide SVGs; notifies waiters on every refresh"""
+
+    def __init__(self, spec_path, theme):
+        self.spec_path = spec_path
+        self.renderer = IncrementalRenderer(theme)
+        self.svgs = []
+        self.hashes = []
+        self.error = None
+        self.version = 0
+        self.last_ms = 0
+        self._svg_cache = {}  # slide element -> svg, for slides the renderer kept
+        self._changed = threading.Condition()
+
+    def refresh(self):
+        """Re-apply the spec and redraw rebuilt slides; returns the indexes whose SVG changed"""
+        started = time.perf_counter()
+        try:
+            self.renderer.update(load_spec(self.spec_path))
+        except Exception as e:  # keep serving the last good deck through half-finished edits
+            with self._changed:
+                self.error = f"{self.spec_path}: {e}"
+                self.version += 1
+                self._changed.notify_all()
+            return []
+
+        prs = self.renderer.prs
+        width, height = prs.slide_width, prs.slide_height
+        cache, svgs = {}, []
+        for index, slide in enumerate(prs.slides):
+            element = slide._element
+            svg = self._svg_cache.get(element)
+            if svg is None:
+                svg = slide_svg(plan_slide(slide, index, width, height))
+            cache[element] = svg
+            svgs.append(svg)
+        hashes = [hashlib.sha1(svg.encode("utf-8")).hexdigest() for svg in svgs]
+        changed = [i for i, h in enumerate(hashes) if i >= len(self.hashes) or self.hashes[i] != h]
+
+        with self._changed:
+            self._svg_cache = cache
+            self.svgs, self.hashes = svgs, hashes
+            self.error = None
+            self.last_ms = round((time.perf_counter() - started) * 1000)
+            self.version += 1
+            self._changed.notify_all()
+        return changed
+
+    def wait(self, version, timeout):
+        """Block until the state moves past `version` (or timeout); returns the current version"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def wake_all(self):
+        """Release every waiter without a state change (used on shutdown)"""
+        with self._changed:
+            self._changed.notify_all()
+
+    def snapshot(self):
+        with self._changed:
+            return self.version, list(self.svgs), list(self.hashes), self.error, self.last_ms
+
+
+class PreviewRequestHandler(BaseHTTPRequestHandler):
+    """Serves the preview page, slide SVGs and the server-sent event stream"""
+
+    server_version = "DeckPreview/1.0"
+    keepalive_seconds = 15
+
+    def do_GET(self):
+        if self.path == "/":
+            self._send(200, "text/html; charset=utf-8", PAGE.format(title=self.server.state.spec_path))
+        elif self.path == "/events":
+            self._stream_events()
+        elif self.path.startswith("/slides/") and self.path.endswith(".svg"):
+            _, svgs, _, _, _ = self.server.state.snapshot()
+            try:
+                number = int(self.path[len("/slides/"):-len(".svg")])
+                svg = svgs[number - 1] if number > 0 else None
+            except (ValueError, IndexError):
+                svg = None
+            if svg is None:
+                self._send(404, "text/plain", f"No slide at {self.path}")
+            else:
+                self._send(200, "image/svg+xml", svg)
+        else:
+            self._send(404, "text/plain", f"Unknown path {self.path}")
+
+    def _send(self, status, content_type, text):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _event(self, name, payload):
+        self.wfile.write(f"event: {name}\ndata: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    def _stream_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        state = self.server.state
+        sent = []  # hashes this client is showing
+        version = None
+        try:
+            while not self.server.stopping:
+                current, svgs, hashes, error, ms = state.snapshot()
+                if current != version:
+                    version = current
+                    if error:
+                        self._event("error", {"error": error})
+                    else:
+                        changed = [i for i, h in enumerate(hashes) if i >= len(sent) or sent[i] != h]
+                        self._event("deck", {"count": len(svgs), "changed": len(changed), "ms": ms})
+                        for i in changed:
+                            self._event("slide", {"index": i, "svg": svgs[i]})
+                        sent = hashes
+                else:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+                state.wait(version, self.keepalive_seconds)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def _watch_loop(server, watcher, debounce):
+    state = server.state
+    while not server.stopping:
+        if watcher.wait(debounce, timeout=0.5):
+            changed = state.refresh()
+            if state.error:
+                print(f"✗ {state.error}")
+            else:
+                slides = ", ".join(str(i + 1) for i in changed) or "none"
+                print(f"↻ slides [{slides}] of {len(state.svgs)} refreshed in {state.last_ms} ms")
+
+
+def make_server(spec_path, theme, host="127.0.0.1", port=8766, quiet=True):
+    """Create the preview server with the deck rendered once"""
+    server = ThreadingHTTPServer((host, port), PreviewRequestHandler)
+    server.daemon_threads = True
+    server.state = PreviewState(spec_path, theme)
+    server.state.refresh()
+    server.quiet = quiet
+    server.stopping = False
+    return server
+
+
+def serve(spec_path, theme, host="127.0.0.1", port=8766, debounce=0.05, force_poll=False, quiet=True):
+    """Serve live previews of `spec_path` until interrupted"""
+    server = make_server(spec_path, theme, host, port, quiet)
+    watcher = SpecWatcher([spec_path], force_poll=force_poll)
+    thread = threading.Thread(target=_watch_loop, args=(server, watcher, debounce), daemon=True)
+    thread.start()
+    print(f"Live preview of {spec_path} ({theme}, {watcher.backend}) on http://{host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stopping = True
+        server.state.wake_all()
+        thread.join()
+        watcher.close()
+        server.server_close()
@@ -0,0 +1,338 @@
+"""
+Render Plan
+Flatten a python-pptx Presentation into simple per-slide drawing primitives
+
+The plan is what the preview and export writers draw from: every autoshape
+and textbox becomes a PlanShape with absolute geometry in EMU, resolved solid
+fill/line colours and laid-out text (paragraph styles resolved through run,
+paragraph and list-style properties, lines wrapped with text_metrics).
+Group shapes are flattened with their child transforms applied.
+"""
+from collections import namedtuple
+
+from pptx.oxml.ns import qn
+
+from text_metrics import LINE_SPACING, line_height, text_width, wrap_text
+
+EMU_PER_PT = 12700
+
+SlidePlan = namedtuple("SlidePlan", "index width height background shapes")
+PlanShape = namedtuple(
+    "PlanShape",
+    "shape_id name geometry is_textbox x y w h fill line line_width text",
+)
+PlanText = namedtuple("PlanText", "paragraphs wrap anchor insets auto_fit")
+PlanParagraph = namedtuple(
+    "PlanParagraph",
+    "text size bold italic color font align space_before space_after "
+    "level bullet margin_left indent lines",
+)
+# One positioned line of text in points; x is the left edge, centre or right edge per align
+PlacedLine = namedtuple("PlacedLine", "x baseline text align paragraph")
+
+# Colours of the default python-pptx template theme
+THEME_COLORS = {
+    "tx1": "000000", "dk1": "000000", "bg1": "FFFFFF", "lt1": "FFFFFF",
+    "tx2": "1F497D", "dk2": "1F497D", "bg2": "EEECE1", "lt2": "EEECE1",
+    "accent1": "4F81BD", "accent2": "C0504D", "accent3": "9BBB59",
+    "accent4": "8064A2", "accent5": "4BACC6", "accent6": "F79646",
+}
+THEME_FONTS = {"+mn-lt": "Calibri", "+mj-lt": "Calibri"}
+DEFAULT_LINE_WIDTH = 9525  # 0.75pt, the default template's lnRef idx 1
+DEFAULT_INSETS = (91440, 45720, 91440, 45720)
+
+_TRUE = {"1", "true"}
+# Clark-notation tags resolved once; qn() is too slow to call per element
+_T = {name: qn(name) for name in (
+    "a:bodyPr", "a:br", "a:buChar", "a:buNone", "a:chExt", "a:chOff", "a:defRPr", "a:endParaRPr",
+    "a:ext", "a:fontRef", "a:latin", "a:ln", "a:lstStyle", "a:noFill", "a:off", "a:p", "a:pPr",
+    "a:prstGeom", "a:r", "a:rPr", "a:schemeClr", "a:solidFill", "a:spAutoFit", "a:spcAft",
+    "a:spcBef", "a:spcPts", "a:srgbClr", "a:t", "a:xfrm", "p:bg", "p:bgPr", "p:cNvPr", "p:cNvSpPr",
+    "p:grpSp", "p:grpSpPr", "p:nvSpPr", "p:sp", "p:spPr", "p:style", "p:txBody",
+    *(f"a:lvl{n}pPr" for n in range(1, 10)),
+)}
+
+
+def _child(parent, tag):
+    """First child of `parent` with `tag`, or None (faster than lxml's find)"""
+    return next(parent.iterchildren(tag), None)
+
+
+def _color(parent):
+    """Hex colour of a solidFill under `parent`, or None"""
+    if parent is None:
+        return None
+    fill = _child(parent, _T["a:solidFill"])
+    if fill is None:
+        return None
+    srgb = _child(fill, _T["a:srgbClr"])
+    if srgb is not None:
+        return srgb.get("val")
+    scheme = _child(fill, _T["a:schemeClr"])
+    if scheme is not None:
+        return THEME_COLORS.get(scheme.get("val"))
+    return None
+
+
+def _rpr_props(rPr, props):
+    """Overlay character properties found on an rPr/defRPr element onto `props`"""
+    if rPr is None:
+        return props
+    sz = rPr.get("sz")
+    if sz is not None:
+        props["size"] = int(sz) / 100
+    b = rPr.get("b")
+    if b is not None:
+        props["bold"] = b in _TRUE
+    i = rPr.get("i")
+    if i is not None:
+        props["italic"] = i in _TRUE
+    color = _color(rPr)
+    if color is not None:
+        props["color"] = color
+    latin = _child(rPr, _T["a:latin"])
+    if latin is not None and latin.get("typeface"):
+        typeface = latin.get("typeface")
+        props["font"] = THEME_FONTS.get(typeface, typeface)
+    return props
+
+
+def _spacing_pt(pPr, tag):
+    spacing = _child(pPr, _T[tag])
+    if spacing is None:
+        return None
+    pts = _child(spacing, _T["a:spcPts"])
+    return int(pts.get("val")) / 100 if pts is not None else None
+
+
+def _ppr_props(pPr, props):
+    """Overlay paragraph properties found on a pPr/lvlNpPr element onto `props`"""
+    if pPr is None:
+        return props
+    for attr, key in (("algn", "align"), ("marL", "margin_left"), ("indent", "indent")):
+        value = pPr.get(attr)
+        if value is not None:
+            props[key] = value if attr == "algn" else int(value)
+    for tag, key in (("a:spcBef", "space_before"), ("a:spcAft", "space_after")):
+        value = _spacing_pt(pPr, tag)
+        if value is not None:
+            props[key] = value
+    if _child(pPr, _T["a:buNone"]) is not None:
+        props["bullet"] = None
+    bu_char = _child(pPr, _T["a:buChar"])
+    if bu_char is not None:
+        props["bullet"] = bu_char.get("char")
+    return _rpr_props(_child(pPr, _T["a:defRPr"]), props)
+
+
+def _plan_text(txBody, sp_width, is_textbox, style_color):
+    bodyPr = _child(txBody, _T["a:bodyPr"])
+    wrap = bodyPr is None or bodyPr.get("wrap") != "none"
+    anchor = (bodyPr.get("anchor") if bodyPr is not None else None) or ("t" if is_textbox else "ctr")
+    insets = tuple(
+        int(bodyPr.get(attr)) if bodyPr is not None and bodyPr.get(attr) is not None else default
+        for attr, default in zip(("lIns", "tIns", "rIns", "bIns"), DEFAULT_INSETS)
+    )
+    auto_fit = bodyPr is not None and _child(bodyPr, _T["a:spAutoFit"]) is not None
+
+    lstStyle = _child(txBody, _T["a:lstStyle"])
+    base = {
+        "size": 18.0, "bold": False, "italic": False, "color": style_color, "font": "Calibri",
+        "align": "l", "space_before": 0.0, "space_after": 0.0,
+        "bullet": None, "margin_left": 0, "indent": 0,
+    }
+    paragraphs = []
+    for p in txBody.iterchildren(_T["a:p"]):
+        pPr = _child(p, _T["a:pPr"])
+        level = int(pPr.get("lvl", 0)) if pPr is not None else 0
+        props = dict(base)
+        if lstStyle is not None:
+            _ppr_props(_child(lstStyle, _T[f"a:lvl{level + 1}pPr"]), props)
+        _ppr_props(pPr, props)
+        text_parts = []
+        first_run = True
+        for child in p.iterchildren(_T["a:r"], _T["a:br"]):
+            if child.tag == _T["a:br"]:
+                text_parts.append("\n")
+                continue
+            if first_run:
+                _rpr_props(_child(child, _T["a:rPr"]), props)
+                first_run = False
+            t = _child(child, _T["a:t"])
+            text_parts.append(t.text or "" if t is not None else "")
+        if first_run:
+            _rpr_props(_child(p, _T["a:endParaRPr"]), props)
+        text = "".join(text_parts)
+
+        available = None
+        if wrap:
+            available = (sp_width - insets[0] - insets[2] - props["margin_left"]) / EMU_PER_PT
+            available = max(available, 1.0)
+        lines = wrap_text(text, available, props["size"], props["bold"], props["font"]) if text else ("",)
+        paragraphs.append(PlanParagraph(
+            text, props["size"], props["bold"], props["italic"], props["color"], props["font"],
+            props["align"], props["space_before"], props["space_after"], level,
+            props["bullet"], props["margin_left"], props["indent"], lines,
+        ))
+    return PlanText(tuple(paragraphs), wrap, anchor, insets, auto_fit)
+
+
+def _plan_sp(sp, transform):
+    nvSpPr = _child(sp, _T["p:nvSpPr"])
+    cNvPr = _child(nvSpPr, _T["p:cNvPr"])
+    cNvSpPr = _child(nvSpPr, _T["p:cNvSpPr"])
+    is_textbox = cNvSpPr is not None and cNvSpPr.get("txBox") in _TRUE
+
+    spPr = _child(sp, _T["p:spPr"])
+    xfrm = _child(spPr, _T["a:xfrm"])
+    if xfrm is None:
+        return None
+    off, ext = _child(xfrm, _T["a:off"]), _child(xfrm, _T["a:ext"])
+    x, y, w, h = _apply(transform, int(off.get("x")), int(off.get("y")),
+                        int(ext.get("cx")), int(ext.get("cy")))
+    prstGeom = _child(spPr, _T["a:prstGeom"])
+    geometry = prstGeom.get("prst") if prstGeom is not None else "rect"
+
+    style = _child(sp, _T["p:style"])
+    fill = _color(spPr)
+    if fill is None and _child(spPr, _T["a:noFill"]) is None and style is not None:
+        fill = THEME_COLORS["accent1"]
+
+    ln = _child(spPr, _T["a:ln"])
+    line, line_width = None, 0
+    if ln is not None and _child(ln, _T["a:noFill"]) is not None:
+        line = None
+    elif ln is not None and _color(ln) is not None:
+        line = _color(ln)
+        line_width = int(ln.get("w", DEFAULT_LINE_WIDTH))
+    elif style is not None:
+        line = "385D8A"  # accent1 shaded, as drawn by the default lnRef
+        line_width = int(ln.get("w", DEFAULT_LINE_WIDTH)) if ln is not None else DEFAULT_LINE_WIDTH
+
+    text = None
+    txBody = _child(sp, _T["p:txBody"])
+    if txBody is not None:
+        style_color = "000000"
+        if style is not None:
+            font_ref = _child(style, _T["a:fontRef"])
+            scheme = _child(font_ref, _T["a:schemeClr"]) if font_ref is not None else None
+            if scheme is not None:
+                style_color = THEME_COLORS.get(scheme.get("val"), style_color)
+        text = _plan_text(txBody, w, is_textbox, style_color)
+        if not any(p.text for p in text.paragraphs):
+            text = None
+
+    return PlanShape(int(cNvPr.get("id")), cNvPr.get("name", ""), geometry, is_textbox,
+                     x, y, w, h, fill, line, line_width, text)
+
+
+def _apply(transform, x, y, w, h):
+    ox, oy, sx, sy = transform
+    return round(ox + x * sx), round(oy + y * sy), round(w * sx), round(h * sy)
+
+
+def _group_transform(grpSp, transform):
+    xfrm = _child(_child(grpSp, _T["p:grpSpPr"]), _T["a:xfrm"])
+    if xfrm is None:
+        return transform
+    off, ext = _child(xfrm, _T["a:off"]), _child(xfrm, _T["a:ext"])
+    ch_off, ch_ext = _child(xfrm, _T["a:chOff"]), _child(xfrm, _T["a:chExt"])
+    if off is None or ext is None or ch_off is None or ch_ext is None:
+        return transform
+    cx, cy = int(ch_ext.get("cx")) or 1, int(ch_ext.get("cy")) or 1
+    gx = int(ext.get("cx")) / cx
+    gy = int(ext.get("cy")) / cy
+    # child -> group frame: off + (child - chOff) * scale, then the parent transform
+    ox, oy, sx, sy = transform
+    local_ox = int(off.get("x")) - int(ch_off.get("x")) * gx
+    local_oy = int(off.get("y")) - int(ch_off.get("y")) * gy
+    return ox + local_ox * sx, oy + local_oy * sy, sx * gx, sy * gy
+
+
+def _walk(container, transform, shapes):
+    for child in container.iterchildren(_T["p:sp"], _T["p:grpSp"]):
+        if child.tag == _T["p:grpSp"]:
+            _walk(child, _group_transform(child, transform), shapes)
+        else:
+            shape = _plan_sp(child, transform)
+            if shape is not None:
+                shapes.append(shape)
+
+
+def plan_slide(slide, index, width, height):
+    """Render plan for one slide"""
+    shapes = []
+    _walk(slide.shapes._spTree, (0, 0, 1, 1), shapes)
+    background = "FFFFFF"
+    bg = _child(slide._element.cSld, _T["p:bg"])
+    if bg is not None:
+        bgPr = _child(bg, _T["p:bgPr"])
+        background = _color(bgPr) or background
+    return SlidePlan(index, width, height, background, tuple(shapes))
+
+
+def plan_deck(prs):
+    """Render plans for every slide of a Presentation, in order"""
+    width, height = prs.slide_width, prs.slide_height
+    return [plan_slide(slide, i, width, height) for i, slide in enumerate(prs.slides)]
+
+
+def text_block_height(text):
+    """Laid-out height of a PlanText's paragraphs in points (insets excluded)"""
+    total = 0.0
+    for i, p in enumerate(text.paragraphs):
+        if i:
+            total += p.space_before
+        total += line_height(p.size) * len(p.lines)
+        if i < len(text.paragraphs) - 1:
+            total += p.space_after
+    return total
+
+
+def place_text(shape):
+    """Position every line (and bullet) of a shape's text; yields PlacedLine in points"""
+    text = shape.text
+    left, top, right, bottom = (v / EMU_PER_PT for v in text.insets)
+    box_x, box_y = shape.x / EMU_PER_PT + left, shape.y / EMU_PER_PT + top
+    box_w = shape.w / EMU_PER_PT - left - right
+    box_h = shape.h / EMU_PER_PT - top - bottom
+
+    block = text_block_height(text)
+    if text.anchor == "ctr":
+        cursor = box_y + (box_h - block) / 2
+    elif text.anchor == "b":
+        cursor = box_y + box_h - block
+    else:
+        cursor = box_y
+
+    for i, p in enumerate(text.paragraphs):
+        if i:
+            cursor += p.space_before
+        margin = p.margin_left / EMU_PER_PT
+        if p.align == "ctr":
+            x = box_x + margin + (box_w - margin) / 2
+        elif p.align == "r":
+            x = box_x + box_w
+        else:
+            x = box_x + margin
+        for n, line in enumerate(p.lines):
+            baseline = cursor + p.size
+            if n == 0 and p.bullet and p.text:  # empty paragraphs show no bullet
+                yield PlacedLine(box_x + margin + p.indent / EMU_PER_PT, baseline, p.bullet, "l", p)
+            if line:
+                yield PlacedLine(x, baseline, line, p.align, p)
+            cursor += line_height(p.size)
+        cursor += p.space_after
+
+
+def text_extent(shape):
+    """Bounding box (left, top, right, bottom) in points of the text as laid out, or None"""
+    left = top = float("inf")
+    right = bottom = float("-inf")
+    for placed in place_text(shape):
+        p = placed.paragraph
+        width = text_width(placed.text, p.size, p.bold, p.font)
+        x = placed.x - (width / 2 if placed.align == "ctr" else width if placed.align == "r" else 0)
+        left, right = min(left, x), max(right, x + width)
+        top, bottom = min(top, placed.baseline - p.size), max(bottom, placed.baseline + p.size * (LINE_SPACING - 1))
+    return None if left == float("inf") else (left, top, right, bottom)
@@ -0,0 +1,197 @@
+"""
+Local Render Service
+HTTP front end over a pool of pre-warmed deck rendering workers
+
+    python render_service.py --port 8765 --workers 4
+
+    POST /render   {"theme": "consulting", "spec": {...}}  -> .pptx bytes
+    GET  /stats    queue depth, in-flight jobs, p50/p99 latency
+    GET  /health   liveness probe
+"""
+import argparse
+import json
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from deck_spec import THEMES, deck_bytes, warm_themes
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class RenderStats:
+    """Thread-safe counters and a rolling latency window"""
+
+    def __init__(self, window=1000):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=window)
+
+    def enqueue(self):
+        with self._lock:
+            self.queued += 1
+
+    def start(self):
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+
+    def finish(self, seconds, ok=True):
+        with self._lock:
+            self.in_flight -= 1
+            if ok:
+                self.completed += 1
+                self.latencies.append(seconds)
+            else:
+                self.failed += 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = list(self.latencies)
+            snapshot = {
+                "queue_depth": self.queued,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+        p50, p99 = percentile(latencies, 50), percentile(latencies, 99)
+        snapshot["p50_ms"] = round(p50 * 1000, 2) if p50 is not None else None
+        snapshot["p99_ms"] = round(p99 * 1000, 2) if p99 is not None else None
+        return snapshot
+
+
+class RenderPool:
+    """Process pool whose workers are started and warmed before the first request"""
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.stats = RenderStats()
+        self._slots = threading.BoundedSemaphore(workers)
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_themes)
+        # Force every worker to spawn now rather than on the first requests
+        warmups = [self._executor.submit(time.sleep, 0.05) for _ in range(workers)]
+        for future in warmups:
+            future.result()
+
+    def render(self, spec, theme):
+        """Render one deck, waiting for a free worker; returns .pptx bytes"""
+        self.stats.enqueue()
+        self._slots.acquire()
+        self.stats.start()
+        started = time.perf_counter()
+        ok = False
+        try:
+            data = self._executor.submit(deck_bytes, spec, theme).result()
+            ok = True
+            return data
+        finally:
+            self._slots.release()
+            self.stats.finish(time.perf_counter() - started, ok)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Routes /render, /stats and /health to the server's RenderPool"""
+
+    server_version = "DeckRender/1.0"
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send_json(200, self.server.pool.stats.snapshot())
+        elif self.path == "/health":
+            self._send_json(200, {"status": "ok", "workers": self.server.pool.workers})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            theme = request.get("theme", "classic")
+            if not isinstance(theme, str) or theme not in THEMES:
+                raise ValueError(f"Unknown theme {theme!r}; expected one of: {', '.join(THEMES)}")
+            spec = request.get("spec")
+            if spec is not None and not isinstance(spec, dict):
+                raise ValueError("'spec' must be a JSON object")
+            data = self.server.pool.render(spec, theme)
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", PPTX_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Content-Disposition", f'attachment; filename="deck_{theme}.pptx"')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8765, workers=4, quiet=False):
+    """Create the HTTP server with a warmed render pool attached"""
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.pool = RenderPool(workers)
+    server.quiet = quiet
+    return server
+
+
+def serve(host="127.0.0.1", port=8765, workers=4, quiet=False):
+    """Run the render service until interrupted"""
+    server = make_server(host, port, workers, quiet)
+    print(f"Render service listening on http://{host}:{server.server_port} ({workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP deck render service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--quiet", action="store_true", help="Suppress per-request logging")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.workers, args.quiet)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Shape ID Allocation
+Constant-time shape IDs for slides built shape by shape
+
+    with shape_ids.tracking():
+        build_slides(prs)
+
+    @shape_ids.tracking()
+    def build_presentation(): ...
+
+python-pptx picks each new shape's ID by collecting every @id in the slide
+(an XPath over the whole document), so adding n shapes costs O(n^2). While
+a tracking() block is running, the first allocation on a slide scans it
+and later ones increment a per-slide counter, shared by the slide's shape
+tree and any group shapes inside it. Outside the block python-pptx
+allocates as usual: the generators opt in around their build functions,
+and nothing is patched by importing them.
+
+Blocks nest and may run on several threads at once; the patch is removed
+and the counters are forgotten when the last one exits, so a slide edited
+later (or in between) is scanned afresh the next time.
+
+Shapes added through python-pptx's shape collections are tracked
+automatically. Code that inserts shape XML directly must take its IDs
+from reserve_shape_ids() so the counter stays ahead of every ID in use.
+"""
+import threading
+import weakref
+from contextlib import contextmanager
+
+from lxml import etree
+from pptx.oxml.shapes.groupshape import CT_GroupShape
+from pptx.shapes.shapetree import _BaseShapes
+
+# Slide (or layout/master) root element -> highest shape ID handed out so far
+_max_ids = weakref.WeakKeyDictionary()
+_ID_VALUES = etree.XPath("//@id")  # compiled once; python-pptx's max_shape_id recompiles it per call
+_ORIGINAL_SHAPES_NEXT_ID = _BaseShapes._next_shape_id
+_ORIGINAL_GROUP_NEXT_ID = CT_GroupShape._next_shape_id
+_lock = threading.Lock()
+_depth = 0  # tracking() blocks currently running, across threads
+
+
+def _max_shape_id(element):
+    """Highest numeric @id in the document containing `element` (CT_GroupShape.max_shape_id)"""
+    ids = [int(value) for value in _ID_VALUES(element) if value.isdigit()]
+    return max(ids) if ids else 0
+
+
+def reserve_shape_ids(element, count=1):
+    """Reserve `count` consecutive IDs in the document containing `element`; returns the first"""
+    if not _depth:
+        return _max_shape_id(element) + 1
+    root = element.getroottree().getroot()
+    current = _max_ids.get(root)
+    if current is None:
+        current = _max_shape_id(element)
+    _max_ids[root] = current + count
+    return current + 1
+
+
+def _shapes_next_shape_id(shapes):
+    # Keep python-pptx's opt-in "turbo add" mode working as before
+    if shapes._cached_max_shape_id is not None:
+        shapes._cached_max_shape_id += 1
+        return shapes._cached_max_shape_id
+    return reserve_shape_ids(shapes._spTree)
+
+
+@contextmanager
+def tracking():
+    """Allocate shape IDs from per-slide counters while the block runs (nests; usable as a decorator)"""
+    global _depth
+    with _lock:
+        if not _depth:
+            _BaseShapes._next_shape_id = property(_shapes_next_shape_id)
+            CT_GroupShape._next_shape_id = property(reserve_shape_ids)
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+            if not _depth:
+                _BaseShapes._next_shape_id = _ORIGINAL_SHAPES_NEXT_ID
+                CT_GroupShape._next_shape_id = _ORIGINAL_GROUP_NEXT_ID
+                _max_ids.clear()
@@ -0,0 +1,103 @@
+"""
+Slide Append
+Constant-time slide creation for decks with thousands of slides
+
+    with slide_append.tracking():
+        for spec in specs:
+            add_spec_slide(prs, module, spec)
+
+    @slide_append.tracking()
+    def build_presentation(): ...
+
+Adding a slide through python-pptx costs O(n) in the slides already
+present: the presentation part rebuilds a by-type index of all its
+relationships to check whether the new slide part is already related,
+and the next slide ID comes from an XPath over every p:sldId. While a
+tracking() block is running, the partname number and slide ID come from
+counters seeded on each presentation's first append (from the highest
+number and ID in use, so gaps left by a loaded or edited deck are never
+reused), and the relationship is added directly. Its rId probe starts at
+len + 1 and counts down to the first free rId, as python-pptx's does.
+
+Blocks nest and may run on several threads at once; the patch is removed
+and the counters are forgotten when the last one exits. Slides must be
+added through prs.slides.add_slide inside a block for the counters to
+stay ahead of the IDs in use. prs.slides.add_slide keeps its signature
+and behaviour, so the slide profiler and any other wrappers of
+Slides.add_slide still apply.
+"""
+import threading
+import weakref
+from contextlib import contextmanager
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationships
+from pptx.opc.packuri import PackURI
+from pptx.oxml.presentation import CT_SlideIdList
+from pptx.parts.presentation import PresentationPart
+from pptx.parts.slide import SlidePart
+
+MAX_SLIDE_ID = 2147483647
+
+# p:sldIdLst element -> highest slide ID handed out so far
+_max_slide_ids = weakref.WeakKeyDictionary()
+# PresentationPart -> next slide partname number
+_next_slide_numbers = weakref.WeakKeyDictionary()
+_ORIGINAL_ADD_SLIDE = PresentationPart.add_slide
+_ORIGINAL_NEXT_ID = CT_SlideIdList._next_id
+# Private in python-pptx; without it new slides are related through the public (scanning) relate_to
+_ADD_RELATIONSHIP = getattr(_Relationships, "_add_relationship", None)
+_lock = threading.Lock()
+_depth = 0  # tracking() blocks currently running, across threads
+
+
+def _first_slide_number(part):
+    """One past the highest /ppt/slides/slideN.xml number related to `part`"""
+    numbers = [rel.target_part.partname.idx for rel in part.rels.values()
+               if rel.reltype == RT.SLIDE and not rel.is_external]
+    return max([n for n in numbers if n is not None], default=0) + 1
+
+
+def _add_slide(part, slide_layout):
+    """PresentationPart.add_slide without the relationship scan"""
+    number = _next_slide_numbers.get(part)
+    if number is None:
+        number = _first_slide_number(part)
+    _next_slide_numbers[part] = number + 1
+    slide_part = SlidePart.new(PackURI(f"/ppt/slides/slide{number}.xml"), part.package, slide_layout.part)
+    if _ADD_RELATIONSHIP is None:
+        return part.relate_to(slide_part, RT.SLIDE), slide_part.slide
+    # A brand-new part cannot already be related, so skip get_or_add's search
+    return _ADD_RELATIONSHIP(part.rels, RT.SLIDE, slide_part), slide_part.slide
+
+
+def _next_slide_id(sldIdLst):
+    current = _max_slide_ids.get(sldIdLst)
+    if current is None or current >= MAX_SLIDE_ID:
+        # First slide added to this deck, or IDs exhausted: python-pptx scans and reuses gaps
+        next_id = _ORIGINAL_NEXT_ID.fget(sldIdLst)
+    else:
+        next_id = current + 1
+    _max_slide_ids[sldIdLst] = next_id
+    return next_id
+
+
+@contextmanager
+def tracking():
+    """Create slides from per-presentation counters while the block runs (nests; usable as a decorator)"""
+    global _depth
+    with _lock:
+        if not _depth:
+            PresentationPart.add_slide = _add_slide
+            CT_SlideIdList._next_id = property(_next_slide_id)
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _depth -= 1
+            if not _depth:
+                PresentationPart.add_slide = _ORIGINAL_ADD_SLIDE
+                CT_SlideIdList._next_id = _ORIGINAL_NEXT_ID
+                _max_slide_ids.clear()
+                _next_slide_numbers.clear()
@@ -0,0 +1,172 @@
+"""
+Per-Slide Build Profiler
+Wall time, shape/run counts and XML size for every slide a deck build creates
+
+    python deckgen.py render --theme creative --profile slides
+    python deckgen.py batch --theme all --profile slides --profile-out slides.json --jobs 1
+
+While active, Slides.add_slide is wrapped so each slide's build time runs
+from its add_slide call to the next one (or to the start of saving), and
+the calling function and line are recorded so slides map back to the
+"# ==== SLIDE N" sections. With --pdf, planning the deck and writing the
+PDF are timed as phases of their own rather than as part of the last
+slide. Nothing is patched when the profiler is not in use, so normal
+builds pay nothing.
+"""
+import json
+import sys
+import time
+import zlib
+from contextlib import contextmanager
+
+from lxml import etree
+from pptx.oxml.ns import qn
+from pptx.slide import Slides
+
+import deck_output
+import pdf_export
+from deck_budget import SHAPE_TAGS
+
+RUN_TAG = qn("a:r")
+
+
+class _DeckRecord:
+    """Slides of one Presentation in creation order, with their start times"""
+
+    def __init__(self):
+        self.slides = []  # (slide, started, caller)
+        self.finished = None
+        self.phases = {}  # phase name -> seconds spent after the slides were built
+
+    def end_times(self, fallback):
+        starts = [started for _, started, _ in self.slides[1:]]
+        return starts + [self.finished or fallback]
+
+
+class SlideProfile:
+    """Collects slide build timings while profile_slides() is active"""
+
+    def __init__(self):
+        self._decks = {}  # id(Slides parent element) -> _DeckRecord
+        self._order = []
+        self._stopped = None
+
+    def _record(self, slides, slide, started, frame):
+        key = id(slides._sldIdLst)
+        deck = self._decks.get(key)
+        if deck is None:
+            deck = self._decks[key] = _DeckRecord()
+            self._order.append((deck, slides))
+        caller = f"{frame.f_code.co_name} ({frame.f_code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})"
+        deck.slides.append((slide, started, caller))
+
+    def _finish(self, prs):
+        deck = self._decks.get(id(prs.slides._sldIdLst))
+        if deck is not None and deck.finished is None:
+            deck.finished = time.perf_counter()
+
+    def _phase(self, prs, name, seconds):
+        deck = self._decks.get(id(prs.slides._sldIdLst))
+        if deck is not None:
+            deck.phases[name] = deck.phases.get(name, 0.0) + seconds
+
+    def report(self):
+        """One entry per profiled deck, each with per-slide rows"""
+        decks = []
+        for deck, _ in self._order:
+            rows = []
+            for (slide, started, caller), ended in zip(deck.slides, deck.end_times(self._stopped)):
+                element = slide._element
+                xml = etree.tostring(element, encoding="UTF-8", standalone=True)
+                runs = shapes = 0
+                for node in element.iter(RUN_TAG, *SHAPE_TAGS):
+                    if node.tag == RUN_TAG:
+                        runs += 1
+                    else:
+                        shapes += 1
+                rows.append({
+                    "slide": len(rows) + 1,
+                    "caller": caller,
+                    "ms": round((ended - started) * 1000, 2),
+                    "shapes": shapes,
+                    "runs": runs,
+                    "xml_bytes": len(xml),
+                    "compressed_bytes": len(zlib.compress(xml, 6)),
+                })
+            decks.append({"slides": rows, "total_ms": round(sum(r["ms"] for r in rows), 2),
+                          "phases": {f"{name}_ms": round(seconds * 1000, 2) for name, seconds in deck.phases.items()}})
+        return decks
+
+
+@contextmanager
+def profile_slides():
+    """Profile every slide created inside the block; yields the SlideProfile"""
+    profile = SlideProfile()
+    original_add_slide = Slides.add_slide
+    original_check = deck_output._check_before_save
+    original_plan_deck = pdf_export.plan_deck
+    original_save_pdf = pdf_export.save_pdf
+
+    def add_slide(slides, slide_layout):
+        started = time.perf_counter()
+        slide = original_add_slide(slides, slide_layout)
+        profile._record(slides, slide, started, sys._getframe(1))
+        return slide
+
+    def check_before_save(prs, *args, **kwargs):
+        profile._finish(prs)
+        return original_check(prs, *args, **kwargs)
+
+    def plan_deck(prs, *args, **kwargs):
+        profile._finish(prs)  # planning starts once the slides are built
+        started = time.perf_counter()
+        try:
+            return original_plan_deck(prs, *args, **kwargs)
+        finally:
+            profile._phase(prs, "plan", time.perf_counter() - started)
+
+    def save_pdf(prs, *args, **kwargs):
+        profile._finish(prs)
+        record = profile._decks.get(id(prs.slides._sldIdLst))
+        planned = record.phases.get("plan", 0.0) if record else 0.0
+        started = time.perf_counter()
+        try:
+            return original_save_pdf(prs, *args, **kwargs)
+        finally:
+            # Planning done inside save_pdf (no plans passed) is already counted as its own phase
+            replanned = record.phases.get("plan", 0.0) - planned if record else 0.0
+            profile._phase(prs, "pdf", time.perf_counter() - started - replanned)
+
+    Slides.add_slide = add_slide
+    deck_output._check_before_save = check_before_save
+    pdf_export.plan_deck = plan_deck
+    pdf_export.save_pdf = save_pdf
+    try:
+        yield profile
+    finally:
+        profile._stopped = time.perf_counter()
+        Slides.add_slide = original_add_slide
+        deck_output._check_before_save = original_check
+        pdf_export.plan_deck = original_plan_deck
+        pdf_export.save_pdf = original_save_pdf
+
+
+def format_report(decks):
+    """Text table per deck, slowest slides easy to spot"""
+    lines = []
+    for number, deck in enumerate(decks, 1):
+        lines.append(f"deck {number}: {len(deck['slides'])} slides, {deck['total_ms']:.1f} ms building slides")
+        if deck.get("phases"):
+            lines.append("then " + ", ".join(f"{name[:-3]} {ms:.1f} ms" for name, ms in deck["phases"].items()))
+        lines.append(f"{'slide':>5}{'ms':>9}{'shapes':>8}{'runs':>7}{'xml KB':>9}{'zip KB':>9}  caller")
+        for row in deck["slides"]:
+            lines.append(f"{row['slide']:>5}{row['ms']:>9.1f}{row['shapes']:>8}{row['runs']:>7}"
+                         f"{row['xml_bytes'] / 1024:>9.1f}{row['compressed_bytes'] / 1024:>9.1f}  {row['caller']}")
+    return "\n".join(lines)
+
+
+def write_report(decks, path):
+    """Write the JSON report"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"decks": decks}, f, indent=2)
+    return path
@@ -0,0 +1,125 @@
+"""
+Sampling Profiler
+Low-overhead statistical profiler built on SIGPROF (Unix, stdlib only)
+
+    python deckgen.py render --theme creative --profile sample
+    python deckgen.py batch --theme all --profile sample --profile-out batch.collapsed
+
+Every `interval` seconds of CPU time the interpreter is interrupted and the
+current Python stack is counted. Output is speedscope JSON (open it at
+https://www.speedscope.app) when the file name ends in .json, otherwise
+collapsed stacks ("a;b;c 12") for flamegraph.pl and similar tools.
+"""
+import json
+import os
+import signal
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+DEFAULT_INTERVAL = 0.001
+
+
+def _frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Counts Python stacks of the main thread on a CPU-time timer"""
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        if not hasattr(signal, "setitimer"):
+            raise OSError("The sampling profiler needs signal.setitimer (Unix only)")
+        self.interval = interval
+        self.stacks = Counter()  # tuple of code objects, root first -> samples
+        self.cpu_seconds = 0.0
+        self._previous = None
+        self._cpu_start = None
+
+    def _sample(self, signum, frame):
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        self.stacks[tuple(codes)] += 1
+
+    def start(self):
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        self._cpu_start = time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        self.cpu_seconds += time.process_time() - self._cpu_start
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    @property
+    def samples(self):
+        return sum(self.stacks.values())
+
+    @property
+    def sample_weight(self):
+        """CPU seconds each sample stands for; the kernel may tick slower than `interval`"""
+        return self.cpu_seconds / self.samples if self.samples else self.interval
+
+    def collapsed(self):
+        """Collapsed-stack text, one "frame;frame;frame count" line per distinct stack"""
+        lines = [";".join(_frame_name(code) for code in stack) + f" {count}"
+                 for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name="deckgen"):
+        """speedscope file-format dict with one sampled profile"""
+        frames, index = [], {}
+        samples, weights = [], []
+        weight = self.sample_weight
+        for stack, count in self.stacks.most_common():
+            ids = []
+            for code in stack:
+                if code not in index:
+                    index[code] = len(frames)
+                    frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+                ids.append(index[code])
+            samples.append(ids)
+            weights.append(count * weight)
+        total = sum(weights)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "deckgen stack_sampler",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled", "name": name, "unit": "seconds",
+                "startValue": 0, "endValue": total, "samples": samples, "weights": weights,
+            }],
+        }
+
+    def write(self, path, name="deckgen"):
+        """Write speedscope JSON (*.json) or collapsed stacks (anything else)"""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(self.speedscope(name), f)
+            else:
+                f.write(self.collapsed())
+        return path
+
+    def top_functions(self, count=15):
+        """(frame name, self samples, total samples) for the functions with the most self time"""
+        own, total = Counter(), Counter()
+        for stack, samples in self.stacks.items():
+            own[stack[-1]] += samples
+            for code in set(stack):
+                total[code] += samples
+        return [(_frame_name(code), own[code], total[code]) for code, _ in own.most_common(count)]
+
+
+@contextmanager
+def sampling(interval=DEFAULT_INTERVAL):
+    """Sample the main thread for the duration of the block; yields the StackSampler"""
+    sampler = StackSampler(interval)
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
@@ -0,0 +1,111 @@
+"""
+SVG Slide Preview
+Draw render plans as standalone SVG files and a thumbnail contact sheet
+
+    python deckgen.py preview --theme creative --out build/preview/
+    python deckgen.py preview build/deck.pptx --out build/preview/
+
+Pure Python: no LibreOffice or fonts needed. Geometry and colours are exact;
+text is positioned from the cached metrics in text_metrics, so line breaks
+match PowerPoint closely but not glyph for glyph.
+"""
+import os
+from xml.sax.saxutils import escape, quoteattr
+
+from render_plan import EMU_PER_PT, place_text, plan_deck
+
+FONT_STACK = "Calibri, Carlito, 'Helvetica Neue', Arial, sans-serif"
+ROUND_RECT_RADIUS = 0.16667  # default adj of the roundRect preset
+_ANCHOR = {"l": "start", "ctr": "middle", "r": "end", "just": "start"}
+
+
+def _pt(emu):
+    return round(emu / EMU_PER_PT, 2)
+
+
+def _shape_svg(shape, out):
+    x, y, w, h = _pt(shape.x), _pt(shape.y), _pt(shape.w), _pt(shape.h)
+    if shape.fill or shape.line:
+        fill = f"#{shape.fill}" if shape.fill else "none"
+        stroke = f' stroke="#{shape.line}" stroke-width="{_pt(shape.line_width)}"' if shape.line else ""
+        if shape.geometry == "ellipse":
+            out.append(f'<ellipse cx="{round(x + w / 2, 2)}" cy="{round(y + h / 2, 2)}" '
+                       f'rx="{round(w / 2, 2)}" ry="{round(h / 2, 2)}" fill="{fill}"{stroke}/>')
+        else:
+            rx = round(min(w, h) * ROUND_RECT_RADIUS, 2) if shape.geometry == "roundRect" else 0
+            radius = f' rx="{rx}"' if rx else ""
+            out.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}"{radius} fill="{fill}"{stroke}/>')
+    if shape.text is not None:
+        _text_svg(shape, out)
+
+
+def _text_svg(shape, out):
+    for placed in place_text(shape):
+        p = placed.paragraph
+        style = (f' font-size="{p.size}" fill="#{p.color}"'
+                 + (' font-weight="bold"' if p.bold else "")
+                 + (' font-style="italic"' if p.italic else ""))
+        out.append(f'<text x="{round(placed.x, 2)}" y="{round(placed.baseline, 2)}" '
+                   f'text-anchor="{_ANCHOR.get(placed.align, "start")}" xml:space="preserve"'
+                   f'{style}>{escape(placed.text)}</text>')
+
+
+def slide_body(plan):
+    """SVG elements for one slide plan, in points, without the outer <svg>"""
+    out = [f'<rect width="{_pt(plan.width)}" height="{_pt(plan.height)}" fill="#{plan.background}"/>']
+    for shape in plan.shapes:
+        _shape_svg(shape, out)
+    return "\n".join(out)
+
+
+def slide_svg(plan):
+    """Standalone SVG document for one slide plan"""
+    width, height = _pt(plan.width), _pt(plan.height)
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+            f'width="{width}pt" height="{height}pt" font-family={quoteattr(FONT_STACK)}>\n'
+            f'{slide_body(plan)}\n</svg>\n')
+
+
+def deck_svgs(prs):
+    """(plans, svgs) for every slide of a Presentation"""
+    plans = plan_deck(prs)
+    return plans, [slide_svg(plan) for plan in plans]
+
+
+def thumbnail_grid(plans, columns=4, thumb_width=240, gap=16):
+    """Contact sheet of every slide as one SVG, thumbnails `thumb_width` px wide"""
+    if not plans:
+        return '<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0"/>\n'
+    width, height = _pt(plans[0].width), _pt(plans[0].height)
+    thumb_height = round(thumb_width * height / width, 2)
+    rows = (len(plans) + columns - 1) // columns
+    sheet_w = columns * thumb_width + (columns + 1) * gap
+    sheet_h = round(rows * (thumb_height + gap) + gap, 2)
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{sheet_w}" height="{sheet_h}" '
+           f'viewBox="0 0 {sheet_w} {sheet_h}" font-family={quoteattr(FONT_STACK)}>',
+           f'<rect width="{sheet_w}" height="{sheet_h}" fill="#E5E5E5"/>']
+    for i, plan in enumerate(plans):
+        row, col = divmod(i, columns)
+        x = gap + col * (thumb_width + gap)
+        y = round(gap + row * (thumb_height + gap), 2)
+        out.append(f'<svg x="{x}" y="{y}" width="{thumb_width}" height="{thumb_height}" '
+                   f'viewBox="0 0 {width} {height}">\n{slide_body(plan)}\n</svg>')
+    out.append("</svg>\n")
+    return "\n".join(out)
+
+
+def write_svg_preview(prs, out_dir, stem="slide", columns=4):
+    """Write slide-NN.svg files plus an index.svg contact sheet; returns the written paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    plans, svgs = deck_svgs(prs)
+    paths = []
+    for plan, svg in zip(plans, svgs):
+        path = os.path.join(out_dir, f"{stem}-{plan.index + 1:02d}.svg")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(svg)
+        paths.append(path)
+    index_path = os.path.join(out_dir, "index.svg")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(thumbnail_grid(plans, columns))
+    paths.append(index_path)
+    return paths
@@ -0,0 +1,35 @@
+import bench_suite
+from bench_compare import compare_results, holm, run_ab
+
+
+def _result(samples):
+    return {"name": "macro/warm/classic", "samples_ms": samples, "median_ms": sorted(samples)[len(samples) // 2]}
+
+
+def test_clear_slowdown_regresses_at_min_samples():
+    (time,) = compare_results([_result([10, 10.5, 11, 11.5])], [_result([20, 20.5, 21, 21.5])])
+    assert time.p_value is not None and time.p_value < 0.05 and time.regressed
+
+
+def test_three_samples_fall_back_to_the_threshold():
+    (time,) = compare_results([_result([10, 10.5, 11])], [_result([20, 20.5, 21])])
+    assert time.p_value is None and time.regressed
+
+
+def test_sub_floor_slowdowns_do_not_regress():
+    old, new = _result([0.10, 0.11, 0.10, 0.11]), _result([0.13, 0.14, 0.13, 0.14])
+    (time,) = compare_results([old], [new])
+    assert time.change > 0.10 and not time.regressed
+
+
+def test_p_values_are_adjusted_across_benchmarks():
+    assert holm([0.01, None, 0.04, 0.03]) == [0.03, None, 0.06, 0.06]
+    old = [dict(_result([10, 10.5, 11, 11.5]), name=f"micro/classic/{i}") for i in range(5)]
+    new = [dict(_result([20, 20.5, 21, 21.5]), name=f"micro/classic/{i}") for i in range(5)]
+    assert not any(c.regressed for c in compare_results(old, new))
+
+
+def test_run_ab_samples_both_trees_every_round():
+    reference, current = run_ab(bench_suite.HERE, ["micro"], ["classic"], [], "classic", rounds=2)
+    assert [r["name"] for r in reference] == [r["name"] for r in current]
+    assert reference and all(len(r["samples_ms"]) == 2 for r in reference + current)
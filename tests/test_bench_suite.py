@@ -0,0 +1,58 @@
+import bench_suite
+from bench_suite import Benchmark
+from deck_spec import build_deck
+
+
+def test_summarize_reports_samples_and_per_shape_cost():
+    benchmark = Benchmark("shapes/consulting/500", None, False, {"shapes": 500})
+    result = bench_suite.summarize(benchmark, [{"seconds": 0.02}, {"seconds": 0.01}, {"seconds": 0.03}])
+    assert result == {"name": "shapes/consulting/500", "samples_ms": [20.0, 10.0, 30.0], "min_ms": 10.0,
+                      "median_ms": 20.0, "shapes": 500, "us_per_shape": 40.0}
+
+
+def test_summarize_keeps_the_highest_peak_rss_and_the_deck_size():
+    measurements = [{"seconds": 1, "size_bytes": 900, "peak_rss_kb": 70},
+                    {"seconds": 2, "size_bytes": 900, "peak_rss_kb": 90}]
+    result = bench_suite.summarize(Benchmark("scale/classic/10", None, True, {"slides": 10}), measurements)
+    assert (result["peak_rss_kb"], result["size_bytes"], result["slides"]) == (90, 900, 10)
+
+
+def test_run_benchmark_warms_up_only_when_asked():
+    for warm_up, calls in ((True, 4), (False, 3)):
+        count = []
+        benchmark = Benchmark("micro/x", lambda: count.append(1) or {"seconds": 0.001}, warm_up, {})
+        assert len(bench_suite.run_benchmark(benchmark, 3)["samples_ms"]) == 3
+        assert len(count) == calls
+
+
+def test_scale_spec_builds_the_requested_number_of_slides():
+    assert len(build_deck(bench_suite.scale_spec(12), "classic").slides) == 12
+
+
+def test_micro_benchmarks_run_and_skip_missing_helpers(monkeypatch):
+    monkeypatch.setattr(bench_suite, "MICRO", bench_suite.MICRO + [("classic", "no_such_helper", None)])
+    benchmarks = bench_suite.micro_benchmarks(["classic"], number=2)
+    names = [b.name for b in benchmarks]
+    assert names and all(name.startswith("micro/classic/") for name in names)
+    assert "micro/classic/no_such_helper" not in names
+    assert all(b.sample()["seconds"] > 0 for b in benchmarks)
+
+
+def test_scale_child_measures_a_fresh_interpreter():
+    measured = bench_suite.run_child("scale", "classic", 3)
+    assert measured["seconds"] > 0 and measured["size_bytes"] > 10000
+    assert measured["peak_rss_kb"] > 0
+
+
+def test_history_round_trip_and_table(tmp_path):
+    path = str(tmp_path / "history.json")
+    assert bench_suite.load_history(path) == []
+    result = bench_suite.summarize(Benchmark("macro/warm/classic", None, True, {}),
+                                   [{"seconds": 0.05, "size_bytes": 40960}])
+    for _ in range(2):
+        bench_suite.append_history(path, bench_suite.run_record([result]))
+    runs = bench_suite.load_history(path)
+    assert len(runs) == 2 and runs[-1]["results"] == [result]
+    header, row = bench_suite.format_results([result]).splitlines()
+    assert header.split() == ["benchmark", "min", "ms", "median", "ms", "peak", "MB", "size", "KB"]
+    assert row.split() == ["macro/warm/classic", "50.00", "50.00", "40.0"]
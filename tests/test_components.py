@@ -0,0 +1,53 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+
+import components
+from components import Component, add_text_shape
+
+
+def _draw_tag(slide, fill, label):
+    add_text_shape(slide, MSO_SHAPE.RECTANGLE, 0, 0, 1, 0.4, label, fill=fill)
+
+
+def test_templates_do_not_keep_scratch_slides():
+    tag = Component("Tag", _draw_tag, texts=("label",))
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    for i in range(20):
+        tag.add(slide, 0, i * 0.5, RGBColor(i, 0, 0), label=f"Tag {i}")
+    assert len(components._scratch_presentation().slides) == 0
+    assert [shape.shapes[0].text_frame.text for shape in slide.shapes][-1] == "Tag 19"
+
+
+def test_failed_template_build_drops_its_scratch_slide():
+    broken = Component("Broken", lambda slide, fill, label, missing: _draw_tag(slide, fill, label),
+                       texts=("label", "missing"))
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    with pytest.raises(ValueError, match="did not draw slots"):
+        broken.add(slide, 0, 0, RGBColor(0, 0, 0), label="x")
+    assert len(components._scratch_presentation().slides) == 0
+
+
+def test_concurrent_template_builds_keep_their_own_drawings():
+    tag = Component("Tag", _draw_tag, texts=("label",))
+
+    def stamp(i):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        group = tag.add(slide, 0, 0, RGBColor(i, 0, 0), label=f"Tag {i}")
+        fill = group.shapes[0].fill.fore_color.rgb
+        return group.shapes[0].text_frame.text, fill, len(components._scratch_presentation().slides)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to interleave the builds
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(stamp, range(64)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert results == [(f"Tag {i}", RGBColor(i, 0, 0), 0) for i in range(64)]
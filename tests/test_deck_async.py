@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import deck_async
+from deck_async import AsyncRenderer
+
+
+class _FakeBuild:
+    """Stands in for deck_bytes: records how many builds run at once, and can be held open"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = self.peak = self.started = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, spec, theme):
+        with self.lock:
+            self.running += 1
+            self.started += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            self.release.wait()
+            time.sleep(0.01)
+            if theme == "broken":
+                raise ValueError("bad spec")
+            return f"{theme}:{spec}".encode()
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def build(monkeypatch):
+    fake = _FakeBuild()
+    monkeypatch.setattr(deck_async, "deck_bytes", fake)
+    return fake
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        yield pool
+
+
+def test_concurrency_is_bounded(build, executor):
+    async def main():
+        renderer = AsyncRenderer(executor, max_concurrency=2)
+        return await asyncio.gather(*(renderer.render_deck(i, "classic") for i in range(8)))
+
+    assert asyncio.run(main()) == [f"classic:{i}".encode() for i in range(8)]
+    assert build.peak == 2
+
+
+def test_errors_propagate_and_free_their_slot(build, executor):
+    async def main():
+        renderer = AsyncRenderer(executor, max_concurrency=1)
+        with pytest.raises(ValueError, match="bad spec"):
+            await renderer.render_deck(None, "broken")
+        return await renderer.render_deck(None, "classic")
+
+    assert asyncio.run(main()) == b"classic:None"
+
+
+def test_real_build_errors_reach_the_caller():
+    async def main():
+        async with AsyncRenderer(max_concurrency=1) as renderer:
+            await renderer.render_deck(None, "no-such-theme")
+
+    with pytest.raises(ValueError, match="Unknown theme"):
+        asyncio.run(main())
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes(build, executor):
+    build.release.clear()
+
+    async def main():
+        renderer = AsyncRenderer(executor, max_concurrency=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await renderer.render_deck(None, "slow", timeout=0.05)
+        waiting = asyncio.ensure_future(renderer.render_deck(None, "next"))
+        await asyncio.sleep(0.1)
+        started_while_held = build.started
+        build.release.set()
+        return started_while_held, await waiting
+
+    assert asyncio.run(main()) == (1, b"next:None")
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deck_budget import Budget, BudgetExceededError, budget_violations, check_budget, load_budget, slide_usage
+from deck_output import save_presentation
+from deck_spec import build_deck
+
+
+def _count(shapes):
+    return sum(1 + (_count(shape.shapes) if shape.shape_type == MSO_SHAPE_TYPE.GROUP else 0) for shape in shapes)
+
+
+def test_usage_counts_every_shape_including_group_members():
+    prs = build_deck(None, "consulting")
+    usage = slide_usage(prs)
+    assert [u.slide for u in usage] == list(range(1, len(prs.slides) + 1))
+    assert [u.shapes for u in usage] == [_count(slide.shapes) for slide in prs.slides]
+    assert any(shape.shape_type == MSO_SHAPE_TYPE.GROUP for slide in prs.slides for shape in slide.shapes)
+    assert all(u.xml_bytes > 1000 for u in usage)
+
+
+def test_each_limit_reports_its_offenders():
+    usage = slide_usage(build_deck(None, "classic"))
+    most = max(usage, key=lambda u: u.shapes)
+    budget = Budget(max_shapes=most.shapes - 1, max_deck_shapes=sum(u.shapes for u in usage) - 1)
+    violations = budget_violations(usage, budget)
+    assert f"slide {most.slide}: {most.shapes} shapes > {most.shapes - 1}" in violations
+    assert violations[-1].startswith("deck: ")
+    assert budget_violations(usage, Budget()) == []
+
+
+def test_save_refuses_an_over_budget_deck_before_writing(tmp_path):
+    prs = build_deck(None, "creative")
+    path = tmp_path / "deck.pptx"
+    with pytest.raises(BudgetExceededError, match="Most shapes: slide"):
+        save_presentation(prs, str(path), budget=Budget(max_slide_bytes=1000))
+    assert not path.exists()
+    assert check_budget(prs, Budget(max_slide_bytes=10 ** 7))
+
+
+def test_budget_files(tmp_path):
+    path = tmp_path / "budget.json"
+    path.write_text(json.dumps({"max_shapes": 60, "max_deck_bytes": 400000}))
+    assert load_budget(path) == Budget(max_shapes=60, max_deck_bytes=400000)
+    path.write_text(json.dumps({"max_shape": 60}))
+    with pytest.raises(ValueError, match="Unknown budget fields .*max_shape"):
+        load_budget(path)
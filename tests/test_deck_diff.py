@@ -0,0 +1,70 @@
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches
+
+from deck_diff import diff_decks, diff_plans, diff_shapes, format_diff
+from deck_spec import build_deck
+from render_plan import plan_deck, plan_slide
+
+
+def _plans(titles, bullets=None):
+    slides = [{"layout": "content", "title": t, "bullets": [(bullets or {}).get(t, f"{t} detail")]}
+              for t in titles]
+    return plan_deck(build_deck({"slides": slides}, "classic"))
+
+
+def _changes(report):
+    return [(s["change"], s.get("old"), s.get("new")) for s in report["slides"]]
+
+
+def test_identical_and_shifted_slides_are_unchanged():
+    report = diff_plans(_plans("ABCD"), _plans("ABCD"))
+    assert (report["unchanged"], report["slides"]) == (4, [])
+    report = diff_plans(_plans("ABCD"), _plans("AXBCD"))
+    assert _changes(report) == [("added", None, 2)] and report["unchanged"] == 4
+
+
+def test_moves_removals_and_edits():
+    assert _changes(diff_plans(_plans("ABCD"), _plans("DABC"))) == [("moved", 4, 1)]
+    assert _changes(diff_plans(_plans("ABCD"), _plans("ABD"))) == [("removed", 3, None)]
+
+    report = diff_plans(_plans("ABCD"), _plans("ABCD", {"C": "C revised"}))
+    (slide,) = report["slides"]
+    assert (slide["change"], slide["title"]) == ("modified", "C")
+    (shape,) = slide["shapes"]
+    assert (shape["change"], shape["old_text"], shape["new_text"]) == ("text", "C detail", "C revised")
+
+
+def _slide(fill, left):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(2), Inches(1))
+    box.fill.solid()
+    box.fill.fore_color.rgb = fill
+    label = slide.shapes.add_textbox(Inches(left), Inches(3), Inches(2), Inches(1))
+    label.text_frame.text = "Label"
+    return plan_slide(slide, 0, prs.slide_width, prs.slide_height)
+
+
+def test_shape_style_changes_and_moves():
+    changes = diff_shapes(_slide(RGBColor(255, 0, 0), 1).shapes, _slide(RGBColor(0, 0, 255), 4).shapes)
+    style, moved = sorted(changes, key=lambda c: c["change"], reverse=True)
+    assert (style["change"], style["old"]["fill"], style["new"]["fill"]) == ("style", "FF0000", "0000FF")
+    assert (moved["change"], moved["old_box_in"][0], moved["shape"]["box_in"][0]) == ("moved", 1.0, 4.0)
+
+
+def test_decks_on_disk(tmp_path):
+    old, new = tmp_path / "old.pptx", tmp_path / "new.pptx"
+    build_deck({"slides": [{"layout": "content", "title": "A", "bullets": ["x"]}]}, "classic").save(old)
+    build_deck({"slides": [{"layout": "content", "title": "A", "bullets": ["y"]},
+                           {"layout": "content", "title": "B", "bullets": ["z"]}]}, "classic").save(new)
+    text = format_diff(diff_decks(str(old), str(new)))
+    assert text.splitlines() == [
+        f"--- {old} (1 slides)",
+        f"+++ {new} (2 slides)",
+        "* slide 1 'A'",
+        "    text   TextBox 5: 'x' -> 'y'",
+        "+ slide 2 'B'",
+        "0 slides unchanged, 2 with differences",
+    ]
@@ -0,0 +1,78 @@
+import random
+
+import deck_lint
+from deck_lint import TOLERANCE_PT, _Box, _overlapping_pairs
+
+
+def _box(left, top, width, height, z=0):
+    return _Box(left, top, left + width, top + height, z, None, False)
+
+
+def _brute_force(boxes):
+    boxes = sorted(boxes, key=lambda b: b.left)
+    return {(a.z, b.z) for i, b in enumerate(boxes) for a in boxes[:i]
+            if a.right > b.left + TOLERANCE_PT
+            and a.top < b.bottom - TOLERANCE_PT and a.bottom > b.top + TOLERANCE_PT}
+
+
+def test_overlapping_pairs_match_brute_force():
+    rng = random.Random(7)
+    for _ in range(50):
+        boxes = [_box(rng.randint(0, 60), rng.randint(0, 60), rng.choice((0, 0.5, 2, 10, 30)),
+                      rng.choice((0, 1, 2, 10, 30)), z) for z in range(40)]
+        found = [(a.z, b.z) for a, b in _overlapping_pairs(boxes)]
+        assert len(found) == len(set(found))
+        assert set(found) == _brute_force(boxes)
+
+
+class _CountingList(list):
+    reads = 0
+
+    def __getitem__(self, index):
+        _CountingList.reads += 1
+        return super().__getitem__(index)
+
+
+class _CountingDict(dict):
+    reads = 0
+
+    def get(self, key, default=None):
+        _CountingDict.reads += 1
+        return super().get(key, default)
+
+
+class _CountingActiveBoxes(deck_lint._ActiveBoxes):
+    """_ActiveBoxes counting the tree nodes its queries read and the boxes they report"""
+
+    reported = 0
+
+    def __init__(self, boxes):
+        super().__init__(boxes)
+        self._counts = _CountingList(self._counts)
+        self._spans = _CountingDict()
+
+    def spanning(self, y):
+        for i in super().spanning(y):
+            _CountingActiveBoxes.reported += 1
+            yield i
+
+    def starting_between(self, low, high):
+        for i in super().starting_between(low, high):
+            _CountingActiveBoxes.reported += 1
+            yield i
+
+
+def _stacked_work(count):
+    # One column of boxes that touch but never overlap: all stay active for the whole sweep
+    _CountingList.reads = _CountingDict.reads = _CountingActiveBoxes.reported = 0
+    boxes = [_box(0, i * 10, 100, 10, i) for i in range(count)]
+    assert _overlapping_pairs(boxes) == []
+    return _CountingList.reads + _CountingDict.reads + _CountingActiveBoxes.reported
+
+
+def test_overlapping_pairs_scale_near_linearly(monkeypatch):
+    # Counts the sweep's queries instead of timing them, which is too noisy on shared machines
+    monkeypatch.setattr(deck_lint, "_ActiveBoxes", _CountingActiveBoxes)
+    small, large = _stacked_work(1000), _stacked_work(8000)
+    # 8x the boxes: ~10x for O(n log n), 64x for a scan over the active boxes
+    assert large / small < 12
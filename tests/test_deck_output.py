@@ -0,0 +1,42 @@
+import io
+import zipfile
+
+from pptx import Presentation
+
+from deck_output import DETERMINISTIC_DATE_TIME, presentation_bytes, write_presentation
+from deck_spec import build_deck
+
+SPEC = {"slides": [
+    {"layout": "cover", "title": "Output", "subtitle": "Targets", "company": "XYZ", "date": "2026"},
+    {"layout": "content", "title": "Targets", "bullets": ["Bytes", "Streams"]},
+]}
+
+
+class _WriteOnly(io.RawIOBase):
+    """A pipe-like stream: writable, but no seek or tell"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+
+def test_deterministic_bytes_are_identical_across_builds():
+    first = presentation_bytes(build_deck(SPEC, "classic"), deterministic=True)
+    second = presentation_bytes(build_deck(SPEC, "classic"), deterministic=True)
+    assert isinstance(first, memoryview)
+    assert bytes(first) == bytes(second)
+    with zipfile.ZipFile(io.BytesIO(first)) as package:
+        assert {info.date_time for info in package.infolist()} == {DETERMINISTIC_DATE_TIME}
+
+
+def test_unseekable_streams_get_a_complete_package():
+    stream = _WriteOnly()
+    assert write_presentation(build_deck(SPEC, "consulting"), stream) is stream
+    prs = Presentation(io.BytesIO(b"".join(stream.chunks)))
+    assert len(prs.slides) == 2
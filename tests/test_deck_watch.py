@@ -0,0 +1,76 @@
+import os
+import threading
+from io import BytesIO
+
+import pytest
+from pptx import Presentation
+
+from deck_spec import build_deck
+from deck_watch import IncrementalRenderer, SpecWatcher
+
+
+def _slide(title):
+    return {"layout": "content", "title": title, "bullets": [f"{title} detail"]}
+
+
+def _texts(prs):
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame] for slide in prs.slides]
+
+
+def _saved(prs):
+    buffer = BytesIO()
+    prs.save(buffer)
+    return Presentation(BytesIO(buffer.getvalue()))
+
+
+def _assert_matches_fresh_build(renderer, slides):
+    saved = _saved(renderer.prs)
+    assert _texts(saved) == _texts(build_deck({"slides": slides}, "consulting"))
+    partnames = [slide.part.partname for slide in saved.slides]
+    assert partnames == [f"/ppt/slides/slide{n}.xml" for n in range(1, len(slides) + 1)]
+
+
+def test_only_new_and_edited_slides_are_rebuilt():
+    renderer = IncrementalRenderer("consulting")
+    slides = [_slide(t) for t in "ABCD"]
+    assert renderer.update({"slides": slides}) == [0, 1, 2, 3]
+
+    steps = [
+        ([_slide(t) for t in "DBCA"], []),           # reorder
+        ([_slide(t) for t in "DBXCA"], [2]),         # insert
+        ([_slide(t) for t in "DXA"], []),            # remove
+        ([_slide(t) for t in "DXA"] + [_slide("A")], [3]),  # a duplicate needs its own slide
+        ([_slide("D"), _slide("Y"), _slide("A")], [1]),     # edit
+    ]
+    for slides, rebuilt in steps:
+        assert renderer.update({"slides": slides}) == rebuilt
+        _assert_matches_fresh_build(renderer, slides)
+
+
+def test_a_failed_update_starts_over_next_time():
+    renderer = IncrementalRenderer("consulting")
+    renderer.update({"slides": [_slide("A")]})
+    with pytest.raises(ValueError, match="Layout 'nope'"):
+        renderer.update({"slides": [_slide("A"), {"layout": "nope"}]})
+    assert renderer.update({"slides": [_slide("A"), _slide("B")]}) == [0, 1]
+    _assert_matches_fresh_build(renderer, [_slide("A"), _slide("B")])
+
+
+@pytest.mark.parametrize("force_poll", [True, False])
+def test_watcher_reports_a_changed_spec(tmp_path, force_poll):
+    spec = tmp_path / "spec.json"
+    spec.write_text("{}")
+    watcher = SpecWatcher([str(spec)], poll_interval=0.01, force_poll=force_poll)
+    try:
+        # Save the way editors do: write a temp file, then rename it over the spec
+        def save():
+            temp = tmp_path / "spec.json.tmp"
+            temp.write_text('{"slides": []}')
+            os.replace(temp, spec)
+
+        timer = threading.Timer(0.05, save)
+        timer.start()
+        assert watcher.wait(debounce=0.05, timeout=5) == {str(spec)}
+        timer.join()
+    finally:
+        watcher.close()
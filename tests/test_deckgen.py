@@ -0,0 +1,45 @@
+import json
+
+import deckgen
+from deck_spec import THEMES
+
+SPEC = {"slides": [{"layout": "content", "title": "Scope", "bullets": ["One", "Two"]}]}
+
+
+def _spec_file(tmp_path, spec=SPEC):
+    path = tmp_path / "proposal.json"
+    path.write_text(json.dumps(spec))
+    return str(path)
+
+
+def test_theme_lists_expand_all_and_drop_repeats():
+    assert deckgen.resolve_themes(None) == ["classic"]
+    assert deckgen.resolve_themes(["creative", "all", "creative"]) == ["creative"] + [
+        t for t in THEMES if t != "creative"]
+
+
+def test_deterministic_render_names_and_bytes(tmp_path, capsys):
+    spec = _spec_file(tmp_path)
+    outputs = []
+    for run in ("a", "b"):
+        out = tmp_path / run
+        out.mkdir()
+        assert deckgen.main(["render", "--spec", spec, "--theme", "consulting", "--deterministic",
+                             "--out", str(out)]) == 0
+        outputs.append((out / "proposal_consulting.pptx").read_bytes())
+    assert outputs[0] == outputs[1]
+
+    capsys.readouterr()
+    assert deckgen.main(["inspect", "--json", str(tmp_path / "a" / "proposal_consulting.pptx")]) == 0
+    assert len(json.loads(capsys.readouterr().out)["slides"]) == 1
+
+
+def test_render_to_stdout(tmp_path, capsysbinary):
+    assert deckgen.main(["render", "--spec", _spec_file(tmp_path), "--out", "-", "--deterministic"]) == 0
+    assert capsysbinary.readouterr().out[:2] == b"PK"
+
+
+def test_bad_specs_exit_2_without_a_traceback(tmp_path, capsys):
+    spec = _spec_file(tmp_path, {"slides": [{"layout": "nope"}]})
+    assert deckgen.main(["render", "--spec", spec, "--out", str(tmp_path)]) == 2
+    assert "deckgen: error: Layout 'nope'" in capsys.readouterr().err
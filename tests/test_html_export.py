@@ -0,0 +1,67 @@
+import os
+import re
+
+import lxml.html
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches
+
+from deck_spec import THEMES, build_deck
+from html_export import deck_html, export_html, theme_css, write_theme_css
+from render_plan import place_text, plan_deck
+
+SPEC = {"slides": [{"layout": "content", "title": "Scope <R&D>", "bullets": ["One", "Two"]}]}
+
+
+def _rules(css):
+    return set(re.findall(r"^\.([\w-]+) \{", css, re.MULTILINE))
+
+
+def _used_classes(page):
+    return {c for element in page.iter() for c in (element.get("class") or "").split()}
+
+
+def test_theme_pages_only_use_classes_the_shared_css_defines(tmp_path):
+    for theme in THEMES:
+        path = export_html(build_deck(None, theme), tmp_path, theme, theme)
+        page = lxml.html.parse(path).getroot()
+        assert page.find("head/link").get("href") == f"css/deck-{theme}.css"
+        assert page.find("head/style") is None  # built-in decks stay within the theme palette
+        with open(tmp_path / "css" / f"deck-{theme}.css", encoding="utf-8") as f:
+            assert _used_classes(page) - {"deck", "slide"} <= _rules(f.read())
+
+
+def test_spans_carry_the_laid_out_lines():
+    plans = plan_deck(build_deck(SPEC, "professional"))
+    page = lxml.html.fromstring(deck_html(plans, "Scope", "css/deck-professional.css", "professional"))
+    (section,) = page.find_class("slide")
+    spans = [span.text for span in section.iter("span")]
+    assert spans == [line.text for s in plans[0].shapes if s.text for line in place_text(s)]
+    assert "Scope <R&D>" in spans
+
+
+def test_colours_outside_the_palette_are_styled_on_the_page():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, 0, 0, Inches(1), Inches(1))
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor(0x0A, 0xBC, 0xDE)
+    page = lxml.html.fromstring(deck_html(plan_deck(prs), "Odd", "css/deck-classic.css", "classic"))
+    (style,) = page.findall("head/style")
+    # The fill, and the default template's outline colour, which the classic theme never draws
+    assert _rules(style.text) == {f"{kind}{color}" for kind in ("bg", "fg", "bd") for color in ("0ABCDE", "385D8A")}
+    (div,) = page.find_class("s")
+    assert div.get("class").split() == ["s", "bg0ABCDE", "bd385D8A", "e"]
+
+
+def test_theme_css_is_only_rewritten_when_it_changes(tmp_path):
+    path = write_theme_css("creative", tmp_path)
+    os.utime(path, ns=(0, 0))
+    assert write_theme_css("creative", tmp_path) == path
+    assert os.stat(path).st_mtime_ns == 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("stale")
+    write_theme_css("creative", tmp_path)
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == theme_css("creative")
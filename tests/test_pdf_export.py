@@ -0,0 +1,13 @@
+from pdf_export import _pdf_string, winansi_text
+
+
+def test_winansi_text_maps_punctuation_and_drops_the_rest():
+    assert winansi_text("Q1 → Q2") == "Q1 -> Q2"
+    assert winansi_text("non‑blocking") == "non-blocking"
+    assert winansi_text("✓ Done ▸ next") == "• Done » next"
+    assert winansi_text("🚀 Launch") == "Launch"
+    assert winansi_text("Café – 5€") == "Café – 5€"
+
+
+def test_pdf_string_never_writes_replacement_marks():
+    assert "?" not in _pdf_string(winansi_text("→ ✓ ▸ ⚡ 🚀 ❌"))
@@ -0,0 +1,94 @@
+import json
+import threading
+from http.client import HTTPConnection
+
+import pytest
+from lxml import etree
+
+from preview_server import PreviewState, make_server
+
+
+def _write(path, titles):
+    slides = [{"layout": "content", "title": t, "bullets": [f"{t} detail"]} for t in titles]
+    path.write_text(json.dumps({"slides": slides}))
+
+
+def test_refresh_reports_only_slides_whose_svg_changed(tmp_path):
+    spec = tmp_path / "spec.json"
+    _write(spec, "ABC")
+    state = PreviewState(str(spec), "consulting")
+    assert state.refresh() == [0, 1, 2]
+    _write(spec, "AXC")
+    assert state.refresh() == [1]
+    assert state.refresh() == []
+
+    good = list(state.svgs)
+    spec.write_text("{half-written")
+    assert state.refresh() == []
+    assert state.error and state.svgs == good
+
+
+@pytest.fixture
+def server(tmp_path):
+    spec = tmp_path / "spec.json"
+    _write(spec, "AB")
+    server = make_server(str(spec), "consulting", port=0)
+    server.spec = spec
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stopping = True
+    server.state.wake_all()
+    server.shutdown()
+    server.server_close()
+
+
+def _get(server, path):
+    conn = HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    conn.request("GET", path)
+    response = conn.getresponse()
+    return response.status, response.read().decode()
+
+
+def _events(response, count):
+    """The next `count` (name, data) server-sent events, skipping keepalives"""
+    events, name = [], None
+    while len(events) < count:
+        line = response.fp.readline().decode().rstrip("\n")
+        if line.startswith("event: "):
+            name = line[len("event: "):]
+        elif line.startswith("data: "):
+            events.append((name, json.loads(line[len("data: "):])))
+    return events
+
+
+def test_slides_are_served_as_svg(server):
+    status, svg = _get(server, "/slides/2.svg")
+    assert status == 200 and etree.fromstring(svg.encode()).tag == "{http://www.w3.org/2000/svg}svg"
+    assert _get(server, "/slides/3.svg")[0] == 404
+    assert _get(server, "/slides/0.svg")[0] == 404
+    assert _get(server, "/slides/x.svg")[0] == 404
+    status, page = _get(server, "/")
+    assert status == 200 and 'new EventSource("/events")' in page
+
+
+def test_event_stream_sends_only_changed_slides(server):
+    conn = HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    conn.request("GET", "/events")
+    response = conn.getresponse()
+    deck, first, second = _events(response, 3)
+    assert deck == ("deck", {"count": 2, "changed": 2, "ms": server.state.last_ms})
+    assert [first[1]["index"], second[1]["index"]] == [0, 1]
+
+    _write(server.spec, "AXY")
+    server.state.refresh()
+    (name, info), *slides = _events(response, 3)
+    assert (name, info["count"], info["changed"]) == ("deck", 3, 2)
+    assert [data["index"] for _, data in slides] == [1, 2]
+    assert slides[0][1]["svg"] == server.state.svgs[1]
+
+    server.spec.write_text("[]")
+    server.state.refresh()
+    ((name, info),) = _events(response, 1)
+    assert name == "error" and "slides" in info["error"]
+    conn.close()
@@ -0,0 +1,63 @@
+import json
+import threading
+from http.client import HTTPConnection
+from io import BytesIO
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+import deck_spec
+from render_service import make_server
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = make_server(port=0, workers=1, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.pool.shutdown()
+
+
+def _post(server, body):
+    conn = HTTPConnection("127.0.0.1", server.server_port)
+    conn.request("POST", "/render", body=body)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+@pytest.mark.parametrize("body", ["[]", '"classic"', '{"spec": []}', '{"spec": "x"}', '{"theme": ["classic"]}',
+                                  '{"spec": {"slides": ["cover"]}}', "{not json"])
+def test_malformed_requests_are_rejected_with_400(server, body):
+    status, payload = _post(server, body)
+    assert status == 400
+    assert json.loads(payload)["error"]
+
+
+def test_valid_request_renders(server):
+    spec = {"slides": [{"layout": "content", "title": "Scope", "bullets": ["One"]}]}
+    status, payload = _post(server, json.dumps({"theme": "classic", "spec": spec}))
+    assert status == 200 and payload[:2] == b"PK"
+
+
+def test_built_in_deck_renders_without_a_spec(server):
+    status, payload = _post(server, json.dumps({"theme": "consulting"}))
+    assert status == 200
+    prs = Presentation(BytesIO(payload))
+    assert len(prs.slides) == len(deck_spec.build_deck(None, "consulting").slides)
+
+
+@pytest.mark.parametrize("theme", deck_spec.THEMES)
+def test_built_in_decks_start_from_the_cached_template(theme, monkeypatch):
+    opened, original = [], deck_spec.new_presentation
+
+    def new_presentation():
+        opened.append(original())
+        return opened[-1]
+
+    monkeypatch.setattr(deck_spec, "new_presentation", new_presentation)
+    prs = deck_spec.build_deck(None, theme)
+    assert opened == [prs]
+    assert (prs.slide_width, prs.slide_height) == (Inches(10), Inches(7.5))
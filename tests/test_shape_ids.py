@@ -0,0 +1,110 @@
+from contextlib import nullcontext
+from io import BytesIO
+
+import pytest
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml.ns import qn
+from pptx.shapes.shapetree import _BaseShapes
+
+import shape_ids
+from components import Component, add_text_shape
+from z_order import Layers
+
+
+def _ids(slide):
+    return [int(c.get("id")) for c in slide.shapes._spTree.iter(qn("p:cNvPr"))]
+
+
+def _assert_unique(slide):
+    ids = _ids(slide)
+    assert len(ids) == len(set(ids)), sorted(ids)
+
+
+def _new_slide():
+    prs = Presentation()
+    return prs, prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _add_box(slide, i):
+    return slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, i * 1000, 0, 1000, 1000)
+
+
+def _draw_tag(slide, label):
+    add_text_shape(slide, MSO_SHAPE.RECTANGLE, 0, 0, 1, 0.4, label, fill=RGBColor(0, 0, 0))
+    add_text_shape(slide, MSO_SHAPE.OVAL, 0, 0, 0.4, 0.4, "!", fill=RGBColor(255, 0, 0))
+
+
+TAG = Component("Tag", _draw_tag, texts=("label",))
+
+
+@pytest.mark.parametrize("tracked", [False, True])
+def test_ids_stay_unique_around_component_stamps(tracked):
+    _, slide = _new_slide()
+    with shape_ids.tracking() if tracked else nullcontext():
+        for i in range(10):
+            _add_box(slide, i)
+            TAG.add(slide, 0, i * 0.5, label=f"Tag {i}")
+            slide.shapes.add_textbox(0, 0, 100, 100)
+    _assert_unique(slide)
+    assert len(_ids(slide)) == 1 + 10 * 5  # the tree, and per round a box, a 3-shape group and a textbox
+
+
+@pytest.mark.parametrize("tracked", [False, True])
+def test_ids_stay_unique_after_grouping(tracked):
+    _, slide = _new_slide()
+    with shape_ids.tracking() if tracked else nullcontext():
+        boxes = [_add_box(slide, i) for i in range(6)]
+        layers = Layers(slide)
+        layers.group(boxes[:3], "Left")
+        layers.group(boxes[3:], "Right")
+        layers.apply()
+        group = slide.shapes.add_group_shape()
+        group.shapes.add_shape(MSO_SHAPE.OVAL, 0, 0, 100, 100)
+        for i in range(3):
+            _add_box(slide, i)
+    _assert_unique(slide)
+
+
+def test_loaded_deck_with_gapped_ids_continues_above_the_highest():
+    prs, slide = _new_slide()
+    boxes = [_add_box(slide, i) for i in range(3)]
+    for box, shape_id in zip(boxes, (7, 3, 40)):
+        box._element.nvSpPr.cNvPr.set("id", str(shape_id))
+    buffer = BytesIO()
+    prs.save(buffer)
+
+    slide = Presentation(BytesIO(buffer.getvalue())).slides[0]
+    with shape_ids.tracking():
+        added = [_add_box(slide, i).shape_id for i in range(3)]
+        stamped = TAG.add(slide, 0, 0, label="x")
+    assert added == [41, 42, 43]
+    assert min(int(c.get("id")) for c in stamped._element.iter(qn("p:cNvPr"))) == 44
+    _assert_unique(slide)
+
+
+def test_tracking_is_scoped_and_forgets_its_counters():
+    original = _BaseShapes._next_shape_id
+    _, slide = _new_slide()
+    with shape_ids.tracking():
+        with shape_ids.tracking():
+            _add_box(slide, 0)
+        assert _BaseShapes._next_shape_id is not original  # still inside the outer block
+        _add_box(slide, 1)
+    assert _BaseShapes._next_shape_id is original
+
+    # Shapes added between two blocks are seen by the next block's first scan
+    _add_box(slide, 2)
+    _add_box(slide, 3)
+    with shape_ids.tracking():
+        _add_box(slide, 4)
+    _assert_unique(slide)
+
+
+def test_importing_a_generator_does_not_patch_python_pptx():
+    import create_consulting_presentation  # noqa: F401
+
+    assert not shape_ids._depth
+    assert _BaseShapes._next_shape_id is shape_ids._ORIGINAL_SHAPES_NEXT_ID
+
@@ -0,0 +1,140 @@
+from io import BytesIO
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationships
+from pptx.opc.packuri import PackURI
+from pptx.oxml.presentation import CT_SlideIdList
+from pptx.parts.presentation import PresentationPart
+
+import slide_append
+
+
+def _add_slides(prs, count):
+    layout = prs.slide_layouts[6]
+    return [prs.slides.add_slide(layout) for _ in range(count)]
+
+
+def _drop_slide(prs, index):
+    """Remove a slide the way deck_watch and components do"""
+    sldIdLst = prs.slides._sldIdLst
+    sld_id = sldIdLst[index]
+    sldIdLst.remove(sld_id)
+    prs.part.drop_rel(sld_id.rId)
+
+
+def _assert_consistent(prs):
+    sldIds = list(prs.slides._sldIdLst)
+    rIds = [s.rId for s in sldIds]
+    partnames = [prs.part.related_part(rId).partname for rId in rIds]
+    assert len(set(s.id for s in sldIds)) == len(sldIds)
+    assert len(set(rIds)) == len(rIds)
+    assert len(set(partnames)) == len(partnames), partnames
+    assert len([r for r in prs.part.rels.values() if r.reltype == RT.SLIDE]) == len(sldIds)
+
+
+def _reloaded(prs):
+    buffer = BytesIO()
+    prs.save(buffer)
+    return Presentation(BytesIO(buffer.getvalue()))
+
+
+def _titled(prs, slides, prefix):
+    for i, slide in enumerate(slides):
+        slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = f"{prefix}{i}"
+
+
+def _texts(prs):
+    return [slide.shapes[0].text_frame.text for slide in prs.slides]
+
+
+def test_loaded_deck_with_gaps_gets_fresh_partnames_rids_and_ids():
+    prs = Presentation()
+    _titled(prs, _add_slides(prs, 5), "old")
+    prs = _reloaded(prs)
+    # Leave gaps in the partnames, rIds and slide IDs, as hand-edited decks often have
+    _drop_slide(prs, 1)
+    _drop_slide(prs, 2)
+    prs.part.related_part(prs.slides._sldIdLst[-1].rId).partname = PackURI("/ppt/slides/slide9.xml")
+    highest_id = max(s.id for s in prs.slides._sldIdLst)
+
+    with slide_append.tracking():
+        added = _add_slides(prs, 4)
+    _titled(prs, added, "new")
+
+    _assert_consistent(prs)
+    assert [slide.part.partname.idx for slide in added] == [10, 11, 12, 13]
+    assert min(slide.slide_id for slide in added) == highest_id + 1
+    assert _texts(_reloaded(prs)) == ["old0", "old2", "old4", "new0", "new1", "new2", "new3"]
+
+
+def test_dropping_and_re_adding_slides_keeps_every_slide():
+    prs = Presentation()
+    with slide_append.tracking():
+        _titled(prs, _add_slides(prs, 6), "a")
+        _drop_slide(prs, 0)
+        _drop_slide(prs, 3)
+        _titled(prs, _add_slides(prs, 3), "b")
+    _assert_consistent(prs)
+    # A later block starts from the deck as it is now, whatever was dropped in between
+    _drop_slide(prs, 2)
+    _drop_slide(prs, -1)
+    with slide_append.tracking():
+        _titled(prs, _add_slides(prs, 2), "c")
+    _assert_consistent(prs)
+    assert _texts(_reloaded(prs)) == ["a1", "a2", "a5", "b0", "b1", "c0", "c1"]
+
+
+def test_tracking_is_scoped():
+    with slide_append.tracking():
+        with slide_append.tracking():
+            pass
+        assert PresentationPart.add_slide is slide_append._add_slide
+    assert PresentationPart.add_slide is slide_append._ORIGINAL_ADD_SLIDE
+    assert CT_SlideIdList._next_id is slide_append._ORIGINAL_NEXT_ID
+
+
+def _count_scans(monkeypatch):
+    """Count the entries each whole-collection scan visits, across all parts"""
+    scans = {"sldId": 0, "rels": 0}
+    original_next_id = slide_append._ORIGINAL_NEXT_ID.fget
+    original_by_type = _Relationships._rels_by_reltype.fget
+
+    def next_id(sldIdLst):
+        scans["sldId"] += len(sldIdLst)
+        return original_next_id(sldIdLst)
+
+    def by_type(rels):
+        scans["rels"] += len(rels)
+        return original_by_type(rels)
+
+    monkeypatch.setattr(slide_append, "_ORIGINAL_NEXT_ID", property(next_id))
+    monkeypatch.setattr(_Relationships, "_rels_by_reltype", property(by_type))
+    return scans
+
+
+def test_scans_do_not_grow_with_the_deck(monkeypatch):
+    """1k vs 10k slides, compared by entries scanned rather than by (noisy) timings"""
+    scans = _count_scans(monkeypatch)
+    visited = {}
+    for size in (1000, 10000):
+        scans.update(sldId=0, rels=0)
+        prs = Presentation()
+        with slide_append.tracking():
+            _add_slides(prs, size)
+        assert len(prs.slides) == size
+        visited[size] = dict(scans)
+    # Untracked, every slide would scan the slide list and the presentation's relationships
+    assert visited[1000] == visited[10000]
+    assert visited[10000]["sldId"] == 0  # the one scan, for the first slide, finds an empty list
+
+
+def test_falls_back_to_relate_to_without_the_private_helper(monkeypatch):
+    scans = _count_scans(monkeypatch)
+    monkeypatch.setattr(slide_append, "_ADD_RELATIONSHIP", None)
+    prs = Presentation()
+    with slide_append.tracking():
+        _titled(prs, _add_slides(prs, 20), "s")
+    _assert_consistent(prs)
+    assert scans["rels"] >= sum(range(20))  # relate_to indexes every existing relationship
+    assert _texts(_reloaded(prs)) == [f"s{i}" for i in range(20)]
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+from pptx import Presentation
+from pptx.slide import Slides
+
+import deck_output
+import pdf_export
+import slide_profiler
+from deck_budget import slide_usage
+from deck_output import save_presentation
+from deck_spec import build_deck
+from slide_profiler import format_report, profile_slides, write_report
+
+
+def _deck_report(profile, prs):
+    """The report entry for `prs` (component stamps are drawn on a scratch deck that is profiled too)"""
+    decks = [deck for deck in profile.report() if len(deck["slides"]) == len(prs.slides)]
+    assert len(decks) == 1
+    return decks[0]
+
+
+def test_rows_describe_each_built_slide(tmp_path):
+    with profile_slides() as profile:
+        prs = build_deck(None, "consulting")
+        save_presentation(prs, tmp_path / "deck.pptx")
+    deck = _deck_report(profile, prs)
+    rows = deck["slides"]
+    usage = slide_usage(prs)
+    assert [row["slide"] for row in rows] == [u.slide for u in usage]
+    assert [row["shapes"] for row in rows] == [u.shapes for u in usage]
+    assert [row["xml_bytes"] for row in rows] == [u.xml_bytes for u in usage]
+    assert all(0 < row["compressed_bytes"] < row["xml_bytes"] for row in rows)
+    assert [row["runs"] for row in rows] == [len(slide._element.xpath(".//a:r")) for slide in prs.slides]
+    assert rows[0]["caller"].startswith("create_cover_slide (create_consulting_presentation.py:")
+    assert deck["total_ms"] == pytest.approx(sum(row["ms"] for row in rows), abs=0.1)
+
+
+class _Clock:
+    """Stands in for the time module; advances only when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+
+def test_a_slide_is_timed_until_the_next_one_starts(tmp_path, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(slide_profiler, "time", clock)
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+    with profile_slides() as profile:
+        prs.slides.add_slide(layout)
+        clock.now += 0.25
+        prs.slides.add_slide(layout)
+        clock.now += 0.125
+        save_presentation(prs, tmp_path / "deck.pptx")
+        clock.now += 1.0  # after saving: not part of any slide
+    first, second = profile.report()[0]["slides"]
+    assert (first["ms"], second["ms"]) == (250, 125)
+    assert first["caller"].startswith("test_a_slide_is_timed_until_the_next_one_starts (test_slide_profiler.py:")
+
+
+def test_patches_are_removed_even_when_the_build_fails():
+    original_add_slide, original_check = Slides.add_slide, deck_output._check_before_save
+    with pytest.raises(RuntimeError):
+        with profile_slides():
+            assert Slides.add_slide is not original_add_slide
+            raise RuntimeError("boom")
+    assert Slides.add_slide is original_add_slide
+    assert deck_output._check_before_save is original_check
+
+
+def test_reports_round_trip(tmp_path):
+    prs = Presentation()
+    with profile_slides() as profile:
+        for _ in range(3):
+            prs.slides.add_slide(prs.slide_layouts[6])
+    decks = profile.report()
+    path = write_report(decks, tmp_path / "slides.json")
+    assert json.loads(path.read_text()) == {"decks": decks}
+    lines = format_report(decks).splitlines()
+    assert lines[0].startswith("deck 1: 3 slides, ")
+    assert lines[1].split() == ["slide", "ms", "shapes", "runs", "xml", "KB", "zip", "KB", "caller"]
+    assert len(lines) == 2 + 3
+
+
+def test_pdf_planning_and_writing_are_phases_of_their_own(tmp_path, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(slide_profiler, "time", clock)
+    plan_deck, save_pdf = pdf_export.plan_deck, pdf_export.save_pdf
+
+    def slow_plan_deck(prs):
+        clock.now += 0.5
+        return plan_deck(prs)
+
+    def slow_save_pdf(prs, path, plans=None):
+        clock.now += 0.75
+        return save_pdf(prs, path, plans)
+
+    monkeypatch.setattr(pdf_export, "plan_deck", slow_plan_deck)
+    monkeypatch.setattr(pdf_export, "save_pdf", slow_save_pdf)
+    prs = Presentation()
+    with profile_slides() as profile:
+        prs.slides.add_slide(prs.slide_layouts[6])
+        clock.now += 0.25
+        pdf_export.save_pptx_and_pdf(prs, tmp_path / "deck.pptx", tmp_path / "deck.pdf")
+        # save_pdf plans for itself when not given plans; that counts as planning, not writing
+        pdf_export.save_pdf(prs, tmp_path / "again.pdf")
+    deck = profile.report()[0]
+    assert [row["ms"] for row in deck["slides"]] == [250]
+    assert deck["phases"] == {"plan_ms": 1000, "pdf_ms": 1500}
+    assert format_report([deck]).splitlines()[1] == "then plan 1000.0 ms, pdf 1500.0 ms"
+    assert pdf_export.plan_deck is slow_plan_deck
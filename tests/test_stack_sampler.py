@@ -0,0 +1,90 @@
+import json
+import signal
+import sys
+import time
+
+import pytest
+
+from stack_sampler import StackSampler, sampling
+
+
+def _leaf(sampler, times):
+    for _ in range(times):
+        sampler._sample(signal.SIGPROF, sys._getframe())
+
+
+def _middle(sampler):
+    _leaf(sampler, 3)
+
+
+def _root(sampler):
+    _middle(sampler)
+    _leaf(sampler, 1)
+
+
+def _sampled():
+    """A sampler holding 3 samples of _root;_middle;_leaf and 1 of _root;_leaf, worth 8 ms of CPU"""
+    sampler = StackSampler(interval=0.001)
+    _root(sampler)
+    sampler.cpu_seconds = 0.008
+    return sampler
+
+
+def _tail(line, frames):
+    """The last `frames` frames of a collapsed line, without file names and line numbers"""
+    stack, count = line.rsplit(" ", 1)
+    return [name.split(" ")[0] for name in stack.split(";")[-frames:]], int(count)
+
+
+def test_collapsed_stacks():
+    lines = _sampled().collapsed().splitlines()
+    assert [_tail(line, 3) for line in lines] == [
+        (["_root", "_middle", "_leaf"], 3),
+        (["_sampled", "_root", "_leaf"], 1),
+    ]
+    assert "_leaf (test_stack_sampler.py:" in lines[0]
+
+
+def test_speedscope_weights_samples_by_measured_cpu_time():
+    profile = _sampled().speedscope("unit")
+    assert profile["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    frames = profile["shared"]["frames"]
+    (sampled,) = profile["profiles"]
+    assert sampled["type"] == "sampled" and sampled["unit"] == "seconds"
+    stacks = [[frames[i]["name"] for i in ids][-3:] for ids in sampled["samples"]]
+    assert stacks == [["_root", "_middle", "_leaf"], ["_sampled", "_root", "_leaf"]]
+    # 4 samples over 8 ms of CPU: each stands for 2 ms, not the 1 ms interval
+    assert sampled["weights"] == pytest.approx([0.006, 0.002])
+    assert sampled["endValue"] == sum(sampled["weights"])
+    assert len({(f["name"], f["file"], f["line"]) for f in frames}) == len(frames)
+
+
+def test_write_picks_the_format_from_the_file_name(tmp_path):
+    sampler = _sampled()
+    with open(sampler.write(str(tmp_path / "out.json")), encoding="utf-8") as f:
+        assert json.load(f) == sampler.speedscope()
+    with open(sampler.write(str(tmp_path / "out.collapsed")), encoding="utf-8") as f:
+        assert f.read() == sampler.collapsed()
+
+
+def test_top_functions_splits_self_and_total_samples():
+    top = {name.split(" ")[0]: (own, total) for name, own, total in _sampled().top_functions()}
+    assert top == {"_leaf": (4, 4)}
+    assert len(_sampled().top_functions(count=0)) == 0
+
+
+def _burn(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def test_sampling_a_busy_loop_restores_the_signal_handler():
+    previous = signal.getsignal(signal.SIGPROF)
+    with sampling(interval=0.001) as sampler:
+        _burn(0.2)
+    assert signal.getsignal(signal.SIGPROF) == previous
+    assert signal.getitimer(signal.ITIMER_PROF) == (0.0, 0.0)
+    assert sampler.samples > 0
+    assert sampler.cpu_seconds >= 0.2
+    assert any("_burn (test_stack_sampler.py:" in line for line in sampler.collapsed().splitlines())
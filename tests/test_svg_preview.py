@@ -0,0 +1,65 @@
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches, Pt
+
+from deck_spec import THEMES, build_deck
+from render_plan import place_text, plan_deck
+from svg_preview import deck_svgs, thumbnail_grid, write_svg_preview
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _parse(svg):
+    return etree.fromstring(svg.encode())
+
+
+def _shapes_deck():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    oval = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(1), Inches(1), Inches(2), Inches(1))
+    oval.fill.solid()
+    oval.fill.fore_color.rgb = RGBColor(0x12, 0x34, 0x56)
+    oval.line.fill.background()
+    card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, 0, Inches(3), Inches(3), Inches(2))
+    card.text_frame.text = 'R&D <"beta">'
+    card.text_frame.paragraphs[0].runs[0].font.size = Pt(20)
+    return prs
+
+
+def test_every_theme_slide_is_well_formed_and_keeps_its_text():
+    for theme in THEMES:
+        plans, svgs = deck_svgs(build_deck(None, theme))
+        for plan, svg in zip(plans, svgs):
+            texts = [t.text for t in _parse(svg).iter(f"{SVG}text")]
+            assert texts == [line.text for s in plan.shapes if s.text for line in place_text(s)]
+
+
+def test_shapes_and_escaped_text():
+    (svg,) = deck_svgs(_shapes_deck())[1]
+    root = _parse(svg)
+    assert root.get("viewBox") == "0 0 720.0 540.0"
+    (ellipse,) = root.iter(f"{SVG}ellipse")
+    assert [ellipse.get(a) for a in ("cx", "cy", "rx", "ry", "fill", "stroke")] == [
+        "144.0", "108.0", "72.0", "36.0", "#123456", None]
+    background, card = root.iter(f"{SVG}rect")
+    assert card.get("rx") == str(round(144 * 0.16667, 2)) and card.get("fill") == "#4F81BD"
+    (text,) = root.iter(f"{SVG}text")
+    assert text.text == 'R&D <"beta">'
+    assert (text.get("font-size"), text.get("text-anchor")) == ("20.0", "start")
+
+
+def test_contact_sheet_and_files(tmp_path):
+    prs = build_deck(None, "creative")
+    sheet = _parse(thumbnail_grid(plan_deck(prs), columns=4))
+    thumbs = sheet.findall(f"{SVG}svg")
+    assert len(thumbs) == len(prs.slides)
+    assert {t.get("x") for t in thumbs} == {"16", "272", "528", "784"}
+    assert _parse(thumbnail_grid([])).get("width") == "0"
+
+    paths = write_svg_preview(prs, tmp_path / "preview")
+    assert [p.rsplit("/", 1)[1] for p in paths[:2]] == ["slide-01.svg", "slide-02.svg"]
+    assert paths[-1].endswith("index.svg") and len(paths) == len(prs.slides) + 1
+    for path in paths:
+        etree.parse(path)
@@ -0,0 +1,80 @@
+from pptx import Presentation
+from pptx.util import Inches
+
+from deck_spec import build_deck
+from render_plan import plan_slide
+from text_builder import BULLET_INDENT, BULLET_LEVELS, NO_BULLET, define_style, set_paragraphs, set_text
+
+
+def _frame():
+    slide = Presentation().slides.add_slide(Presentation().slide_layouts[6])
+    return slide.shapes.add_textbox(0, 0, Inches(4), Inches(2)).text_frame
+
+
+def test_typed_bullets_are_dropped_when_the_style_draws_one():
+    define_style("test.bullet", size=14, bullet="•")
+    tf = set_paragraphs(_frame(), [("• Inputs:", NO_BULLET), "• Latest build", "- Crash logs", ["• APK"]],
+                        "test.bullet")
+    assert [p.text for p in tf.paragraphs] == ["• Inputs:", "Latest build", "Crash logs", "APK"]
+    assert set_paragraphs(_frame(), ["• Only line"], "test.bullet").paragraphs[0].text == "Only line"
+    assert set_paragraphs(_frame(), ["• Kept", "- Kept"], size=14).paragraphs[1].text == "- Kept"
+
+
+def test_prefixed_spec_bullets_render_once():
+    spec = {"slides": [{"layout": "content", "title": "Assumptions", "bullets": ["• Fast", "• Cheap"]}]}
+    prs = build_deck(spec, "classic")
+    texts = [p.text for shape in prs.slides[0].shapes if shape.has_text_frame for p in shape.text_frame.paragraphs]
+    assert "Fast" in texts and "Cheap" in texts
+    assert not any(text.startswith("•") for text in texts)
+
+
+def test_bullets_and_indents_live_in_the_list_style_once_per_level():
+    define_style("test.list", size=16, color="112233", bullet="•")
+    tf = set_paragraphs(_frame(), ["One", "Two", ["Sub a", ["Deep", ["Deeper"]]]], "test.list")
+    txBody = tf._txBody
+    (lstStyle,) = txBody.xpath("a:lstStyle")
+    levels = list(lstStyle)
+    indent = round(16 * BULLET_INDENT * 12700)
+    assert [lvl.tag.rsplit("}", 1)[1] for lvl in levels] == [f"lvl{n}pPr" for n in range(1, BULLET_LEVELS + 1)]
+    assert [(int(lvl.get("marL")), int(lvl.get("indent"))) for lvl in levels] == [
+        (indent * n, -indent) for n in range(1, BULLET_LEVELS + 1)]
+    assert txBody.xpath("a:lstStyle/*/a:buChar/@char") == ["•"] * BULLET_LEVELS
+    assert txBody.xpath("a:lstStyle/a:lvl1pPr/a:defRPr/@sz") == ["1600"]
+    assert txBody.xpath("a:lstStyle/a:lvl1pPr/a:defRPr/a:solidFill/a:srgbClr/@val") == ["112233"]
+    # Paragraphs stay bare apart from their level; nesting stops at the deepest defined level
+    assert [p.level for p in tf.paragraphs] == [0, 0, 1, 2, 2]
+    assert not txBody.xpath("a:p/a:pPr/*") and not txBody.xpath("a:p/a:r/a:rPr")
+
+
+def test_no_bullet_lines_and_single_paragraphs_carry_their_own_props():
+    define_style("test.lead", size=12, bullet="–")
+    tf = set_paragraphs(_frame(), [("Inputs:", NO_BULLET), "Build"], "test.lead")
+    lead, item = tf._txBody.xpath("a:p")
+    assert lead.xpath("a:pPr/a:buNone") and lead.xpath("a:pPr/@marL") == ["0"]
+    assert not item.xpath("a:pPr")
+
+    (p,) = set_text(_frame(), "Only", "test.lead")._txBody.xpath("a:p")
+    assert p.xpath("a:pPr/a:buChar/@char") == ["–"]
+    assert p.xpath("a:r/a:rPr/@sz") == ["1200"]
+    assert not set_text(_frame(), "Plain", size=12)._txBody.xpath(".//a:buChar")
+
+
+def test_refilling_a_frame_replaces_its_list_style():
+    tf = _frame()
+    set_paragraphs(tf, ["a", "b"], define_style("test.list", size=16, bullet="•"))
+    set_paragraphs(tf, ["c", "d", "e"], size=10)
+    assert len(tf._txBody.xpath("a:lstStyle")) == 1
+    assert not tf._txBody.xpath(".//a:buChar")
+    assert [p.text for p in tf.paragraphs] == ["c", "d", "e"]
+
+
+def test_render_plans_see_the_list_style_bullets():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(0, 0, Inches(4), Inches(2))
+    style = define_style("test.list", size=16, bullet="•")
+    set_paragraphs(box.text_frame, [("Lead", NO_BULLET), "Item", ["Nested"]], style)
+    (shape,) = plan_slide(slide, 0, prs.slide_width, prs.slide_height).shapes
+    indent = round(16 * BULLET_INDENT * 12700)
+    assert [(p.bullet, p.margin_left, p.size) for p in shape.text.paragraphs] == [
+        (None, 0, 16), ("•", indent, 16), ("•", 2 * indent, 16)]
@@ -0,0 +1,45 @@
+import pytest
+from pptx import Presentation
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.util import Inches
+
+from deck_spec import THEMES, build_deck
+from render_plan import plan_deck, plan_slide
+from text_overflow import _frame_overflow, _frames, deck_overflows, find_overflows, shape_overflow
+
+
+def _deck(auto_size):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    tf = slide.shapes.add_textbox(0, 0, Inches(1), Inches(0.3)).text_frame
+    tf.auto_size = auto_size
+    tf.text = "\n".join(["a line far too long for a one-inch box"] * 4)
+    return prs
+
+
+@pytest.mark.parametrize("find", [lambda prs: find_overflows(plan_deck(prs)), deck_overflows])
+def test_auto_fit_boxes_are_only_checked_for_width(find):
+    (overflow,) = find(_deck(MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT))
+    assert overflow.width_in > 0 and overflow.height_in == 0
+
+
+@pytest.mark.parametrize("find", [lambda prs: find_overflows(plan_deck(prs)), deck_overflows])
+def test_fixed_boxes_are_checked_for_height(find):
+    (overflow,) = find(_deck(MSO_AUTO_SIZE.NONE))
+    assert overflow.width_in > 0 and overflow.height_in > 0
+
+
+def _rounded(measured):
+    return [(name, round(horizontal, 6), round(vertical, 6)) for name, horizontal, vertical in measured]
+
+
+@pytest.mark.parametrize("theme", THEMES)
+def test_direct_measurement_matches_the_render_plan(theme):
+    prs = build_deck(None, theme)
+    for index, slide in enumerate(prs.slides):
+        plan = plan_slide(slide, index, prs.slide_width, prs.slide_height)
+        planned = [(s.name, *shape_overflow(s)) for s in plan.shapes if s.text is not None]
+        direct = [(sp[0][0].get("name"), *_frame_overflow(txBody, w, h)[:2]) for sp, txBody, w, h in _frames(slide)]
+        assert _rounded(direct) == _rounded(planned)
+    assert deck_overflows(prs, tolerance_pt=0) == find_overflows(plan_deck(prs), tolerance_pt=0)
+
@@ -0,0 +1,43 @@
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+
+from z_order import Layers
+
+
+def _slide_with(count):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    shapes = [slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, i * 100, 0, 100, 100) for i in range(count)]
+    return slide, shapes
+
+
+def test_group_keeps_members_in_place_of_the_topmost():
+    slide, (a, b, c) = _slide_with(3)
+    layers = Layers(slide)
+    group = layers.group([a, c], "Pair")
+    layers.apply()
+    assert [shape.name for shape in slide.shapes] == [b.name, "Pair"]
+    assert [shape.name for shape in group.shapes] == [a.name, c.name]
+
+
+def test_a_shape_cannot_join_two_groups():
+    slide, (a, b, c) = _slide_with(3)
+    layers = Layers(slide)
+    layers.group([a, b], "First")
+    with pytest.raises(ValueError, match="already in group 'First'"):
+        layers.group([b, c], "Second")
+    with pytest.raises(ValueError, match="same shape twice"):
+        layers.group([c, c], "Twice")
+
+
+def test_members_cannot_be_placed_relative_to_each_other():
+    slide, (a, b, c) = _slide_with(3)
+    layers = Layers(slide)
+    layers.behind(a, b)
+    with pytest.raises(ValueError, match="placed relative to"):
+        layers.group([a, b])
+    layers.group([b, c], "Pair")
+    with pytest.raises(ValueError, match="both are in group 'Pair'"):
+        layers.in_front(c, b)
+    layers.behind(a, c).apply()
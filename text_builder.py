@@ -0,0 +1,219 @@
+"""
+Paragraph Builder
+Fill a text frame with a list of lines in one pass, using named text styles
+
+    define_style("consulting.body", size=11, color=CHARCOAL, font="Calibri", space_after=8)
+
+    tf = slide.shapes.add_textbox(...).text_frame
+    set_paragraphs(tf, bullets, "consulting.body")
+    set_text(tf, title, "consulting.title", size=font_size)
+    set_paragraphs(tf, [(company, "professional.meta"), (date, "professional.date")])
+
+    define_style("classic.body", size=14, color=BLACK, space_after=8, bullet="•")
+    set_paragraphs(tf, [("Inputs:", NO_BULLET), "Latest build", ["APK", "IPA"]])
+
+Setting p.text, p.font.size, p.font.color.rgb ... per paragraph walks and
+mutates the XML once per property, and writes the same run properties
+into every paragraph. Here a multi-paragraph frame's style goes into its
+list style (a:lstStyle/a:lvl1pPr) once, and every paragraph is a bare
+<a:p><a:r><a:t>line</a:t></a:r></a:p>; a single paragraph, or one given
+its own style, carries the style's pPr/rPr directly, which is smaller.
+The XML for each distinct style is built once and cached, and the whole
+body is parsed from a single string, so a frame costs one parse instead
+of a few dozen tree edits per line.
+
+Styles are registered once (usually next to a theme's palette) under a
+dotted "theme.role" name; keyword overrides derive a variant on the fly.
+
+A style with a `bullet` character gives paragraphs a real DrawingML
+bullet (a:buChar) with a hanging indent, defined once per level in the
+list style; a nested list of lines goes one level deeper. NO_BULLET
+turns the bullet off for a single lead-in line. A line that already
+starts with a typed "• " or "- " loses that prefix when its paragraph
+gets a bullet, so older specs don't render "• • item".
+"""
+from collections import namedtuple
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+_NSDECLS = nsdecls("a", "p")
+_LST_STYLE = qn("a:lstStyle")
+_BODY_PR = qn("a:bodyPr")
+_P = qn("a:p")
+
+_EMU_PER_PT = 12700
+_TYPED_BULLETS = ("\u2022 ", "- ")
+BULLET_INDENT = 0.75  # hanging indent per level, in ems of the text size
+BULLET_LEVELS = 3  # deepest nesting; deeper lists stay at the last level
+
+# size/space_* in points, color as a hex string, align as its DrawingML value ("l", "ctr", "r", ...),
+# bullet as the bullet character ("" for none)
+TextStyle = namedtuple("TextStyle", "size color font bold italic align space_before space_after bullet",
+                       defaults=(None,) * 9)
+
+NO_BULLET = TextStyle(bullet="")
+
+STYLES = {}
+
+
+def _normalize(props):
+    if props.get("color") is not None:
+        props["color"] = str(props["color"])
+    if props.get("align") is not None:
+        props["align"] = getattr(props["align"], "xml_value", props["align"])
+    return props
+
+
+def define_style(name, **props):
+    """Register a named text style; `color` may be an RGBColor and `align` a PP_ALIGN member"""
+    style = STYLES[name] = TextStyle(**_normalize(props))
+    return style
+
+
+def get_style(style=None, **overrides):
+    """TextStyle for a registered name (or a TextStyle), with any non-None overrides applied"""
+    if isinstance(style, str):
+        try:
+            style = STYLES[style]
+        except KeyError:
+            raise KeyError(f"unknown text style '{style}'") from None
+    style = style or TextStyle()
+    overrides = {key: value for key, value in overrides.items() if value is not None}
+    return style._replace(**_normalize(overrides)) if overrides else style
+
+
+@lru_cache(maxsize=None)
+def _run_props(style):
+    attrs = "".join(f' {attr}="{value}"' for attr, value in (
+        ("sz", None if style.size is None else round(style.size * 100)),
+        ("b", None if style.bold is None else int(bool(style.bold))),
+        ("i", None if style.italic is None else int(bool(style.italic))),
+    ) if value is not None)
+    fill = f'<a:solidFill><a:srgbClr val="{style.color}"/></a:solidFill>' if style.color is not None else ""
+    latin = f"<a:latin typeface={quoteattr(style.font)}/>" if style.font is not None else ""
+    return attrs, fill + latin
+
+
+def _bullet_props(style, level):
+    """marL/indent attributes and bullet element for paragraphs at `level` (0-based)"""
+    if style.bullet is None:
+        return "", ""
+    if not style.bullet:
+        return ' marL="0" indent="0"', "<a:buNone/>"
+    indent = round((style.size or 18) * BULLET_INDENT * _EMU_PER_PT)
+    return f' marL="{indent * (level + 1)}" indent="{-indent}"', f"<a:buChar char={quoteattr(style.bullet)}/>"
+
+
+@lru_cache(maxsize=None)
+def _paragraph_props(style, tag, level=0):
+    """<a:{tag}> (a:pPr or a:lvlNpPr) with the style's alignment, spacing and bullet"""
+    margins, bullet = _bullet_props(style, level)
+    lvl = f' lvl="{level}"' if tag == "a:pPr" and level else ""
+    algn = f' algn="{style.align}"' if style.align is not None else ""
+    spacing = "".join(
+        f"<a:{spc}><a:spcPts val=\"{round(points * 100)}\"/></a:{spc}>"
+        for spc, points in (("spcBef", style.space_before), ("spcAft", style.space_after))
+        if points is not None
+    )
+    if tag == "a:pPr":
+        return f"<{tag}{margins}{lvl}{algn}>{spacing}{bullet}</{tag}>" if lvl or algn or spacing or bullet else ""
+    attrs, children = _run_props(style)
+    return f"<{tag}{margins}{algn}>{spacing}{bullet}<a:defRPr{attrs}>{children}</a:defRPr></{tag}>"
+
+
+@lru_cache(maxsize=None)
+def list_style_xml(style, levels=1):
+    """<a:lstStyle> XML giving the first `levels` levels the style's spacing, bullets and character defaults"""
+    return f"<a:lstStyle>{''.join(_paragraph_props(style, f'a:lvl{n + 1}pPr', n) for n in range(levels))}</a:lstStyle>"
+
+
+@lru_cache(maxsize=None)
+def _own_style_xml(style, level=0):
+    attrs, children = _run_props(style)
+    rpr = f"<a:rPr{attrs}>{children}</a:rPr>" if attrs or children else ""
+    end = f"<a:endParaRPr{attrs}>{children}</a:endParaRPr>" if attrs or children else ""
+    return _paragraph_props(style, "a:pPr", level), rpr, end
+
+
+def paragraph_xml(line, style=None, level=0):
+    """<a:p> XML for one line; newlines become line breaks. A `style` is written onto the paragraph itself."""
+    if style is None:
+        ppr, rpr, end = (f'<a:pPr lvl="{level}"/>' if level else ""), "", ""
+    else:
+        ppr, rpr, end = _own_style_xml(style, level)
+    if not line:
+        return f"<a:p>{ppr}{end}</a:p>" if ppr or end else "<a:p/>"
+    runs = "<a:br/>".join(f"<a:r>{rpr}<a:t>{escape(part)}</a:t></a:r>" if part else ""
+                          for part in line.replace("\v", "\n").split("\n"))
+    return f"<a:p>{ppr}{runs}</a:p>"
+
+
+def _layered(base, style):
+    """`style` on top of `base`: the fields `style` sets win"""
+    return base._replace(**{key: value for key, value in style._asdict().items() if value is not None})
+
+
+def _untyped(line, bullet):
+    """`line` without a typed bullet prefix when its paragraph draws a bullet of its own"""
+    if bullet and line:
+        for prefix in (bullet + " ", *_TYPED_BULLETS):
+            if line.startswith(prefix):
+                return line[len(prefix):]
+    return line
+
+
+def _lines_xml(lines, out, level=0, bullet=None):
+    """Append each line's paragraph XML to `out`; returns the number of levels used"""
+    levels = level + 1
+    for line in lines:
+        if isinstance(line, list):
+            levels = max(levels, _lines_xml(line, out, min(level + 1, BULLET_LEVELS - 1), bullet))
+        elif isinstance(line, tuple):
+            text, style = line
+            style = get_style(style)
+            own = bullet if style.bullet is None else style.bullet
+            out.append(paragraph_xml(_untyped(text, own), style, level))
+        else:
+            out.append(paragraph_xml(_untyped(line, bullet), None, level))
+    return levels
+
+
+def set_paragraphs(text_frame, lines, style=None, **overrides):
+    """Replace the text frame's paragraphs with one paragraph per line, sharing one list style
+
+    A line may be a (text, style) pair to give that paragraph its own style on top of the frame's,
+    or a list of lines to place them one level deeper.
+    """
+    txBody = text_frame._txBody
+    style = get_style(style, **overrides)
+    lines = lines or ("",)
+    if len(lines) == 1 and not isinstance(lines[0], list):
+        # One paragraph: the style is cheaper on the paragraph than in a list style
+        text, own = lines[0] if isinstance(lines[0], tuple) else (lines[0], None)
+        if own is not None:
+            style = _layered(style, get_style(own))
+        xml = f"<a:lstStyle/>{paragraph_xml(_untyped(text, style.bullet), style)}"
+    else:
+        parts = []
+        levels = _lines_xml(lines, parts, bullet=style.bullet)
+        xml = f"{list_style_xml(style, levels)}{''.join(parts)}"
+    body = parse_xml(f"<p:txBody {_NSDECLS}>{xml}</p:txBody>")
+    lst_style, *paragraphs = body
+
+    for p in txBody.findall(_P):
+        txBody.remove(p)
+    old = txBody.find(_LST_STYLE)
+    if old is not None:
+        txBody.replace(old, lst_style)
+    else:
+        txBody.find(_BODY_PR).addnext(lst_style)
+    txBody.extend(paragraphs)
+    return text_frame
+
+
+def set_text(text_frame, text, style=None, **overrides):
+    """Replace the text frame's text with a single styled paragraph"""
+    return set_paragraphs(text_frame, (text,), style, **overrides)
@@ -0,0 +1,111 @@
+"""
+Text Metrics
+Cached glyph widths and greedy word wrapping shared by the preview and export writers
+
+Widths come from the Helvetica / Helvetica-Bold AFM tables (units per 1000 em).
+Calibri-family text is measured with a fixed condensation factor relative to
+Helvetica, which is close enough for wrapping previews and overflow checks.
+"""
+from functools import lru_cache
+
+_HELVETICA = (
+    # 32..126
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# Common non-ASCII punctuation in the decks: (regular, bold)
+_EXTRA = {
+    "•": (350, 350), "–": (556, 556), "—": (1000, 1000), "’": (222, 278), "‘": (222, 278),
+    "“": (333, 500), "”": (333, 500), "…": (1000, 1000), "→": (1000, 1000), "×": (584, 584),
+    " ": (278, 278),
+}
+_DEFAULT_WIDTH = 556
+_ZERO_WIDTH = {"\u200b", "\u200c", "\u200d", "\ufe0e", "\ufe0f"}
+_WIDE_WIDTH = 1000  # emoji and other symbols outside the Basic Multilingual Plane
+
+# Average advance of each family relative to Helvetica
+FAMILY_SCALE = {
+    "calibri": 0.89,
+    "calibri light": 0.87,
+    "helvetica": 1.0,
+    "arial": 1.0,
+}
+
+LINE_SPACING = 1.2
+
+
+def _char_width(ch, bold):
+    code = ord(ch)
+    if 32 <= code <= 126:
+        return (_HELVETICA_BOLD if bold else _HELVETICA)[code - 32]
+    if ch in _EXTRA:
+        return _EXTRA[ch][1 if bold else 0]
+    if code > 0xFFFF or 0x2600 <= code <= 0x27BF:
+        return _WIDE_WIDTH
+    return _DEFAULT_WIDTH
+
+
+@lru_cache(maxsize=65536)
+def text_width(text, size, bold=False, font="Calibri"):
+    """Rendered width of `text` in points at `size` pt"""
+    units = 0
+    joined = False
+    for ch in text:
+        if ch in _ZERO_WIDTH:
+            # A zero-width joiner fuses the next emoji into the previous glyph
+            joined = joined or ch == "\u200d"
+            continue
+        if joined:
+            joined = False
+            continue
+        units += _char_width(ch, bold)
+    scale = FAMILY_SCALE.get((font or "calibri").lower(), 1.0)
+    return units * size * scale / 1000
+
+
+def line_height(size):
+    """Single line advance in points for a font size in points"""
+    return size * LINE_SPACING
+
+
+@lru_cache(maxsize=16384)
+def wrap_text(text, max_width, size, bold=False, font="Calibri"):
+    """Greedy word wrap into a tuple of lines no wider than `max_width` points
+
+    A `max_width` of None disables wrapping (only explicit newlines break).
+    Words longer than a line are broken by character.
+    """
+    lines = []
+    for chunk in text.split("\n"):
+        if max_width is None or text_width(chunk, size, bold, font) <= max_width:
+            lines.append(chunk)
+            continue
+        line = ""
+        for word in chunk.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if text_width(candidate, size, bold, font) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            while text_width(word, size, bold, font) > max_width and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and text_width(word[:cut], size, bold, font) > max_width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return tuple(lines)
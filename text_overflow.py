@@ -0,0 +1,237 @@
+"""
+Text Overflow Check
+Measure every text frame against its box before a deck is saved
+
+    python deckgen.py render --theme creative --overflow warn
+    python deckgen.py batch --theme all --overflow fail
+
+Text is laid out with the cached text_metrics widths and no font files.
+The check reads each text frame's XML directly, resolving only what the
+measurement needs (size, weight, font, margins and spacing) rather than
+building a full render plan, so it adds a few milliseconds per deck.
+Overflow is how far the laid-out text runs past the box's insets: down for
+wrapped text, right for text that does not wrap. A box set to resize to
+fit its text (spAutoFit) grows downward instead, so only its width counts.
+"""
+import sys
+from collections import namedtuple
+
+from lxml import etree
+from pptx.oxml.ns import nsmap
+
+from render_plan import DEFAULT_INSETS, EMU_PER_PT, THEME_FONTS, _T, _TRUE, _group_transform, text_block_height
+from text_metrics import line_height, text_width, wrap_text
+
+TOLERANCE_PT = 4.0  # about a fifth of a line: metric rounding, not clipping
+
+Overflow = namedtuple("Overflow", "slide shape text width_in height_in")
+
+_BASE_PROPS = {"size": 18.0, "bold": False, "font": "Calibri", "margin_left": 0,
+               "space_before": 0.0, "space_after": 0.0}
+_INSET_ATTRS = ("lIns", "tIns", "rIns", "bIns")
+# Text bodies of shapes on a slide (through groups) holding a run or line break; python-pptx gives
+# every autoshape an empty one
+_TEXT_BODIES = etree.XPath("(p:sp | .//p:grpSp/p:sp)/p:txBody[.//a:t or .//a:br]", namespaces=nsmap("a", "p"))
+
+
+class TextOverflowError(ValueError):
+    """Raised by the save pipeline when overflow checking is set to 'fail'"""
+
+    def __init__(self, overflows):
+        self.overflows = overflows
+        super().__init__(f"{len(overflows)} text frames overflow their boxes:\n{format_overflows(overflows)}")
+
+
+def shape_overflow(shape):
+    """(horizontal, vertical) overflow of a plan shape's text in points (0 when it fits)
+
+    Vertical overflow is always 0 for an auto-fit box, which PowerPoint grows to its text's height.
+    """
+    left, top, right, bottom = (v / EMU_PER_PT for v in shape.text.insets)
+    widest = max(text_width(line, p.size, p.bold, p.font) + p.margin_left / EMU_PER_PT
+                 for p in shape.text.paragraphs for line in p.lines)
+    horizontal = widest + left + right - shape.w / EMU_PER_PT
+    if shape.text.auto_fit:
+        return max(horizontal, 0.0), 0.0
+    vertical = text_block_height(shape.text) + top + bottom - shape.h / EMU_PER_PT
+    return max(horizontal, 0.0), max(vertical, 0.0)
+
+
+def find_overflows(plans, tolerance_pt=TOLERANCE_PT):
+    """Text frames in the given slide plans whose text overruns the box"""
+    overflows = []
+    for plan in plans:
+        for shape in plan.shapes:
+            if shape.text is None:
+                continue
+            horizontal, vertical = shape_overflow(shape)
+            if horizontal > tolerance_pt or vertical > tolerance_pt:
+                overflows.append(Overflow(plan.index + 1, shape.name, shape.text.paragraphs[0].text,
+                                          round(horizontal / 72, 2), round(vertical / 72, 2)))
+    return overflows
+
+
+def _run_props(rPr, props):
+    """Overlay the size, weight and font of an rPr/defRPr/endParaRPr element onto `props`"""
+    sz = rPr.get("sz")
+    if sz is not None:
+        props["size"] = int(sz) / 100
+    b = rPr.get("b")
+    if b is not None:
+        props["bold"] = b in _TRUE
+    for child in rPr:
+        if child.tag == _T["a:latin"] and child.get("typeface"):
+            props["font"] = THEME_FONTS.get(child.get("typeface"), child.get("typeface"))
+    return props
+
+
+def _paragraph_props(pPr, props):
+    """Overlay the measured properties of a pPr/lvlNpPr element onto `props`"""
+    marL = pPr.get("marL")
+    if marL is not None:
+        props["margin_left"] = int(marL)
+    for child in pPr:
+        tag = child.tag
+        if tag == _T["a:defRPr"]:
+            _run_props(child, props)
+        elif tag in (_T["a:spcBef"], _T["a:spcAft"]) and len(child) and child[0].tag == _T["a:spcPts"]:
+            props["space_before" if tag == _T["a:spcBef"] else "space_after"] = int(child[0].get("val")) / 100
+    return props
+
+
+def _frame_overflow(txBody, width, height):
+    """(horizontal, vertical, first paragraph's text) for one p:txBody in a box of width x height EMU
+
+    The same measurement as shape_overflow on a plan shape; text is None when the frame is empty.
+    """
+    bodyPr = lstStyle = None
+    paragraphs = []
+    for child in txBody:
+        tag = child.tag
+        if tag == _T["a:p"]:
+            paragraphs.append(child)
+        elif tag == _T["a:bodyPr"]:
+            bodyPr = child
+        elif tag == _T["a:lstStyle"]:
+            lstStyle = child
+    if bodyPr is None:
+        insets, wrap, auto_fit = DEFAULT_INSETS, True, False
+    else:
+        insets = tuple(int(bodyPr.get(attr, default)) for attr, default in zip(_INSET_ATTRS, DEFAULT_INSETS))
+        wrap = bodyPr.get("wrap") != "none"
+        auto_fit = any(child.tag == _T["a:spAutoFit"] for child in bodyPr)
+
+    levels = {}  # list-style level -> inherited props
+    widest = block = 0.0
+    texts = []
+    for n, p in enumerate(paragraphs):
+        pPr = p[0] if len(p) and p[0].tag == _T["a:pPr"] else None
+        level = int(pPr.get("lvl", 0)) if pPr is not None else 0
+        if level not in levels:
+            levels[level] = dict(_BASE_PROPS)
+            if lstStyle is not None:
+                for lvl_pPr in lstStyle.iterchildren(_T[f"a:lvl{level + 1}pPr"]):
+                    _paragraph_props(lvl_pPr, levels[level])
+        props = dict(levels[level])
+        if pPr is not None:
+            _paragraph_props(pPr, props)
+        parts = []
+        first_run = True
+        for child in p:
+            tag = child.tag
+            if tag == _T["a:r"]:
+                if first_run and child[0].tag == _T["a:rPr"]:
+                    _run_props(child[0], props)
+                first_run = False
+                t = child[-1]
+                parts.append(t.text or "" if t.tag == _T["a:t"] else "")
+            elif tag == _T["a:br"]:
+                parts.append("\n")
+            elif tag == _T["a:endParaRPr"] and first_run:
+                _run_props(child, props)
+        text = "".join(parts)
+        texts.append(text)
+
+        available = None
+        if wrap:
+            available = max((width - insets[0] - insets[2] - props["margin_left"]) / EMU_PER_PT, 1.0)
+        size, bold, font = props["size"], props["bold"], props["font"]
+        margin = props["margin_left"] / EMU_PER_PT
+        for line in wrap_text(text, available, size, bold, font) if text else ("",):
+            widest = max(widest, text_width(line, size, bold, font) + margin)
+            block += line_height(size)
+        if n:
+            block += props["space_before"]
+        if n < len(paragraphs) - 1:
+            block += props["space_after"]
+
+    if not any(texts):
+        return 0.0, 0.0, None
+    left, top, right, bottom = (v / EMU_PER_PT for v in insets)
+    horizontal = max(widest + left + right - width / EMU_PER_PT, 0.0)
+    if auto_fit:
+        return horizontal, 0.0, texts[0]
+    return horizontal, max(block + top + bottom - height / EMU_PER_PT, 0.0), texts[0]
+
+
+def _scale(container, scales):
+    """(x, y) scale from a shape tree or group's child space to slide space, memoised in `scales`"""
+    if container not in scales:
+        sx, sy = _scale(container.getparent(), scales)
+        scales[container] = _group_transform(container, (0, 0, sx, sy))[2:]
+    return scales[container]
+
+
+def _frames(slide):
+    """(sp, txBody, width, height) in EMU for every shape on the slide with text, groups flattened"""
+    spTree = slide.shapes._spTree
+    scales = {spTree: (1, 1)}
+    frames = []
+    for txBody in _TEXT_BODIES(spTree):
+        sp = txBody.getparent()
+        xfrm = sp[1][0] if len(sp[1]) else None  # p:spPr comes second
+        if xfrm is None or xfrm.tag != _T["a:xfrm"]:
+            continue
+        sx, sy = _scale(sp.getparent(), scales)
+        ext = xfrm[1]
+        frames.append((sp, txBody, round(int(ext.get("cx")) * sx), round(int(ext.get("cy")) * sy)))
+    return frames
+
+
+def deck_overflows(prs, tolerance_pt=TOLERANCE_PT):
+    """Text frames in a Presentation whose text overruns the box, measured without a render plan"""
+    overflows = []
+    for index, slide in enumerate(prs.slides):
+        for sp, txBody, width, height in _frames(slide):
+            horizontal, vertical, text = _frame_overflow(txBody, width, height)
+            if text is not None and (horizontal > tolerance_pt or vertical > tolerance_pt):
+                overflows.append(Overflow(index + 1, sp[0][0].get("name", ""), text,
+                                          round(horizontal / 72, 2), round(vertical / 72, 2)))
+    return overflows
+
+
+def format_overflows(overflows):
+    """One line per overflowing frame"""
+    lines = []
+    for o in overflows:
+        amounts = [f"{o.height_in:.2f} in too tall"] if o.height_in else []
+        amounts += [f"{o.width_in:.2f} in too wide"] if o.width_in else []
+        lines.append(f"slide {o.slide:>3}  {o.shape}: {', '.join(amounts)}  {o.text[:40]!r}")
+    return "\n".join(lines)
+
+
+def check_overflow(prs, mode="warn", tolerance_pt=TOLERANCE_PT, plans=None):
+    """Warn on stderr ('warn') or raise TextOverflowError ('fail') for overflowing text frames
+
+    `plans` are the deck's precomputed slide plans, when the caller already has them; otherwise the
+    frames are measured straight from the slide XML.
+    """
+    if mode not in ("warn", "fail"):
+        raise ValueError(f"Unknown overflow mode {mode!r}; expected 'warn' or 'fail'")
+    overflows = find_overflows(plans, tolerance_pt) if plans is not None else deck_overflows(prs, tolerance_pt)
+    if overflows and mode == "fail":
+        raise TextOverflowError(overflows)
+    if overflows:
+        print(f"warning: {len(overflows)} text frames overflow their boxes:\n{format_overflows(overflows)}",
+              file=sys.stderr)
+    return overflows
@@ -0,0 +1,193 @@
+"""
+Z-Order and Grouping
+Declare stacking order and group membership while drawing; the shape tree is rebuilt once
+
+    layers = Layers(slide)
+    card = add_card(slide, ...)
+    shadow = slide.shapes.add_shape(...)
+    layers.behind(shadow, card)
+    badge = layers.group([circle, number], "Badge")
+    layers.apply()
+
+python-pptx has no z-order API: moving a shape means removing its element
+and inserting it again by index, and each insert walks the shape tree, so
+layering n shapes that way costs O(n^2). Layers only records the requests.
+apply() works out the final order in one pass over the tree and moves
+every child to the end in that order, which costs O(1) per shape.
+
+Requests are relative to the order shapes were drawn in; the last request
+for a shape wins, and shapes placed behind (or in front of) the same shape
+stack outward in call order. A group takes the place of its topmost member,
+as PowerPoint's Group command does, and keeps its members' relative order.
+A shape belongs to at most one group, and members of one group cannot be
+placed behind or in front of each other; both raise ValueError.
+"""
+from collections import defaultdict
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.shapes.group import GroupShape
+
+import shape_ids
+
+_GROUP_XML = (
+    f"<p:grpSp {nsdecls('a', 'p')}><p:nvGrpSpPr><p:cNvPr id=\"0\" name=\"\"/><p:cNvGrpSpPr/><p:nvPr/>"
+    "</p:nvGrpSpPr><p:grpSpPr><a:xfrm><a:off x=\"0\" y=\"0\"/><a:ext cx=\"0\" cy=\"0\"/>"
+    "<a:chOff x=\"0\" y=\"0\"/><a:chExt cx=\"0\" cy=\"0\"/></a:xfrm></p:grpSpPr></p:grpSp>"
+)
+_EXT_LST = qn("p:extLst")
+
+
+def _element(shape):
+    return getattr(shape, "_element", shape)
+
+
+def _name(element):
+    return element[0][0].get("name")
+
+
+def new_group(members, name):
+    """Detached p:grpSp framing `members` (shape elements) with child space equal to its parent's"""
+    group = parse_xml(_GROUP_XML)
+    group[0][0].set("name", name)
+    left = min(m.x for m in members)
+    top = min(m.y for m in members)
+    width = max(m.x + m.cx for m in members) - left
+    height = max(m.y + m.cy for m in members) - top
+    off, ext, ch_off, ch_ext = group[1][0]
+    for point in (off, ch_off):
+        point.set("x", str(left))
+        point.set("y", str(top))
+    for size in (ext, ch_ext):
+        size.set("cx", str(width))
+        size.set("cy", str(height))
+    return group
+
+
+class Layers:
+    """Pending z-order and grouping requests for one shape tree (a slide's or a group's shapes)
+
+    The placement methods return the Layers, so requests can be chained.
+    """
+
+    def __init__(self, slide_or_shapes):
+        self.shapes = getattr(slide_or_shapes, "shapes", slide_or_shapes)
+        self._spTree = self.shapes._spTree
+        self._placements = {}  # element -> ("back" | "front" | "below" | "above", anchor element)
+        self._groups = []  # (group element, member elements)
+        self._group_of = {}  # member element -> group element
+
+    def _place(self, shape, how, anchor=None):
+        element = _element(shape)
+        anchor = anchor if anchor is None else _element(anchor)
+        group = self._group_of.get(element)
+        if group is not None and self._group_of.get(anchor) is group:
+            raise ValueError(f"cannot place {_name(element)!r} relative to {_name(anchor)!r}: "
+                             f"both are in group {_name(group)!r}")
+        self._placements[element] = (how, anchor)
+        return self
+
+    def to_back(self, shape):
+        return self._place(shape, "back")
+
+    def to_front(self, shape):
+        return self._place(shape, "front")
+
+    def behind(self, shape, other):
+        """Draw `shape` directly behind `other`"""
+        return self._place(shape, "below", other)
+
+    def in_front(self, shape, other):
+        """Draw `shape` directly in front of `other`"""
+        return self._place(shape, "above", other)
+
+    def group(self, shapes, name="Group"):
+        """Group `shapes` under one p:grpSp when applied; returns the GroupShape (its ID is set by apply())"""
+        members = [_element(shape) for shape in shapes]
+        if not members:
+            raise ValueError("cannot group an empty list of shapes")
+        member_set = set(members)
+        if len(member_set) != len(members):
+            raise ValueError(f"group {name!r} lists the same shape twice")
+        for member in members:
+            if member in self._group_of:
+                raise ValueError(f"{_name(member)!r} is already in group {_name(self._group_of[member])!r}")
+            anchor = self._placements.get(member, (None, None))[1]
+            if anchor in member_set:
+                raise ValueError(f"cannot group {_name(member)!r} with {_name(anchor)!r}: "
+                                 "it is placed relative to it")
+        group = new_group(members, name)
+        self._groups.append((group, members))
+        self._group_of.update(dict.fromkeys(members, group))
+        return GroupShape(group, self.shapes)
+
+    def _order(self, children):
+        back, front = [], []
+        below, above = defaultdict(list), defaultdict(list)
+        for element, (how, anchor) in self._placements.items():
+            if how == "back":
+                back.append(element)
+            elif how == "front":
+                front.append(element)
+            else:
+                (below if how == "below" else above)[anchor].append(element)
+
+        order = []
+        # Depth-first: everything placed behind a shape, the shape, everything placed in front of it
+        stack = [(element, False) for element in reversed(front)]
+        stack += [(element, False) for element in reversed(children) if element not in self._placements]
+        stack += [(element, False) for element in reversed(back)]
+        while stack:
+            element, expanded = stack.pop()
+            if expanded:
+                order.append(element)
+                continue
+            stack.extend((e, False) for e in reversed(above[element]))
+            stack.append((element, True))
+            stack.extend((e, False) for e in reversed(below[element]))
+        if len(order) != len(children):
+            raise ValueError("z-order requests refer to shapes outside this shape tree or form a cycle")
+        return order
+
+    def apply(self):
+        """Rebuild the shape tree in the requested order; the requests are then cleared"""
+        spTree = self._spTree
+        tail = [child for child in spTree[2:] if child.tag == _EXT_LST]
+        children = [child for child in spTree[2:] if child.tag != _EXT_LST]
+        order = self._order(children)
+
+        grouped = {}
+        present = set(children)
+        for group, members in self._groups:
+            for member in members:
+                if member not in present:
+                    raise ValueError("cannot group a shape outside this shape tree")
+                grouped[member] = group
+        if grouped:
+            topmost = {}
+            for i, element in enumerate(order):
+                if element in grouped:
+                    topmost[grouped[element]] = i
+            slots = {i: group for group, i in topmost.items()}
+            top_level = []
+            for i, element in enumerate(order):
+                group = grouped.get(element)
+                if group is not None:
+                    group.append(element)
+                if i in slots:
+                    top_level.append(slots[i])
+                elif group is None:
+                    top_level.append(element)
+            order = top_level
+
+        # Appending an element that is already a child moves it, so this leaves exactly `order` after the header
+        spTree.extend(order + tail)
+        # Number groups only once they are in the tree, so no other allocation can miss them
+        if self._groups:
+            first = shape_ids.reserve_shape_ids(spTree, len(self._groups))
+            for i, (group, _) in enumerate(self._groups):
+                group[0][0].set("id", str(first + i))
+        self._placements.clear()
+        self._groups.clear()
+        self._group_of.clear()
+        return self